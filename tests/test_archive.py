@@ -0,0 +1,44 @@
+"""
+Tests for the SQLite download archive.
+"""
+
+import yt_dlp
+
+from yt_dlp_gui.archive import DownloadArchive
+
+
+class TestDownloadArchive:
+    """Test the set-like archive."""
+
+    def test_membership_and_persistence(self, tmp_path):
+        path = str(tmp_path / 'archive.db')
+        archive = DownloadArchive(path)
+        assert 'youtube abc' not in archive
+        assert archive  # an empty archive must still be consulted by yt-dlp
+
+        archive.add('youtube abc')
+        archive.update(['youtube def', 'vimeo 123', 'youtube abc'])
+        archive.close()
+
+        reopened = DownloadArchive(path)
+        assert 'youtube abc' in reopened
+        assert 'vimeo 123' in reopened
+        assert len(reopened) == 3
+
+    def test_known_id_is_skipped_before_extraction(self, tmp_path):
+        archive = DownloadArchive(str(tmp_path / 'archive.db'))
+        archive.add('youtube BaW_jenozKc')
+
+        messages = []
+
+        class Logger:
+            def debug(self, msg):
+                messages.append(msg)
+
+            warning = error = info = debug
+
+        with yt_dlp.YoutubeDL({'download_archive': archive, 'logger': Logger()}) as ydl:
+            ydl.download(['https://www.youtube.com/watch?v=BaW_jenozKc'])
+
+        assert any('already been recorded in the archive' in msg for msg in messages)
+        assert not any('Downloading webpage' in msg for msg in messages)
@@ -0,0 +1,52 @@
+"""
+Tests for the shared bandwidth scheduler.
+"""
+
+from yt_dlp_gui.bandwidth import BandwidthScheduler, JobThrottle
+from yt_dlp_gui.logic import parse_rate
+
+
+class TestBandwidthScheduler:
+    """Test splitting of the global budget."""
+
+    def test_shares_follow_weights_and_rebalance(self):
+        scheduler = BandwidthScheduler(budget=900)
+        scheduler.activate('a', weight=1.0)
+        assert scheduler.share('a') == 900
+
+        scheduler.activate('b', weight=2.0)
+        assert scheduler.share('a') == 300
+        assert scheduler.share('b') == 600
+
+        scheduler.deactivate('b')
+        assert scheduler.share('a') == 900
+
+    def test_unlimited_budget_never_sleeps(self):
+        scheduler = BandwidthScheduler()
+        scheduler.activate('a')
+        assert scheduler.share('a') is None
+        assert scheduler.consume('a', 10 ** 9) == 0.0
+
+    def test_consume_sleeps_off_debt(self):
+        scheduler = BandwidthScheduler(budget=10 ** 6)
+        scheduler.activate('a')
+        delay = scheduler.consume('a', 50_000)
+        assert 0.04 <= delay <= 0.06
+
+    def test_throttle_releases_share_when_file_finishes(self):
+        scheduler = BandwidthScheduler(budget=10 ** 9)
+        throttle = JobThrottle(scheduler, 'job')
+        throttle.progress_hook({'status': 'downloading', 'filename': 'f', 'downloaded_bytes': 10})
+        assert scheduler.share('job') == 10 ** 9
+        throttle.progress_hook({'status': 'finished', 'filename': 'f'})
+        assert scheduler.share('job') is None
+
+
+class TestParseRate:
+    """Test rate string parsing."""
+
+    def test_parse_rate(self):
+        assert parse_rate('5M') == 5 * 1024 * 1024
+        assert parse_rate('500K') == 500 * 1024
+        assert parse_rate('') is None
+        assert parse_rate('fast') is None
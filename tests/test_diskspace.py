@@ -0,0 +1,78 @@
+"""
+Tests for disk space admission control.
+"""
+
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from yt_dlp_gui.diskspace import DiskAdmission, DiskBudget, space_needs
+
+MB = 1024 * 1024
+
+
+def wait_for(predicate, timeout=5.0):
+    deadline = time.time() + timeout
+    while not predicate():
+        assert time.time() < deadline, 'condition not reached'
+        time.sleep(0.01)
+
+
+def test_space_needs(tmp_path):
+    out, stage = str(tmp_path / 'out'), str(tmp_path / 'stage')
+    merged = {'requested_formats': [{'filesize': 300}, {'filesize_approx': 100}]}
+    assert space_needs(merged, out) == {out: 800}
+    assert space_needs(merged, out, stage) == {stage: 800, out: 400}
+    assert space_needs({'filesize_approx': 50}, out) == {out: 50}
+    assert space_needs({'requested_formats': [{'filesize': 300}, {}]}, out) == {}
+
+
+def test_job_waits_for_reservation_release(tmp_path):
+    budget = DiskBudget(margin=0, usage=lambda path: SimpleNamespace(free=100 * MB), poll_interval=0.05)
+    budget.reserve('a', {str(tmp_path): 60 * MB})
+    logs = []
+    admitted = threading.Event()
+
+    def reserve_b():
+        budget.reserve('b', {str(tmp_path / 'sub'): 60 * MB}, logs.append)
+        admitted.set()
+
+    threading.Thread(target=reserve_b, daemon=True).start()
+    wait_for(lambda: logs)
+    assert not admitted.is_set()
+    assert logs[0].startswith('[disk] Waiting for 60 MiB free')
+
+    budget.release('a')
+    assert admitted.wait(5)
+    assert logs[-1] == '[disk] Enough free space, resuming'
+
+
+def test_job_larger_than_free_space_fails(tmp_path):
+    budget = DiskBudget(margin=10 * MB, usage=lambda path: SimpleNamespace(free=100 * MB))
+    with pytest.raises(OSError, match='Not enough disk space'):
+        budget.reserve('a', {str(tmp_path): 95 * MB})
+    # The staging folder and output directory share a filesystem: the larger need counts once
+    budget.reserve('a', {str(tmp_path / 'stage'): 80 * MB, str(tmp_path): 40 * MB})
+
+
+def test_admission_reserves_before_download(tmp_path):
+    calls = []
+
+    class FakeYDL:
+        def pre_process(self, ie_info, key='pre_process', files_to_move=None):
+            calls.append(key)
+            return ie_info, files_to_move
+
+    budget = DiskBudget(margin=0, usage=lambda path: SimpleNamespace(free=10 * MB))
+    ydl = FakeYDL()
+    admission = DiskAdmission(budget, 'job', ydl, str(tmp_path))
+    ydl.pre_process({'filesize': 20 * MB}, 'video')
+    with pytest.raises(OSError):
+        ydl.pre_process({'filesize': 20 * MB}, 'before_dl')
+    assert ydl.pre_process({'filesize': MB}, 'before_dl') == ({'filesize': MB}, None)
+    assert calls == ['video', 'before_dl']
+
+    admission.uninstall()
+    assert 'pre_process' not in ydl.__dict__
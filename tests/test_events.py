@@ -0,0 +1,59 @@
+"""
+Tests for the job event channel.
+"""
+
+import threading
+
+from yt_dlp_gui.events import EventChannel
+from yt_dlp_gui.jobs import Job
+
+
+def test_progress_coalesced_per_job():
+    channel = EventChannel()
+    first, second = Job('https://x/1', {}), Job('https://x/2', {})
+    for n in range(100):
+        channel.put(first, 'progress', n)
+    channel.put(second, 'progress', 'only')
+    assert len(channel) == 2
+
+    events = channel.drain()
+    assert (first, 'progress', 99) in events
+    assert (second, 'progress', 'only') in events
+    assert len(events) == 2
+    assert channel.drain() == []
+
+
+def test_log_and_status_keep_order():
+    channel = EventChannel()
+    job = Job('https://x/1', {})
+    channel.put(job, 'log', 'a')
+    channel.put(job, 'progress', 50)
+    channel.put(job, 'status', 'finished')
+    channel.put(job, 'log', 'b')
+    assert [(e, d) for _, e, d in channel.drain()] == [
+        ('log', 'a'), ('status', 'finished'), ('log', 'b'), ('progress', 50),
+    ]
+
+
+def test_concurrent_producers():
+    channel = EventChannel()
+    jobs = [Job(f'https://x/{n}', {}) for n in range(4)]
+
+    def produce(job):
+        for n in range(500):
+            channel.put(job, 'log', n)
+            channel.put(job, 'progress', n)
+
+    threads = [threading.Thread(target=produce, args=(job,)) for job in jobs]
+    for thread in threads:
+        thread.start()
+    drained = []
+    while any(thread.is_alive() for thread in threads):
+        drained.extend(channel.drain())
+    for thread in threads:
+        thread.join()
+    drained.extend(channel.drain())
+
+    assert sum(1 for _, event, _ in drained if event == 'log') == 2000
+    for job in jobs:
+        assert [d for j, e, d in drained if j is job and e == 'progress'][-1] == 499
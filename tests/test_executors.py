@@ -0,0 +1,100 @@
+"""
+Tests for the execution backends.
+"""
+
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
+from types import SimpleNamespace
+
+import pytest
+from yt_dlp.utils import DownloadError
+
+from yt_dlp_gui.executors import ProcessRunner, _executor_processes, process_mode_warnings
+from yt_dlp_gui.jobs import Job
+
+
+class Hooks:
+    def __init__(self):
+        self.lines = []
+        self.progress = []
+
+    def log(self, message):
+        self.lines.append(message)
+
+    def progress_hook(self, d):
+        self.progress.append(d)
+
+
+class BrokenExecutor:
+    """Stands in for a pool whose worker died."""
+
+    def submit(self, *args):
+        future = Future()
+        future.set_exception(BrokenProcessPool('A child process terminated abruptly'))
+        return future
+
+    def shutdown(self, wait=True):
+        pass
+
+
+def test_process_mode_warnings():
+    hooks = SimpleNamespace(post_stage=object(), disk_budget=object())
+    warnings = process_mode_warnings(hooks, 1024.0, 4)
+    assert len(warnings) == 3 and '1/4' in warnings[2]
+    assert process_mode_warnings(SimpleNamespace(post_stage=None, disk_budget=None), None, 4) == []
+
+
+def test_relay_replays_events_and_stops_after_shutdown():
+    runner = ProcessRunner(max_workers=1)
+    hooks, drained = Hooks(), threading.Event()
+    with runner._lock:
+        runner._active['job'] = (hooks, drained)
+    for event in [('job', 'log', 'line'), ('other', 'log', 'lost'), ('job', 'progress', {'status': 'downloading'}),
+                  ('job', 'done', None)]:
+        runner._events.put(event)
+    assert drained.wait(5)
+    assert hooks.lines == ['line'] and hooks.progress == [{'status': 'downloading'}]
+
+    # A job still running keeps the relay alive; it ends once that job is gone
+    runner.shutdown()
+    time.sleep(0.2)
+    assert runner._relay.is_alive()
+    with runner._lock:
+        runner._active.clear()
+    runner._events.put(('', 'stop', None))
+    runner._relay.join(5)
+    assert not runner._relay.is_alive()
+
+
+def test_broken_pool_is_replaced():
+    runner = ProcessRunner(max_workers=1)
+    broken = runner._executor = BrokenExecutor()
+    try:
+        with pytest.raises(DownloadError, match='terminated unexpectedly'):
+            runner(Job('https://x/1', {}), Hooks())
+        assert runner._executor is not broken and not runner._active
+    finally:
+        runner.shutdown()
+    runner._relay.join(5)
+    assert not runner._relay.is_alive()
+
+
+def test_kill_terminates_only_own_workers():
+    runner = ProcessRunner(max_workers=1)
+    assert runner._executor.submit(os.getpid).result(timeout=60)
+    own = _executor_processes(runner._executor)
+    other = multiprocessing.get_context('spawn').Process(target=time.sleep, args=(30,))
+    other.start()
+    try:
+        runner.shutdown(kill=True)
+        for process in own:
+            process.join(10)
+        assert own and not any(process.is_alive() for process in own)
+        assert other.is_alive()
+    finally:
+        other.terminate()
+        other.join()
@@ -0,0 +1,46 @@
+"""
+Tests for the extra-arguments parse cache.
+"""
+
+from yt_dlp_gui.extraargs import ExtraArgsCache
+from yt_dlp_gui.logic import build_ydl_opts
+
+
+class DummyGUI:
+    def progress_hook(self, d):
+        pass
+
+    def log(self, message):
+        pass
+
+
+def test_only_non_default_options_are_kept():
+    opts, error = ExtraArgsCache().parse('-N 4 --no-mtime')
+    assert error is None
+    assert opts == {'concurrent_fragment_downloads': 4, 'updatetime': False}
+
+
+def test_parsed_once_per_string(monkeypatch):
+    cache = ExtraArgsCache()
+    calls = []
+    original = cache._parse
+    monkeypatch.setattr(cache, '_parse', lambda raw: calls.append(raw) or original(raw))
+    for _ in range(1000):
+        opts, _error = cache.parse('-N 4')
+        opts['concurrent_fragment_downloads'] = 1
+    assert calls == ['-N 4']
+    assert cache.parse(' -N 4 ')[0] == {'concurrent_fragment_downloads': 4}
+
+
+def test_error_is_reported_and_cached():
+    cache = ExtraArgsCache()
+    opts, error = cache.parse('--no-such-option')
+    assert opts == {}
+    assert error == 'no such option: --no-such-option'
+    assert len(cache) == 1
+
+
+def test_build_ydl_opts_keeps_gui_options():
+    opts = build_ydl_opts({'format_mode': 'Audio Only', 'audio_ext': 'mp3', 'extra_args': '-N 3'}, DummyGUI())
+    assert opts['concurrent_fragment_downloads'] == 3
+    assert opts['format'] == 'bestaudio/best'
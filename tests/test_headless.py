@@ -0,0 +1,55 @@
+"""
+Tests for the headless entry point.
+"""
+
+import io
+import json
+import subprocess
+import sys
+
+from yt_dlp_gui import headless
+
+
+def fake_runner(job, hooks):
+    if 'fail' in job.url:
+        raise RuntimeError('boom')
+    hooks.log(f'downloading {job.url}')
+    hooks.progress_hook({'status': 'downloading', 'downloaded_bytes': 50, 'total_bytes': 100, 'speed': 10.0})
+    hooks.progress_hook({'status': 'finished', 'downloaded_bytes': 100, 'filename': 'out.mp4'})
+
+
+def run_headless(monkeypatch, argv):
+    monkeypatch.setattr(headless, 'create_runner', lambda mode, workers: fake_runner)
+    monkeypatch.setattr(headless, 'REPORT_INTERVAL', 0.01)
+    out = io.StringIO()
+    code = headless.main(argv, out=out)
+    return code, [json.loads(line) for line in out.getvalue().splitlines()]
+
+
+def test_prints_json_lines(monkeypatch, tmp_path):
+    code, records = run_headless(monkeypatch, ['-o', str(tmp_path), 'https://x/1', 'https://x/2'])
+    assert code == 0
+    assert records[-1] == {'event': 'summary', 'finished': 2, 'failed': 0}
+    finished = [r for r in records if r['event'] == 'status' and r['status'] == 'finished']
+    assert sorted(r['url'] for r in finished) == ['https://x/1', 'https://x/2']
+    assert any(r['event'] == 'log' and r['message'] == 'downloading https://x/1' for r in records)
+
+
+def test_failure_sets_exit_code(monkeypatch, tmp_path):
+    code, records = run_headless(monkeypatch, ['-o', str(tmp_path), 'https://x/fail'])
+    assert code == 1
+    failed = [r for r in records if r['event'] == 'status' and r['status'] == 'failed']
+    assert failed[0]['error'] == 'boom'
+
+
+def test_usage_errors(monkeypatch, tmp_path):
+    assert run_headless(monkeypatch, ['-o', str(tmp_path)])[0] == 2
+    assert run_headless(monkeypatch, ['-o', str(tmp_path), '-p', 'no such profile', 'https://x/1'])[0] == 2
+
+
+def test_never_imports_tkinter():
+    code = (
+        'import sys, yt_dlp_gui, yt_dlp_gui.headless, yt_dlp_gui.main; '
+        'sys.exit("tkinter" in sys.modules)'
+    )
+    assert subprocess.run([sys.executable, '-c', code]).returncode == 0
@@ -0,0 +1,139 @@
+"""
+Tests for the extraction cache.
+"""
+
+import time
+
+from yt_dlp.utils import MaxDownloadsReached
+
+from yt_dlp_gui.infocache import InfoCache, normalize_url, signed_url_expiry
+from yt_dlp_gui.jobs import download_url
+
+
+def video(video_id, **extra):
+    return dict({
+        'id': video_id, 'extractor_key': 'Youtube',
+        'webpage_url': f'https://www.youtube.com/watch?v={video_id}', 'formats': [],
+    }, **extra)
+
+
+class FakeYDL:
+    """Counts extractions instead of touching the network."""
+
+    def __init__(self, params=None, stop=None):
+        self.params = params or {}
+        self.stop = stop
+        self.extracted = []
+        self.processed = []
+        self.screen = []
+
+    def extract_info(self, url, download=True, process=True):
+        assert not download and not process
+        self.extracted.append(url)
+        return video(url.rsplit('=', 1)[-1])
+
+    def process_ie_result(self, info, download=True):
+        self.processed.append(info['id'])
+        if self.stop is not None:
+            raise self.stop
+
+    def to_screen(self, message):
+        self.screen.append(message)
+
+
+class TestInfoCache:
+    """Test TTL, LRU and key handling."""
+
+    def test_hit_returns_independent_copy(self):
+        cache = InfoCache()
+        cache.put('https://www.youtube.com/watch?v=a', video('a'))
+        first = cache.get('https://WWW.YOUTUBE.COM/watch?v=a#t=10')
+        first['title'] = 'changed'
+        assert cache.get('youtube a') == video('a')
+
+    def test_lru_eviction(self):
+        cache = InfoCache(max_entries=2)
+        cache.put('https://x/a', video('a'))
+        cache.put('https://x/b', video('b'))
+        cache.get('https://x/a')
+        cache.put('https://x/c', video('c'))
+        assert cache.get('https://x/b') is None
+        assert cache.get('https://x/a') is not None
+        assert len(cache) == 2
+
+    def test_ttl_expiry(self):
+        cache = InfoCache(ttl=0.05)
+        cache.put('https://x/a', video('a'))
+        time.sleep(0.1)
+        assert cache.get('https://x/a') is None
+
+    def test_signed_urls_limit_lifetime(self):
+        soon = int(time.time()) + 60
+        info = video('a', formats=[{'url': f'https://cdn/x?expire={soon}&sig=1'}, {'url': 'https://cdn/y'}])
+        assert signed_url_expiry(info) == soon
+
+        cache = InfoCache()
+        cache.put('https://x/a', info)
+        # Expires within the safety margin, so it is not worth caching
+        assert cache.get('https://x/a') is None
+
+    def test_playlists_are_not_cached(self):
+        cache = InfoCache()
+        cache.put('https://x/list', {'_type': 'playlist', 'id': 'list', 'entries': []})
+        assert len(cache) == 0
+
+    def test_normalize_url(self):
+        assert normalize_url(' HTTPS://Example.COM/Path?q=1#frag ') == 'https://example.com/Path?q=1'
+
+
+class TestDownloadUrl:
+    """Test reuse of cached extractions by jobs."""
+
+    def test_second_download_reuses_extraction(self):
+        cache = InfoCache()
+        ydl = FakeYDL()
+        download_url(ydl, 'https://www.youtube.com/watch?v=a', cache)
+        download_url(ydl, 'https://www.youtube.com/watch?v=a', cache)
+
+        assert ydl.extracted == ['https://www.youtube.com/watch?v=a']
+        assert ydl.processed == ['a', 'a']
+
+    def test_other_network_options_extract_again(self):
+        cache = InfoCache()
+        url = 'https://www.youtube.com/watch?v=a'
+        download_url(FakeYDL({'proxy': 'http://proxy:8080'}), url, cache)
+        direct = FakeYDL({'source_address': '192.0.2.1'})
+        download_url(direct, url, cache)
+        assert direct.extracted == [url]
+        assert len(cache) == 2
+
+        cache.discard(url)
+        assert len(cache) == 0
+
+    def test_max_downloads_ends_cleanly(self):
+        ydl = FakeYDL(stop=MaxDownloadsReached())
+        download_url(ydl, 'https://www.youtube.com/watch?v=a', InfoCache())
+        assert ydl.screen == [f'[info] {MaxDownloadsReached.msg}']
+
+    def test_music_mode_jobs_share_extractions(self):
+        from yt_dlp_gui.logic import build_ydl_opts
+
+        class Hooks:
+            def progress_hook(self, d):
+                pass
+
+        cache = InfoCache()
+        url = 'https://www.youtube.com/watch?v=a'
+        first, later = (build_ydl_opts({'music_mode': True, 'output_dir': '.'}, Hooks()) for _ in range(2))
+        # A job started later carries a newer visitor timestamp
+        later['extractor_args']['youtube']['visitor_data'] = ['2030-01-01 12:00:00']
+        download_url(FakeYDL(first), url, cache)
+        retry = FakeYDL(later)
+        download_url(retry, url, cache)
+        assert retry.extracted == [] and retry.processed == ['a']
+
+        # A visitor_data set by the user still changes what is extracted
+        later['extractor_args']['youtube']['visitor_data'] = ['CgtVisitorId']
+        other = FakeYDL(later)
+        download_url(other, url, cache)
+        assert other.extracted == [url]
@@ -0,0 +1,207 @@
+"""
+Tests for the download job queue.
+"""
+
+import threading
+import time
+
+from yt_dlp_gui.jobs import JOB_FAILED, JOB_FINISHED, JOB_RUNNING, DownloadQueue
+
+
+def wait_idle(queue, timeout=5.0):
+    deadline = time.time() + timeout
+    while not queue.is_idle():
+        assert time.time() < deadline, 'queue did not drain'
+        time.sleep(0.01)
+
+
+class TestDownloadQueue:
+    """Test job scheduling on the worker pool."""
+
+    def test_runs_jobs_concurrently_up_to_limit(self):
+        lock = threading.Lock()
+        running = []
+        peak = []
+
+        def runner(job, hooks):
+            with lock:
+                running.append(job.id)
+                peak.append(len(running))
+            time.sleep(0.05)
+            with lock:
+                running.remove(job.id)
+
+        queue = DownloadQueue(max_workers=2, runner=runner)
+        for i in range(6):
+            queue.submit({'video_url': f'https://example.com/{i}'})
+        wait_idle(queue)
+
+        assert max(peak) == 2
+        assert queue.stats()[JOB_FINISHED] == 6
+
+    def test_job_submitted_while_another_runs_starts_at_once(self):
+        release = threading.Event()
+        started = []
+
+        def runner(job, hooks):
+            started.append(job.url)
+            release.wait(5)
+
+        queue = DownloadQueue(max_workers=3, runner=runner)
+        queue.submit({'video_url': 'https://example.com/1'})
+        deadline = time.time() + 5
+        while not started:
+            assert time.time() < deadline, 'first job did not start'
+            time.sleep(0.01)
+        queue.submit({'video_url': 'https://example.com/2'})
+        while len(started) < 2:
+            assert time.time() < deadline, 'second job stayed queued behind the first'
+            time.sleep(0.01)
+
+        assert queue.stats()[JOB_RUNNING] == 2
+        release.set()
+        wait_idle(queue)
+
+    def test_each_job_keeps_its_own_snapshot(self):
+        seen = {}
+        queue = DownloadQueue(max_workers=1, runner=lambda job, hooks: seen.update({job.url: job.ui_data['quality']}))
+
+        ui_data = {'video_url': 'https://example.com/a', 'quality': '720p'}
+        queue.submit(ui_data)
+        ui_data.update({'video_url': 'https://example.com/b', 'quality': '1080p'})
+        queue.submit(ui_data)
+        wait_idle(queue)
+
+        assert seen == {'https://example.com/a': '720p', 'https://example.com/b': '1080p'}
+
+    def test_batch_file_queues_every_url(self, tmp_path):
+        batch = tmp_path / 'urls.txt'
+        batch.write_text('https://example.com/1\n# comment\nhttps://example.com/2\n', encoding='utf-8')
+
+        queue = DownloadQueue(max_workers=1, runner=lambda job, hooks: None)
+        jobs = queue.submit({'video_url': str(batch)})
+        wait_idle(queue)
+
+        assert [job.url for job in jobs] == ['https://example.com/1', 'https://example.com/2']
+
+    def test_failed_job_reports_error(self):
+        def runner(job, hooks):
+            hooks.log('about to fail')
+            raise RuntimeError('boom')
+
+        events = []
+        queue = DownloadQueue(max_workers=1, runner=runner)
+        queue.add_listener(lambda job, event, data: events.append((event, data)))
+        job = queue.submit({'video_url': 'https://example.com/x'})[0]
+        wait_idle(queue)
+
+        assert job.status == JOB_FAILED
+        assert job.error == 'boom'
+        assert ('log', 'about to fail') in events
+        assert events[-1] == ('status', JOB_FAILED)
+
+    def test_playlist_fans_out_to_child_jobs(self):
+        def expander(ui_data, hooks):
+            if ui_data['video_url'] != 'https://example.com/list':
+                return None
+            return [{'url': f'https://example.com/v{i}', 'title': f'Video {i}'} for i in range(3)]
+
+        downloaded = []
+        queue = DownloadQueue(
+            max_workers=2, expander=expander,
+            runner=lambda job, hooks: downloaded.append((job.url, job.ui_data['playlist_items'])),
+        )
+        parent = queue.submit({
+            'video_url': 'https://example.com/list', 'playlist_parallel': True, 'playlist_items': '1-3',
+        })[0]
+        wait_idle(queue)
+
+        assert parent.status == JOB_FINISHED
+        assert sorted(downloaded) == [(f'https://example.com/v{i}', '') for i in range(3)]
+        children = [job for job in queue.jobs.values() if job.parent_id == parent.id]
+        assert sorted(job.title for job in children) == ['Video 0', 'Video 1', 'Video 2']
+
+
+class TestPlaylistEntries:
+    """Test reading entries from a flat extraction."""
+
+    def test_single_video_is_not_a_playlist(self):
+        from yt_dlp_gui.playlist import playlist_entries
+
+        assert playlist_entries({'id': 'abc', 'title': 'Video'}) is None
+
+    def test_filtered_and_urlless_entries_are_dropped(self):
+        from yt_dlp_gui.playlist import playlist_entries
+
+        info = {'_type': 'playlist', 'entries': [
+            {'url': 'https://example.com/a', 'id': 'a'},
+            None,
+            {'id': 'b'},
+            {'webpage_url': 'https://example.com/c', 'id': 'c'},
+        ]}
+        assert [e['url'] for e in playlist_entries(info)] == ['https://example.com/a', 'https://example.com/c']
+
+    def test_single_video_is_extracted_once(self, monkeypatch):
+        import yt_dlp
+
+        from yt_dlp_gui.infocache import InfoCache
+        from yt_dlp_gui.jobs import download_url
+        from yt_dlp_gui.logic import build_ydl_opts
+        from yt_dlp_gui.playlist import expand_playlist
+
+        extracted, processed = [], []
+
+        class FakeYDL:
+            def __init__(self, params):
+                self.params = params
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *args):
+                return False
+
+            def extract_info(self, url, download=True, process=True):
+                extracted.append(url)
+                return {'id': 'abc', 'extractor_key': 'Generic', 'title': 'Clip', 'webpage_url': url, 'formats': []}
+
+            def process_ie_result(self, info, download=True):
+                processed.append((info['id'], download))
+
+        monkeypatch.setattr(yt_dlp, 'YoutubeDL', FakeYDL)
+        cache = InfoCache()
+        ui_data = {'video_url': 'https://example.com/clip', 'playlist_parallel': True}
+
+        class Hooks:
+            def log(self, message):
+                pass
+
+            def progress_hook(self, d):
+                pass
+
+        assert expand_playlist(ui_data, Hooks(), cache) is None
+        # The job's own instance has the same network options as the flat extraction
+        download_url(FakeYDL(build_ydl_opts(ui_data, Hooks())), ui_data['video_url'], cache)
+        assert extracted == ['https://example.com/clip'] and processed == [('abc', True)]
+
+
+class TestProcessRunner:
+    """Test the worker process backend."""
+
+    def test_failed_job_relays_log_and_error(self, tmp_path):
+        from yt_dlp_gui.executors import ProcessRunner
+
+        runner = ProcessRunner(max_workers=1)
+        events = []
+        queue = DownloadQueue(max_workers=1, runner=runner)
+        queue.add_listener(lambda job, event, data: events.append((event, data)))
+        try:
+            # Nothing listens on the discard port, so extraction fails right away
+            job = queue.submit({'video_url': 'http://127.0.0.1:9/video.mp4', 'output_dir': str(tmp_path)})[0]
+            wait_idle(queue, timeout=60)
+        finally:
+            runner.shutdown(kill=True)
+
+        assert job.status == JOB_FAILED
+        assert job.error
+        assert any(event == 'log' and '[ERROR]' in data for event, data in events)
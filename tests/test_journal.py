@@ -0,0 +1,98 @@
+"""
+Tests for the persistent job journal.
+"""
+
+import sqlite3
+import threading
+import time
+
+from yt_dlp_gui.jobs import JOB_FINISHED, JOB_QUEUED, JOB_RUNNING, DownloadQueue, Job
+from yt_dlp_gui.journal import JobJournal
+
+from .test_jobs import wait_idle
+
+
+class TestJobJournal:
+    """Test recording and restoring jobs."""
+
+    def test_journal_uses_wal(self, tmp_path):
+        journal = JobJournal(str(tmp_path / 'jobs.db'))
+        mode = sqlite3.connect(journal.path).execute('PRAGMA journal_mode').fetchone()[0]
+        assert mode == 'wal'
+
+    def test_records_snapshot_and_progress(self, tmp_path):
+        journal = JobJournal(str(tmp_path / 'jobs.db'))
+        release = threading.Event()
+
+        def runner(job, hooks):
+            hooks.progress_hook({
+                'status': 'downloading', 'downloaded_bytes': 1024, 'total_bytes': 4096,
+                'filename': '/out/video.mp4',
+            })
+            release.wait(5)
+
+        queue = DownloadQueue(max_workers=1, runner=runner, journal=journal)
+        job = queue.submit({'video_url': 'https://example.com/a', 'quality': '720p'})[0]
+        while job.status != JOB_RUNNING or not job.downloaded_bytes:
+            time.sleep(0.01)
+
+        row = journal.unfinished()[0]
+        assert row['id'] == job.id
+        assert row['status'] == JOB_RUNNING
+        assert row['options']['quality'] == '720p'
+        assert row['bytes_done'] == 1024
+        assert row['output_path'] == '/out/video.mp4'
+
+        release.set()
+        wait_idle(queue)
+        assert journal.unfinished() == []
+
+    def test_restore_requeues_unfinished_jobs(self, tmp_path):
+        path = str(tmp_path / 'jobs.db')
+        journal = JobJournal(path)
+        running = Job('https://example.com/a', {'output_dir': '/out'})
+        running.status = JOB_RUNNING
+        queued = Job('https://example.com/b', {'output_dir': '/out'})
+        done = Job('https://example.com/c', {'output_dir': '/out'})
+        done.status = JOB_FINISHED
+        journal.record([running, queued, done])
+        journal.close()
+
+        seen = []
+        queue = DownloadQueue(
+            max_workers=1, runner=lambda job, hooks: seen.append((job.id, job.ui_data['resume'])),
+            journal=JobJournal(path),
+        )
+        restored = queue.restore()
+        wait_idle(queue)
+
+        assert [job.id for job in restored] == [running.id, queued.id]
+        assert all(job.status == JOB_QUEUED or job.done for job in restored)
+        assert seen == [(running.id, True), (queued.id, True)]
+
+    def test_playlist_parent_not_expanded_again_after_crash(self, tmp_path):
+        path = str(tmp_path / 'jobs.db')
+        journal = JobJournal(path)
+        release = threading.Event()
+
+        def expander(ui_data, hooks):
+            return [{'url': 'https://example.com/1'}, {'url': 'https://example.com/2'}]
+
+        def runner(job, hooks):
+            release.wait(5)
+
+        queue = DownloadQueue(max_workers=1, runner=runner, expander=expander, journal=journal)
+        # Crash right after the children were journaled: the parent's own final update never happens
+        queue._finish = lambda job, error: None
+        parent = queue.submit({'video_url': 'https://example.com/list', 'playlist_parallel': True})[0]
+        deadline = time.time() + 5
+        while len(queue.jobs) < 3:
+            assert time.time() < deadline
+            time.sleep(0.01)
+
+        rows = journal.unfinished()
+        assert parent.id not in [row['id'] for row in rows]
+        assert sorted(row['url'] for row in rows) == ['https://example.com/1', 'https://example.com/2']
+        assert all(row['parent_id'] == parent.id for row in rows)
+        release.set()
+        queue.shutdown()
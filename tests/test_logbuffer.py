@@ -0,0 +1,50 @@
+"""
+Tests for the ring-buffer log model.
+"""
+
+from yt_dlp_gui.logbuffer import LogBuffer
+
+
+def test_ring_buffer_keeps_latest_lines():
+    buffer = LogBuffer(max_lines=100)
+    for n in range(250):
+        buffer.append(f'line {n}')
+    lines = buffer.lines()
+    assert len(lines) == 100
+    assert lines[0] == 'line 150' and lines[-1] == 'line 249'
+
+
+def test_pending_lines_are_batched_and_bounded():
+    buffer = LogBuffer(max_lines=100)
+    buffer.append('a\nb')
+    buffer.append('c')
+    assert buffer.take_pending() == ['a', 'b', 'c']
+    assert buffer.take_pending() == []
+
+    for n in range(300):
+        buffer.append(str(n))
+    pending = buffer.take_pending()
+    assert len(pending) == 100 and pending[-1] == '299'
+
+
+def test_shrinking_cap_drops_oldest():
+    buffer = LogBuffer(max_lines=500)
+    for n in range(300):
+        buffer.append(str(n))
+    buffer.set_max_lines(100)
+    assert buffer.lines()[0] == '200'
+
+
+def test_spill_keeps_full_history(tmp_path):
+    path = tmp_path / 'gui.log'
+    buffer = LogBuffer(max_lines=100, spill_path=str(path))
+    for n in range(250):
+        buffer.append(f'line {n}')
+    buffer.take_pending()
+    written = path.read_text(encoding='utf-8').splitlines()
+    assert len(written) == 250
+    assert written[0].endswith(' line 0')
+
+    buffer.close()
+    buffer.append('not spilled')
+    assert len(path.read_text(encoding='utf-8').splitlines()) == 250
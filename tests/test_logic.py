@@ -5,7 +5,10 @@ Tests for yt-dlp GUI logic.
 import unittest
 from typing import Any, Dict
 
-from yt_dlp_gui.logic import ExecutablePicker, build_ydl_opts
+from yt_dlp_gui.logic import (
+    AudioReport, ExecutablePicker, MergeAvoidingSelector, _render_command_preview, audio_action, bind_format_selector,
+    build_ydl_opts, get_command_preview,
+)
 
 
 class DummyGUI:
@@ -41,6 +44,116 @@ class TestGUILogic(unittest.TestCase):
                 found_audio_pp = True
         self.assertTrue(found_audio_pp)
 
+    def test_build_ydl_opts_audio_best_keeps_codec(self) -> None:
+        opts = build_ydl_opts({'format_mode': 'Audio Only', 'audio_ext': 'best'}, DummyGUI())
+        self.assertEqual(opts['postprocessors'][-1], {'key': 'FFmpegExtractAudio', 'preferredcodec': 'best'})
+        opts = build_ydl_opts({'format_mode': 'Audio Only', 'audio_ext': 'm4a'}, DummyGUI())
+        self.assertEqual(opts['format'], 'bestaudio[acodec^=mp4a]/bestaudio/best')
+
+    def test_audio_action(self) -> None:
+        self.assertEqual(audio_action({'ext': 'webm', 'acodec': 'opus'}, 'best'), 'copy')
+        self.assertEqual(audio_action({'ext': 'm4a', 'acodec': 'mp4a.40.2'}, 'best'), 'keep')
+        self.assertEqual(audio_action({'ext': 'mp4', 'acodec': 'mp4a.40.2'}, 'm4a'), 'copy')
+        self.assertEqual(audio_action({'ext': 'webm', 'acodec': 'opus'}, 'opus'), 'copy')
+        self.assertEqual(audio_action({'ext': 'webm', 'acodec': 'opus'}, 'mp3'), 'transcode')
+
+        lines = []
+        gui = DummyGUI()
+        gui.log = lines.append
+        report = AudioReport(gui, 'mp3')
+        report({'status': 'started', 'postprocessor': 'ExtractAudio', 'info_dict': {'acodec': 'opus', 'title': 'T'}})
+        report({'status': 'started', 'postprocessor': 'EmbedThumbnail', 'info_dict': {}})
+        self.assertEqual(lines, ['[audio] Transcoding opus to mp3: T'])
+
+    def test_merge_avoiding_selector(self) -> None:
+        video = {'format_id': 'v', 'ext': 'mp4', 'vcodec': 'avc1', 'acodec': 'none', 'height': 1080}
+        audio = {'format_id': 'a', 'ext': 'm4a', 'vcodec': 'none', 'acodec': 'mp4a.40.2'}
+        muxed = {'format_id': 'm', 'ext': 'mp4', 'vcodec': 'avc1', 'acodec': 'mp4a.40.2', 'height': 1080}
+        selector = MergeAvoidingSelector('mp4')
+        # Formats come sorted from worst to best
+        self.assertIs(selector.pick_muxed([audio, muxed, video]), muxed)
+        self.assertIsNone(selector.pick_muxed([audio, dict(muxed, height=720), video]))
+        self.assertIsNone(selector.pick_muxed([audio, dict(muxed, ext='webm'), video]))
+        self.assertIsNone(selector.pick_muxed([audio, video]))
+
+        opts = build_ydl_opts({'format_mode': 'Video+Audio', 'video_ext': 'mp4', 'avoid_merge': True}, DummyGUI())
+        self.assertIsInstance(opts['format'], MergeAvoidingSelector)
+        self.assertNotIn('format', build_ydl_opts({'format_mode': 'Video+Audio', 'video_ext': 'mp4'}, DummyGUI()))
+
+    def test_merge_fallback_uses_the_job_instance(self) -> None:
+        import yt_dlp
+
+        video = {'format_id': 'v', 'ext': 'mp4', 'vcodec': 'avc1', 'acodec': 'none', 'height': 1080, 'url': 'v'}
+        audio = {'format_id': 'a', 'ext': 'm4a', 'vcodec': 'none', 'acodec': 'mp4a.40.2', 'url': 'a'}
+        opts = build_ydl_opts({'format_mode': 'Video+Audio', 'video_ext': 'mp4', 'avoid_merge': True}, DummyGUI())
+        opts.update({'check_formats': 'selected', 'quiet': True})
+        checked = []
+
+        def check_formats(formats):
+            for f in formats:
+                checked.append(f['format_id'])
+                yield f
+
+        with yt_dlp.YoutubeDL(opts) as ydl:
+            ydl._check_formats = check_formats
+            with self.assertRaises(RuntimeError):
+                list(ydl.format_selector({'formats': [audio, video]}))
+            bind_format_selector(ydl)
+            selected = list(ydl.format_selector({
+                'formats': [audio, video], 'has_merged_format': False, 'incomplete_formats': False,
+            }))
+        self.assertEqual([f['format_id'] for f in selected], ['v+a'])
+        self.assertEqual(selected[0]['ext'], 'mp4')
+        # The job's own format checks ran on the fallback's picks
+        self.assertEqual(checked, ['v', 'a'])
+
+    def test_cookies_file_checked_for_every_job(self) -> None:
+        import contextlib
+        import io
+        import os
+        import tempfile
+
+        with tempfile.TemporaryDirectory() as tmp:
+            cookies = os.path.join(tmp, 'cookies.txt')
+            ui_data = {'cookies_path': cookies, 'dateafter': 'not-a-date', 'format_mode': 'Video+Audio'}
+            out = io.StringIO()
+            with contextlib.redirect_stdout(out):
+                self.assertNotIn('cookiefile', build_ydl_opts(ui_data, DummyGUI()))
+                # Created after the options were compiled and cached
+                with open(cookies, 'w', encoding='utf-8') as f:
+                    f.write('# Netscape HTTP Cookie File\n')
+                self.assertEqual(build_ydl_opts(ui_data, DummyGUI())['cookiefile'], cookies)
+                os.remove(cookies)
+                self.assertNotIn('cookiefile', build_ydl_opts(ui_data, DummyGUI()))
+            # Invalid values are reported for every job, not only when first compiled
+            self.assertEqual(out.getvalue().count('Error parsing date filter'), 3)
+
+    def test_build_ydl_opts_filters(self) -> None:
+        gui = DummyGUI()
+        ui_data = {
+            'playlist_items': '1-5',
+            'dateafter': '20240101',
+            'max_filesize': '50M',
+            'match_filter': 'duration < 600',
+        }
+        opts = build_ydl_opts(ui_data, gui)
+        self.assertEqual(opts['playlist_items'], '1-5')
+        self.assertIn('20240601', opts['daterange'])
+        self.assertNotIn('20231231', opts['daterange'])
+        self.assertEqual(opts['max_filesize'], 50 * 1024 * 1024)
+        self.assertIsNone(opts['match_filter']({'duration': 300}, incomplete=False))
+        self.assertIsNotNone(opts['match_filter']({'duration': 900}, incomplete=False))
+
+    def test_command_preview_memoized(self) -> None:
+        ui_data = {'video_url': 'https://x/v', 'format_mode': 'Audio Only', 'audio_ext': 'opus', 'tags': ['a']}
+        _render_command_preview.cache_clear()
+        first = get_command_preview(ui_data)
+        self.assertIn('--audio-format opus', first)
+        self.assertEqual(get_command_preview(dict(ui_data)), first)
+        self.assertEqual(_render_command_preview.cache_info().hits, 1)
+        ui_data['audio_ext'] = 'm4a'
+        self.assertIn('--audio-format m4a', get_command_preview(ui_data))
+
     def test_executable_picker(self) -> None:
         # Just check it doesn't crash
         js = ExecutablePicker.detect_js_runtime()
@@ -0,0 +1,198 @@
+"""
+Tests for the post-processing stage.
+"""
+
+import contextlib
+import threading
+import time
+
+import pytest
+import yt_dlp
+
+from yt_dlp_gui.jobs import JOB_FAILED, JOB_FINISHED, JOB_PROCESSING, DownloadQueue, run_job
+from yt_dlp_gui.postprocess import PostHandoff, PostStage
+from yt_dlp_gui.ydlpool import YdlPool
+
+UI_DATA = {'format_mode': 'Audio Only', 'audio_ext': 'mp3', 'output_dir': '.'}
+
+
+class FakeYDL:
+    """Calls post_process for every 'downloaded' URL the way process_info does."""
+
+    gate = threading.Event()
+    fail = False
+
+    def __init__(self, params):
+        self.params = params
+        self._pps = {'post_process': ['FFmpegExtractAudio']}
+
+    def close(self):
+        pass
+
+    def fake_download(self, url):
+        info = {'id': url}
+        assert self.post_process(url, info) is info
+
+    def post_process(self, filename, info, files_to_move=None):
+        FakeYDL.gate.wait(5)
+        self.params['logger'].warning(f'transcoded {filename}')
+        if FakeYDL.fail:
+            raise RuntimeError('ffmpeg exited with code 1')
+        info['filepath'] = filename + '.mp3'
+        return info
+
+
+@pytest.fixture(autouse=True)
+def fake_ydl(monkeypatch):
+    FakeYDL.gate = threading.Event()
+    FakeYDL.fail = False
+    monkeypatch.setattr(yt_dlp, 'YoutubeDL', FakeYDL)
+    monkeypatch.setattr('yt_dlp_gui.jobs.download_url', lambda ydl, url: ydl.fake_download(url))
+
+
+def wait_for(predicate, timeout=5.0):
+    deadline = time.time() + timeout
+    while not predicate():
+        assert time.time() < deadline, 'condition not reached'
+        time.sleep(0.01)
+
+
+def test_downloads_continue_while_post_processing_runs():
+    pool = YdlPool(max_rss=None)
+    queue = DownloadQueue(max_workers=1, runner=lambda job, hooks: run_job(job, hooks, pool), post_workers=2)
+    logs = []
+    queue.add_listener(lambda job, event, data: event == 'log' and logs.append((job.url, data)))
+    jobs = [queue.submit(dict(UI_DATA, video_url=f'https://x/{i}'))[0] for i in range(3)]
+
+    # One download worker got through every job while two transcodes block
+    wait_for(lambda: all(job.status == JOB_PROCESSING for job in jobs))
+    wait_for(lambda: queue.depths()['post'] == {'active': 2, 'queued': 1})
+    assert not queue.is_idle() and pool.idle_count() == 0
+
+    FakeYDL.gate.set()
+    wait_for(queue.is_idle)
+    assert [job.status for job in jobs] == [JOB_FINISHED] * 3
+    # Each instance stayed with its job until post-processing was done
+    assert sorted(logs) == [(f'https://x/{i}', f'[WARN] transcoded https://x/{i}') for i in range(3)]
+    assert pool.idle_count() == pool.created
+
+
+def test_post_processing_error_fails_the_job():
+    FakeYDL.gate.set()
+    FakeYDL.fail = True
+    pool = YdlPool(max_rss=None)
+    queue = DownloadQueue(max_workers=1, runner=lambda job, hooks: run_job(job, hooks, pool), post_workers=1)
+    job = queue.submit(dict(UI_DATA, video_url='https://x/1'))[0]
+    wait_for(queue.is_idle)
+    assert job.status == JOB_FAILED and job.error == 'Postprocessing: ffmpeg exited with code 1'
+
+
+class PlaylistYDL(FakeYDL):
+    """Records the order of post_process calls and fails if two overlap."""
+
+    def __init__(self, params):
+        super().__init__(params)
+        self.order = []
+        self.running = 0
+
+    def post_process(self, filename, info, files_to_move=None):
+        self.running += 1
+        assert self.running == 1, 'post-processing of one job ran concurrently'
+        time.sleep(0.02)
+        self.order.append(filename)
+        self.running -= 1
+        return info
+
+
+def test_files_of_one_job_are_post_processed_in_order():
+    stage = PostStage(4)
+    ydl = PlaylistYDL({})
+    handoff = PostHandoff(stage, ydl)
+    for i in range(4):
+        ydl.post_process(f'video{i}', {'id': i})
+    depth = stage.depth()
+    assert depth['active'] + depth['queued'] <= 1
+
+    release = mock_release()
+    assert handoff.detach(release)
+    wait_for(lambda: release.closed)
+    assert ydl.order == [f'video{i}' for i in range(4)] and handoff.error is None
+
+
+class ArchiveYDL(FakeYDL):
+    """Fails post-processing of 'bad' files and records archived IDs."""
+
+    def __init__(self, params):
+        super().__init__(params)
+        self.archived = []
+
+    def post_process(self, filename, info, files_to_move=None):
+        FakeYDL.gate.wait(5)
+        if filename.startswith('bad'):
+            raise RuntimeError('ffmpeg exited with code 1')
+        return info
+
+    def record_download_archive(self, info):
+        self.archived.append(info['id'])
+
+    def _make_archive_id(self, info):
+        return f"fake {info['id']}"
+
+
+def test_failed_deferred_post_processing_is_not_archived():
+    stage = PostStage(2)
+    ydl = ArchiveYDL({})
+    handoff = PostHandoff(stage, ydl)
+    # The way process_video_result runs: the archive is written right after the handoff returns
+    for name in ('good1', 'bad2', 'good3'):
+        info = {'id': name}
+        ydl.post_process(name, info)
+        ydl.record_download_archive(info)
+    assert ydl.archived == []
+
+    release = mock_release()
+    assert handoff.detach(release)
+    FakeYDL.gate.set()
+    wait_for(lambda: release.closed)
+    assert ydl.archived == ['good1', 'good3']
+    assert handoff.error == 'Postprocessing: ffmpeg exited with code 1'
+    assert 'record_download_archive' not in ydl.__dict__
+
+
+def test_post_hooks_keep_post_processing_inline():
+    FakeYDL.gate.set()
+    ydl = ArchiveYDL({})
+    ydl._post_hooks = [print]
+    handoff = PostHandoff(PostStage(2), ydl)
+    info = {'id': 'good1'}
+    ydl.post_process('good1', info)
+    ydl.record_download_archive(info)
+    assert ydl.archived == ['good1'] and not handoff.detach(mock_release())
+
+
+def test_playlist_post_processors_keep_post_processing_inline():
+    FakeYDL.gate.set()
+    stage = PostStage(2)
+    ydl = FakeYDL({'logger': type('Logger', (), {'warning': lambda self, msg: None})()})
+    ydl._pps['playlist'] = ['FFmpegConcat']
+    handoff = PostHandoff(stage, ydl)
+    info = {'id': 1}
+    ydl.post_process('video', info)
+    # Done before the download thread moves on to the playlist post-processors
+    assert info['filepath'] == 'video.mp3'
+    assert not handoff.detach(mock_release())
+
+
+def mock_release():
+    release = contextlib.ExitStack()
+    release.closed = False
+    release.callback(lambda: setattr(release, 'closed', True))
+    return release
+
+
+def test_stage_runs_inline_after_shutdown():
+    stage = PostStage(1)
+    stage.shutdown()
+    ran = []
+    stage.submit(lambda: ran.append(threading.current_thread()))
+    assert ran == [threading.current_thread()] and stage.depth() == {'active': 0, 'queued': 0}
@@ -0,0 +1,68 @@
+"""
+Tests for the metadata prefetch.
+"""
+
+import yt_dlp
+
+from yt_dlp_gui.infocache import InfoCache, extraction_fingerprint
+from yt_dlp_gui.prefetch import estimate_size, format_summary, prefetch_info
+
+
+class FakeYDL:
+    """Returns a fixed two-format video instead of touching the network."""
+
+    extracted = []
+    params = {}
+
+    def __init__(self, params):
+        self.params = FakeYDL.params = params
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+    def extract_info(self, url, download=True, process=True):
+        assert not download and not process
+        FakeYDL.extracted.append(url)
+        return {
+            'id': 'abc', 'extractor_key': 'Generic', 'title': 'Clip', 'duration': 75, 'webpage_url': url,
+            'formats': [{'format_id': 'v', 'filesize': 3000}, {'format_id': 'a', 'filesize_approx': 1000}],
+        }
+
+    def process_ie_result(self, info, download=True):
+        return dict(info, requested_formats=info['formats'])
+
+
+def test_estimate_size():
+    assert estimate_size({'requested_formats': [{'filesize': 10}, {'filesize_approx': 5}]}) == 15
+    assert estimate_size({'filesize_approx': 7}) == 7
+    assert estimate_size({'requested_formats': [{'filesize': 10}, {}]}) is None
+
+
+def test_prefetch_fills_cache(monkeypatch):
+    monkeypatch.setattr(yt_dlp, 'YoutubeDL', FakeYDL)
+    FakeYDL.extracted = []
+    cache = InfoCache()
+    url = 'https://example.com/clip'
+
+    summary = prefetch_info({'video_url': url}, cache=cache)
+    assert summary == {
+        'title': 'Clip', 'duration': 75, 'format_count': 2, 'size': 4000, 'plan': 'Format plan: merge v+a',
+        'playlist': False,
+    }
+    assert cache.get(url, extraction_fingerprint(FakeYDL.params))['title'] == 'Clip'
+    # Jobs with other network options do not reuse the extraction
+    assert cache.get(url, extraction_fingerprint(dict(FakeYDL.params, proxy='socks5://127.0.0.1:1080'))) is None
+
+    # A second prefetch (or the download itself) reuses the cached extraction
+    prefetch_info({'video_url': url}, cache=cache)
+    assert FakeYDL.extracted == [url]
+
+
+def test_format_summary():
+    text = format_summary({'title': 'Clip', 'duration': 75, 'format_count': 2, 'size': 4096, 'playlist': False})
+    assert text.startswith('Clip')
+    assert '1:15' in text and '2 formats' in text and '4.00KiB' in text
+    assert 'Mix' in format_summary({'title': 'Mix', 'playlist': True})
@@ -0,0 +1,67 @@
+"""
+Tests for option profiles and compiled options.
+"""
+
+import pytest
+
+from yt_dlp_gui import logic
+from yt_dlp_gui.logic import build_ydl_opts
+from yt_dlp_gui.profiles import OptionProfile, ProfileStore
+
+
+class DummyGUI:
+    def progress_hook(self, d):
+        pass
+
+    def log(self, message):
+        pass
+
+
+AUDIO = {'format_mode': 'Audio Only', 'audio_ext': 'opus', 'match_filter': 'duration < 600'}
+
+
+def test_profile_is_frozen_and_hashable():
+    profile = OptionProfile('audio', dict(AUDIO, video_url='https://x/ignored'))
+    assert 'video_url' not in profile.settings
+    assert profile == OptionProfile('audio', AUDIO)
+    assert len({profile, OptionProfile('audio', AUDIO)}) == 1
+    with pytest.raises(AttributeError):
+        profile.name = 'other'
+
+
+def test_apply_overlays_profile():
+    profile = OptionProfile('audio', AUDIO)
+    data = profile.apply({'video_url': 'https://x/1', 'format_mode': 'Video+Audio', 'output_dir': '/tmp'})
+    assert data['format_mode'] == 'Audio Only'
+    assert data['video_url'] == 'https://x/1' and data['output_dir'] == '/tmp'
+    assert data['profile'] == 'audio'
+
+
+def test_store_round_trip(tmp_path):
+    path = str(tmp_path / 'profiles.json')
+    store = ProfileStore(path)
+    store.put(OptionProfile('audio', AUDIO))
+    store.put(OptionProfile('video', {'format_mode': 'Video+Audio', 'quality': '720p'}))
+    reloaded = ProfileStore(path)
+    assert reloaded.names() == ['audio', 'video']
+    assert reloaded.get('audio') == OptionProfile('audio', AUDIO)
+    reloaded.remove('video')
+    assert ProfileStore(path).names() == ['audio']
+
+
+def test_jobs_share_compiled_options(monkeypatch):
+    calls = []
+    original = logic.compile_ydl_opts
+    monkeypatch.setattr(
+        logic, 'compile_ydl_opts', lambda ui_data, warnings=None: calls.append(1) or original(ui_data, warnings),
+    )
+    logic._compile_cached.cache_clear()
+
+    profile = OptionProfile('audio', AUDIO)
+    all_opts = [build_ydl_opts(profile.apply({'video_url': f'https://x/{n}'}), DummyGUI()) for n in range(1000)]
+    assert len(calls) == 1
+
+    # Every job gets its own copy
+    all_opts[0]['postprocessors'].append({'key': 'Extra'})
+    assert len(all_opts[1]['postprocessors']) == 1
+    assert all_opts[1]['postprocessors'][0]['preferredcodec'] == 'opus'
@@ -0,0 +1,131 @@
+"""
+Tests for the local job API.
+"""
+
+import json
+import os
+import threading
+import time
+import urllib.error
+import urllib.request
+
+import pytest
+
+from yt_dlp_gui.jobs import DownloadQueue
+from yt_dlp_gui.profiles import OptionProfile, ProfileStore
+from yt_dlp_gui.server import ApiServer, load_api_token
+
+from .test_jobs import wait_idle
+
+
+TOKEN = 'test-token'
+
+
+@pytest.fixture
+def api(tmp_path):
+    release = threading.Event()
+    seen = []
+
+    def runner(job, hooks):
+        seen.append(job.ui_data)
+        release.wait(5)
+        hooks.progress_hook({'status': 'finished', 'downloaded_bytes': 10, 'filename': 'out.mp4'})
+
+    queue = DownloadQueue(2, runner=runner, expander=lambda ui_data, gui: None)
+    profiles = ProfileStore(str(tmp_path / 'profiles.json'))
+    profiles.put(OptionProfile('audio', {'format_mode': 'Audio Only'}))
+    server = ApiServer(
+        queue, lambda: {'output_dir': str(tmp_path), 'format_mode': 'Video+Audio'}, profiles, port=0, token=TOKEN,
+    )
+    server.start()
+    server.release = release
+    server.seen = seen
+    yield server
+    release.set()
+    server.stop()
+    queue.shutdown()
+
+
+def request(server, path, body=None, content_type='application/json', token=TOKEN):
+    data = None if body is None else json.dumps(body).encode()
+    req = urllib.request.Request(f'http://127.0.0.1:{server.port}{path}', data=data)
+    if token is not None:
+        req.add_header('Authorization', f'Bearer {token}')
+    if data is not None:
+        req.add_header('Content-Type', content_type)
+    try:
+        with urllib.request.urlopen(req, timeout=5) as response:
+            return response.status, json.loads(response.read())
+    except urllib.error.HTTPError as e:
+        return e.code, json.loads(e.read())
+
+
+def test_submit_and_list(api):
+    status, body = request(api, '/jobs', {'urls': ['https://x/1', 'https://x/2'], 'profile': 'audio'})
+    assert status == 201
+    ids = [job['id'] for job in body['jobs']]
+    assert len(ids) == 2
+
+    status, body = request(api, '/jobs')
+    assert status == 200 and [job['id'] for job in body['jobs']] == ids
+
+    api.release.set()
+    wait_idle(api.queue)
+    status, body = request(api, f'/jobs/{ids[0]}')
+    assert body['status'] == 'finished' and body['profile'] == 'audio'
+    assert all(ui_data['format_mode'] == 'Audio Only' for ui_data in api.seen)
+
+
+def test_rejects_bad_requests(api):
+    assert request(api, '/jobs', {'url': 'https://x/1'}, content_type='text/plain')[0] == 415
+    assert request(api, '/jobs', {'urls': []})[0] == 400
+    assert request(api, '/jobs', {'url': 'https://x/1', 'profile': 'missing'})[0] == 400
+    assert request(api, '/jobs/nope')[0] == 404
+
+
+def test_requires_token(api):
+    assert request(api, '/jobs', token=None)[0] == 401
+    assert request(api, '/jobs', {'url': 'https://x/1'}, token='wrong')[0] == 401
+    assert not api.queue.jobs
+
+
+def test_rejects_local_options_and_files(api, tmp_path):
+    batch = tmp_path / 'urls.txt'
+    batch.write_text('https://x/1\n', encoding='utf-8')
+    for options in ({'extra_args': '--exec rm'}, {'ffmpeg_path': '/tmp'}, {'output_dir': '/'}, {'cookies_path': 'c'}):
+        status, body = request(api, '/jobs', {'url': 'https://x/1', 'options': options})
+        assert status == 400 and 'not allowed' in body['error']
+    assert request(api, '/jobs', {'url': 'file:///etc/passwd'})[0] == 400
+
+    # A local path is passed on as a URL, not read as a batch file
+    status, body = request(api, '/jobs', {'url': str(batch), 'options': {'quality': '720p'}})
+    assert status == 201 and [job['url'] for job in body['jobs']] == [str(batch)]
+
+
+def test_token_file(tmp_path):
+    path = str(tmp_path / 'token')
+    token = load_api_token(path)
+    assert token and load_api_token(path) == token
+    if os.name == 'posix':
+        assert os.stat(path).st_mode & 0o777 == 0o600
+
+
+def test_event_stream(api):
+    lines = []
+
+    def read_events():
+        req = urllib.request.Request(f'http://127.0.0.1:{api.port}/events', headers={'Authorization': f'Bearer {TOKEN}'})
+        with urllib.request.urlopen(req, timeout=5) as response:
+            for line in response:
+                lines.append(json.loads(line))
+                if lines[-1]['event'] == 'status' and lines[-1]['status'] == 'finished':
+                    return
+
+    reader = threading.Thread(target=read_events)
+    reader.start()
+    while not api.queue._listeners:
+        time.sleep(0.01)
+    request(api, '/jobs', {'url': 'https://x/1'})
+    api.release.set()
+    reader.join(5)
+    assert [line['status'] for line in lines if line['event'] == 'status'] == ['queued', 'running', 'finished']
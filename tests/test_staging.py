@@ -0,0 +1,80 @@
+"""
+Tests for the staging folder.
+"""
+
+import os
+import time
+
+import yt_dlp
+
+from yt_dlp_gui.jobs import JOB_FAILED, JOB_FINISHED, DownloadQueue
+from yt_dlp_gui.logic import compile_ydl_opts
+from yt_dlp_gui.staging import StagingMove, planned_moves, staging_path
+
+
+def write(path, text='data'):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(text)
+
+
+def read(path):
+    with open(path, encoding='utf-8') as f:
+        return f.read()
+
+
+def wait_for(predicate, timeout=5.0):
+    deadline = time.time() + timeout
+    while not predicate():
+        assert time.time() < deadline, 'condition not reached'
+        time.sleep(0.01)
+
+
+def test_compile_opts_with_staging(tmp_path):
+    ui_data = {'output_dir': str(tmp_path / 'out'), 'staging_dir': str(tmp_path / 'stage'), 'year_folder': True}
+    opts = compile_ydl_opts(ui_data)
+    assert opts['outtmpl'] == os.path.join('%(upload_date>%Y)s', '%(title)s.%(ext)s')
+    assert opts['paths'] == {'home': str(tmp_path / 'out')}
+    assert 'paths' not in compile_ydl_opts({'output_dir': str(tmp_path / 'out')})
+
+
+def test_move_out_of_staging(tmp_path):
+    out, stage = str(tmp_path / 'out'), str(tmp_path / 'stage')
+    write(os.path.join(stage, '2024', 'a.mp4'), 'new')
+    write(os.path.join(stage, '2024', 'a.jpg'), 'new')
+    write(os.path.join(out, '2024', 'a.jpg'), 'old')
+    info = {
+        'filepath': os.path.join(stage, '2024', 'a.mp4'),
+        '__finaldir': os.path.join(out, '2024'),
+        '__files_to_move': {os.path.join(stage, '2024', 'a.jpg'): ''},
+    }
+    final = os.path.join(out, '2024', 'a.mp4')
+    assert planned_moves(info)[0] == final
+
+    moved = []
+    with yt_dlp.YoutubeDL({'quiet': True, 'overwrites': False, 'paths': {'home': out, 'temp': stage}}) as ydl:
+        move = StagingMove(ydl, moved.append)
+        info = ydl.post_process(info['filepath'], info, info['__files_to_move'])
+        move.uninstall()
+        assert move.pp not in ydl._pps['post_process']
+
+    assert info['filepath'] == final and moved == [final]
+    assert read(final) == 'new'
+    # Existing files are kept unless overwriting is enabled
+    assert read(os.path.join(out, '2024', 'a.jpg')) == 'old'
+
+
+def test_queue_removes_staging_folders(tmp_path):
+    out, stage = str(tmp_path / 'out'), str(tmp_path / 'stage')
+
+    def runner(job, hooks):
+        write(os.path.join(staging_path(job.ui_data, job.id), job.url + '.mp4.part'))
+        if job.url == 'bad':
+            raise RuntimeError('HTTP Error 403')
+
+    queue = DownloadQueue(max_workers=2, runner=runner)
+    good, bad = [queue.submit({'video_url': url, 'output_dir': out, 'staging_dir': stage})[0] for url in ('good', 'bad')]
+    wait_for(lambda: queue.is_idle() and good.done and bad.done)
+
+    assert good.status == JOB_FINISHED and bad.status == JOB_FAILED
+    assert os.listdir(stage) == []
@@ -0,0 +1,40 @@
+"""
+Startup regression tests: opening the window must not import yt-dlp.
+"""
+
+import subprocess
+import sys
+
+import pytest
+
+# Generous bound for slow CI machines; yt-dlp alone takes longer than this on most of them
+IMPORT_BUDGET_US = 1_500_000
+
+
+def import_times(module):
+    """Import a module in a fresh interpreter and return {module: cumulative microseconds}."""
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        capture_output=True, text=True, check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or '|' not in line:
+            continue
+        _self, cumulative, name = line[len('import time:'):].split('|')
+        if cumulative.strip().isdigit():
+            times[name.strip()] = int(cumulative)
+    return times
+
+
+def test_app_import_skips_yt_dlp():
+    pytest.importorskip('tkinter')
+    times = import_times('yt_dlp_gui.app')
+    assert 'yt_dlp_gui.app' in times
+    assert not [name for name in times if name == 'yt_dlp' or name.startswith('yt_dlp.')]
+    assert times['yt_dlp_gui.app'] < IMPORT_BUDGET_US
+
+
+def test_headless_import_skips_yt_dlp():
+    times = import_times('yt_dlp_gui.headless')
+    assert not [name for name in times if name == 'yt_dlp' or name.startswith('yt_dlp.')]
@@ -0,0 +1,35 @@
+"""
+Tests for the tab defaults backing lazily built tabs.
+"""
+
+import inspect
+import re
+from types import SimpleNamespace
+
+import pytest
+
+from yt_dlp_gui.defaults import TAB_DEFAULTS
+
+tabs = pytest.importorskip('yt_dlp_gui.tabs')
+
+TAB_CLASSES = [tabs.GeneralTab, tabs.NetworkTab, tabs.FiltersTab, tabs.PostTab, tabs.AdvancedTab]
+
+
+@pytest.mark.parametrize('tab_class', TAB_CLASSES)
+def test_defaults_cover_get_data(tab_class):
+    # An unbuilt tab reports DEFAULTS, so they must hold every key the built tab reports
+    keys = set(re.findall(r"'(\w+)': self\.", inspect.getsource(tab_class.get_data)))
+    assert keys == set(tab_class.DEFAULTS)
+
+
+def test_tab_defaults_combined():
+    combined = {}
+    for tab_class in TAB_CLASSES:
+        combined.update(tab_class.DEFAULTS)
+    assert combined == TAB_DEFAULTS
+
+
+def test_unbuilt_tab_reports_defaults():
+    page = SimpleNamespace(content=None, tab_class=tabs.PostTab)
+    data = tabs.LazyTab.get_data(page)
+    assert data == tabs.PostTab.DEFAULTS and data is not tabs.PostTab.DEFAULTS
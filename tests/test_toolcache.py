@@ -0,0 +1,83 @@
+"""
+Tests for the tool detection cache.
+"""
+
+import json
+import os
+import threading
+
+import pytest
+
+from yt_dlp_gui import toolcache
+from yt_dlp_gui.toolcache import ToolCache
+
+
+@pytest.fixture
+def probes(tmp_path, monkeypatch):
+    bin_dir = tmp_path / 'bin'
+    bin_dir.mkdir()
+    node = bin_dir / 'node'
+    node.write_text('#!/bin/sh\n')
+    node.chmod(0o755)
+    monkeypatch.setenv('PATH', str(bin_dir))
+
+    calls = []
+    monkeypatch.setattr(toolcache, 'detect_js_runtime', lambda: calls.append('js') or 'node')
+    monkeypatch.setattr(
+        toolcache, 'get_ffmpeg_info',
+        lambda path=None: calls.append(('ffmpeg', path)) or {'version': '7.0', 'ffprobe_version': None},
+    )
+    return node, calls
+
+
+def test_js_runtime_cached_until_executable_changes(tmp_path, probes):
+    node, calls = probes
+    cache = ToolCache(str(tmp_path / 'tools.json'))
+    assert cache.peek_js_runtime() == (False, None)
+    assert cache.js_runtime() == 'node'
+    assert cache.js_runtime() == 'node'
+    assert calls == ['js']
+
+    # A new cache instance reads the saved result
+    assert ToolCache(cache.path).js_runtime() == 'node'
+    assert calls == ['js']
+
+    # Replacing the executable (different size) invalidates the entry
+    node.write_text('#!/bin/sh\n# updated\n')
+    assert cache.js_runtime() == 'node'
+    assert calls == ['js', 'js']
+    assert cache.peek_js_runtime() == (True, 'node')
+
+
+def test_ffmpeg_keyed_by_location(tmp_path, probes):
+    _node, calls = probes
+    cache = ToolCache(str(tmp_path / 'tools.json'))
+    js_runtime, info = cache.detect('')
+    assert js_runtime == 'node' and info['version'] == '7.0'
+    cache.ffmpeg_info('')
+    cache.ffmpeg_info(str(tmp_path))
+    assert sorted(map(str, calls)) == sorted(map(str, ['js', ('ffmpeg', None), ('ffmpeg', str(tmp_path))]))
+    assert cache.peek_ffmpeg(str(tmp_path))['version'] == '7.0'
+    assert cache.peek_ffmpeg('/elsewhere') is None
+
+
+def test_broken_file_is_ignored(tmp_path, probes, capsys):
+    path = tmp_path / 'tools.json'
+    path.write_text('{not json')
+    cache = ToolCache(str(path))
+    assert cache.js_runtime() == 'node'
+    assert os.path.exists(path)
+    assert 'Error loading tool cache' in capsys.readouterr().out
+
+
+def test_concurrent_saves_leave_valid_json(tmp_path, probes):
+    path = tmp_path / 'tools.json'
+    cache = ToolCache(str(path))
+    cache.js_runtime()
+    threads = [threading.Thread(target=cache.save) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert json.loads(path.read_text(encoding='utf-8'))['js_runtime']['value'] == 'node'
+    assert sorted(os.listdir(tmp_path)) == ['bin', 'tools.json']
@@ -0,0 +1,50 @@
+"""
+Tests for adaptive fragment and chunk size tuning.
+"""
+
+from yt_dlp_gui.tuning import FragmentTuner, HillClimber, level_ladder, tuning_bounds
+
+
+def test_level_ladder():
+    assert level_ladder(1, 8) == [1, 2, 4, 8]
+    assert level_ladder(1, 6) == [1, 2, 4, 6]
+    assert level_ladder(4, 4) == [4]
+
+
+def test_climber_moves_up_while_faster_and_backs_off():
+    climber = HillClimber([1, 2, 4, 8])
+    climber.record(100)
+    assert climber.value == 2
+    climber.record(200)
+    assert climber.value == 4
+    # Worse than the level below: step back
+    climber.record(120)
+    assert climber.value == 2
+    # The level above was measured slower: stay
+    climber.record(200)
+    assert climber.value == 2
+
+
+def test_bounds_are_clamped():
+    assert tuning_bounds({'max_fragments': '100', 'max_chunk_size': '2M'}) == (32, 2 * 1024 * 1024)
+    assert tuning_bounds({'max_fragments': 'x', 'max_chunk_size': ''}) == (8, 10 * 1024 * 1024)
+
+
+def test_job_tuning_retunes_params_between_files():
+    tuner = FragmentTuner()
+    ui_data = {'max_fragments': 4, 'max_chunk_size': '4M'}
+    tuning = tuner.for_job('https://cdn.example/v', ui_data)
+    params = {}
+    tuning.apply(params)
+    assert params == {'concurrent_fragment_downloads': 1, 'http_chunk_size': 1024 * 1024}
+
+    tuning.progress_hook({'status': 'downloading', 'filename': 'a', 'speed': 1000, 'fragment_index': 1})
+    tuning.progress_hook({'status': 'finished', 'filename': 'a'})
+    assert params['concurrent_fragment_downloads'] == 2
+    tuning.progress_hook({'status': 'finished', 'filename': 'b', 'downloaded_bytes': 100, 'elapsed': 1})
+    assert params['http_chunk_size'] == 2 * 1024 * 1024
+
+    # The next job on the same host starts where the last one left off
+    later = {}
+    tuner.for_job('https://cdn.example/w', ui_data).apply(later)
+    assert later == params
@@ -0,0 +1,134 @@
+"""
+Tests for the warm YoutubeDL pool.
+"""
+
+import pytest
+import yt_dlp
+
+from yt_dlp_gui.jobs import Job, run_job
+from yt_dlp_gui.ydlpool import YdlPool
+
+UI_DATA = {'format_mode': 'Video+Audio', 'video_ext': 'mp4', 'quality': 'Best', 'output_dir': '.'}
+
+
+class FakeYDL:
+    """Records construction and close calls; 'downloads' by reporting through its logger and hooks."""
+
+    instances = []
+
+    def __init__(self, params):
+        self.params = params
+        self.closed = False
+        FakeYDL.instances.append(self)
+
+    def close(self):
+        self.closed = True
+
+    def fake_download(self, url):
+        self.params['logger'].warning(url)
+        for hook in self.params['progress_hooks']:
+            hook({'status': 'finished', 'downloaded_bytes': 1, 'filename': url})
+
+
+class Hooks:
+    def __init__(self):
+        self.lines = []
+        self.progress = []
+
+    def log(self, message):
+        self.lines.append(message)
+
+    def progress_hook(self, d):
+        self.progress.append(d)
+
+
+@pytest.fixture(autouse=True)
+def fake_ydl(monkeypatch):
+    FakeYDL.instances = []
+    monkeypatch.setattr(yt_dlp, 'YoutubeDL', FakeYDL)
+
+
+def borrow_and_run(pool, ui_data, url, fail=False):
+    hooks = Hooks()
+    with pool.borrow(dict(ui_data, video_url=url), hooks, [hooks.progress_hook]) as ydl:
+        ydl.fake_download(url)
+        if fail:
+            raise RuntimeError('boom')
+    return ydl, hooks
+
+
+def test_compatible_jobs_share_an_instance():
+    pool = YdlPool(max_rss=None)
+    first, hooks1 = borrow_and_run(pool, UI_DATA, 'https://x/1')
+    second, hooks2 = borrow_and_run(pool, UI_DATA, 'https://x/2')
+    assert first is second and pool.created == 1 and pool.reused == 1
+    # Output goes to the job that currently holds the instance
+    assert hooks1.lines == ['[WARN] https://x/1'] and hooks2.lines == ['[WARN] https://x/2']
+    assert [d['filename'] for d in hooks2.progress] == ['https://x/2']
+
+    third, _hooks = borrow_and_run(pool, dict(UI_DATA, quality='720p'), 'https://x/3')
+    assert third is not first and pool.created == 2 and pool.idle_count() == 2
+
+
+def test_recycled_after_failure_and_job_limit():
+    pool = YdlPool(max_jobs=2, max_rss=None)
+    failed = None
+    with pytest.raises(RuntimeError):
+        with pool.borrow(dict(UI_DATA, video_url='https://x/0'), Hooks(), []) as failed:
+            raise RuntimeError('boom')
+    assert failed.closed and pool.idle_count() == 0
+
+    first, _hooks = borrow_and_run(pool, UI_DATA, 'https://x/1')
+    borrow_and_run(pool, UI_DATA, 'https://x/2')
+    assert first.closed and pool.idle_count() == 0
+    assert borrow_and_run(pool, UI_DATA, 'https://x/3')[0] is not first
+
+
+def test_memory_threshold_and_close_all(monkeypatch):
+    pool = YdlPool(max_rss=1)
+    monkeypatch.setattr('yt_dlp_gui.ydlpool.current_rss', lambda: 2)
+    ydl, _hooks = borrow_and_run(pool, UI_DATA, 'https://x/1')
+    assert ydl.closed and pool.idle_count() == 0
+
+    pool = YdlPool(max_rss=None)
+    ydl, _hooks = borrow_and_run(pool, UI_DATA, 'https://x/1')
+    pool.close_all()
+    assert ydl.closed and pool.idle_count() == 0
+
+
+def test_music_mode_timestamp_stamped_on_reuse():
+    pool = YdlPool(max_rss=None)
+    ydl, _hooks = borrow_and_run(pool, dict(UI_DATA, music_mode=True), 'https://x/1')
+    ydl.params['extractor_args']['youtube']['visitor_data'] = ['old']
+    borrow_and_run(pool, dict(UI_DATA, music_mode=True), 'https://x/2')
+    assert ydl.params['extractor_args']['youtube']['visitor_data'] != ['old']
+
+
+def test_job_counters_reset_on_reuse():
+    pool = YdlPool(max_rss=None)
+    ydl, _hooks = borrow_and_run(pool, UI_DATA, 'https://x/1')
+    # As left by a job that downloaded three files, one of them with an error
+    ydl._num_downloads, ydl._download_retcode = 3, 1
+    again, _hooks = borrow_and_run(pool, UI_DATA, 'https://x/2')
+    assert again is ydl
+    assert (ydl._num_downloads, ydl._download_retcode) == (0, 0)
+
+
+def test_new_cookies_file_gets_a_new_instance(tmp_path):
+    pool = YdlPool(max_rss=None)
+    ui_data = dict(UI_DATA, cookies_path=str(tmp_path / 'cookies.txt'))
+    first, _hooks = borrow_and_run(pool, ui_data, 'https://x/1')
+    assert 'cookiefile' not in first.params
+    (tmp_path / 'cookies.txt').write_text('# Netscape HTTP Cookie File\n', encoding='utf-8')
+    second, _hooks = borrow_and_run(pool, ui_data, 'https://x/2')
+    assert second is not first and second.params['cookiefile'] == ui_data['cookies_path']
+
+
+def test_run_job_uses_pool(monkeypatch):
+    pool = YdlPool(max_rss=None)
+    monkeypatch.setattr('yt_dlp_gui.jobs.download_url', lambda ydl, url: ydl.fake_download(url))
+    for url in ('https://x/1', 'https://x/2'):
+        hooks = Hooks()
+        run_job(Job(url, dict(UI_DATA, video_url=url)), hooks, pool)
+        assert hooks.lines == [f'[WARN] {url}']
+    assert pool.created == 1 and pool.reused == 1
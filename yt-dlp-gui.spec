@@ -19,11 +19,33 @@ datas = locale_datas + ytdlp_datas
 hiddenimports = collect_submodules('yt_dlp') + [
     'yt_dlp_gui',
     'yt_dlp_gui.app',
+    'yt_dlp_gui.archive',
+    'yt_dlp_gui.bandwidth',
     'yt_dlp_gui.config',
+    'yt_dlp_gui.defaults',
+    'yt_dlp_gui.diskspace',
+    'yt_dlp_gui.events',
+    'yt_dlp_gui.executors',
+    'yt_dlp_gui.extraargs',
+    'yt_dlp_gui.headless',
+    'yt_dlp_gui.jobs',
+    'yt_dlp_gui.journal',
+    'yt_dlp_gui.lazy',
+    'yt_dlp_gui.logbuffer',
     'yt_dlp_gui.logic',
+    'yt_dlp_gui.playlist',
+    'yt_dlp_gui.postprocess',
+    'yt_dlp_gui.prefetch',
+    'yt_dlp_gui.profiles',
+    'yt_dlp_gui.server',
     'yt_dlp_gui.settings',
+    'yt_dlp_gui.staging',
+    'yt_dlp_gui.toolcache',
+    'yt_dlp_gui.tuning',
     'yt_dlp_gui.widgets',
+    'yt_dlp_gui.ydlpool',
     'yt_dlp_gui.i18n',
+    'yt_dlp_gui.infocache',
     'yt_dlp_gui.logger',
     'yt_dlp_gui.tabs',
     'yt_dlp_gui.tabs.general',
@@ -31,6 +53,7 @@ hiddenimports = collect_submodules('yt_dlp') + [
     'yt_dlp_gui.tabs.filters',
     'yt_dlp_gui.tabs.post',
     'yt_dlp_gui.tabs.advanced',
+    'yt_dlp_gui.tabs.lazy',
 ]
 
 a = Analysis(
@@ -1 +1,11 @@
-from .app import YTDownloaderGUI
+from typing import Any
+
+__all__ = ['YTDownloaderGUI']
+
+
+def __getattr__(name: str) -> Any:
+    # Imported on first access so that headless use never loads tkinter
+    if name == 'YTDownloaderGUI':
+        from .app import YTDownloaderGUI
+        return YTDownloaderGUI
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
@@ -6,21 +6,41 @@ Handles UI layout, user input, and orchestrates the download process.
 from __future__ import annotations
 
 import os
-import threading
 import tkinter as tk
-from tkinter import messagebox, ttk
-from typing import Any, Dict, Optional
-
-import yt_dlp
-from yt_dlp.utils import DownloadError
+from concurrent.futures import Future, ThreadPoolExecutor
+from tkinter import messagebox, simpledialog, ttk
+from typing import Any, Callable, Dict, Optional, Set, Tuple
 
+from .bandwidth import scheduler as bandwidth_scheduler
 from .config import load_config, save_config
-from .logic import ExecutablePicker, build_ydl_opts, get_command_preview
+from .defaults import base_ui_data
+from .events import PUMP_INTERVAL_MS, EventChannel
+from .executors import ProcessRunner, create_runner
+from .jobs import DEFAULT_MAX_WORKERS, JOB_FAILED, JOB_QUEUED, DownloadQueue, Job
+from .journal import JobJournal
+from .lazy import load_yt_dlp
+from .logbuffer import DEFAULT_MAX_LINES, LogBuffer, get_log_path
+from .logic import format_plan, get_command_preview, parse_rate
+from .postprocess import default_post_workers
+from .prefetch import format_summary, prefetch_info
+from .profiles import OptionProfile, ProfileStore
+from .server import DEFAULT_PORT, ApiServer, get_api_token_path
 from .settings import SettingsWindow
-from .tabs import AdvancedTab, FiltersTab, GeneralTab, NetworkTab, PostTab
+from .tabs import AdvancedTab, FiltersTab, GeneralTab, LazyTab, NetworkTab, PostTab
+from .toolcache import tool_cache
+from .ydlpool import ydl_pool
 from .i18n import set_language, _
 from .widgets import ModernButton, PlaceholderEntry, SecondaryButton, Tooltip
 
+# Delay after the last keystroke before the URL is prefetched
+PREFETCH_DELAY_MS = 700
+
+# Delay after the last option change before the command preview is rendered
+PREVIEW_DELAY_MS = 150
+
+# Delay after startup before tools are detected, so the window paints first
+TOOL_DETECT_DELAY_MS = 100
+
 
 class YTDownloaderGUI:
     """
@@ -50,6 +70,25 @@ class YTDownloaderGUI:
         self.root.geometry(f'{window_width}x{window_height}+{center_x}+{center_y}')
         self.root.configure(bg='#2d2d2d')
 
+        # Log lines are buffered and flushed to the log view by the UI pump
+        self.log_buffer = LogBuffer(self.config.get('log_max_lines', DEFAULT_MAX_LINES))
+        self._apply_log_settings()
+
+        # Built on first open, then hidden and shown again
+        self.settings_window: Optional[SettingsWindow] = None
+
+        # Named option profiles, selectable for the next download
+        self.profiles = ProfileStore()
+
+        # Metadata prefetch of the URL being typed; one extraction at a time
+        self.prefetch_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='prefetch')
+        # Submitted to the prefetch executor, cancelled on close if still pending
+        self._prefetch_futures: Set[Future] = set()
+        self._prefetch_after: Optional[str] = None
+        self._prefetch_url = ''
+        # Format plan resolved by the last prefetch, keyed by the options it was selected with
+        self._selected_plan: Tuple[Tuple[Any, ...], Optional[str]] = ((), None)
+
         # Styles
         self._setup_styles()
 
@@ -59,10 +98,43 @@ class YTDownloaderGUI:
         self._create_tabs()
         self._create_bottom_section()
         self._create_log_area()
+        self._watch_preview_inputs()
 
-        # Initialize JS Runtime info
-        self.js_runtime: Optional[str] = ExecutablePicker.detect_js_runtime()
+        # The last detected JS runtime is shown at once and revalidated in the background
+        # once the window is shown (detection imports yt-dlp and spawns processes)
+        self._tools_detected, self.js_runtime = tool_cache.peek_js_runtime()
         self._update_js_label()
+        self._detect_after: Optional[str] = self.root.after(TOOL_DETECT_DELAY_MS, self._start_tool_detection)
+
+        # Download queue; jobs of the current batch drive the progress bar
+        workers = self.config.get('max_concurrent_downloads', DEFAULT_MAX_WORKERS)
+        try:
+            journal: Optional[JobJournal] = JobJournal()
+        except Exception as e:
+            journal = None
+            print(f'Error opening job journal: {e}')
+        self.queue = DownloadQueue(
+            workers, runner=create_runner(self.config.get('execution_mode', 'thread'), workers), journal=journal,
+            post_workers=default_post_workers(),
+        )
+        bandwidth_scheduler.set_budget(parse_rate(self.config.get('global_rate_limit')))
+        # Workers only push into the channel; the UI pump drains it at a fixed rate
+        self.events = EventChannel()
+        self.queue.add_listener(self.events.put)
+        self._pump_after = self.root.after(PUMP_INTERVAL_MS, self._pump_events)
+        self.batch_jobs: Dict[str, Job] = {}
+        self.root.protocol('WM_DELETE_WINDOW', self.on_close)
+
+        # Requeue jobs left unfinished by the previous session
+        restored = self.queue.restore()
+        if restored:
+            self.batch_jobs.update((job.id, job) for job in restored)
+            self.log(_('Resumed {} unfinished download(s)').format(len(restored)))
+
+        # Optional loopback API; its jobs use the options last rendered in the preview
+        self._api_ui_data: Dict[str, Any] = base_ui_data(self.config)
+        self.api_server: Optional[ApiServer] = None
+        self._apply_api_settings()
 
     def _setup_styles(self) -> None:
         """Initialize ttk styles."""
@@ -118,28 +190,51 @@ class YTDownloaderGUI:
         self.url_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, ipady=6)
 
         self.download_btn = ModernButton(
-            url_input_frame, text=_('START DOWNLOAD'), command=self.start_download_thread, 
+            url_input_frame, text=_('START DOWNLOAD'), command=self.enqueue_download, 
             pady=5, font=('Segoe UI', 11, 'bold'),
         )
         Tooltip(self.download_btn, _('Click to begin downloading the video or playlist'))
         self.download_btn.pack(side=tk.RIGHT, padx=(10, 0))
 
+        self.url_info_label = tk.Label(
+            url_frame, text='', bg='#2d2d2d', fg='#9cdcfe', font=('Segoe UI', 9), anchor=tk.W,
+        )
+        self.url_info_label.pack(fill=tk.X, pady=(4, 0))
+
+        # Option profile applied to the next download
+        profile_frame = tk.Frame(url_frame, bg='#2d2d2d')
+        profile_frame.pack(fill=tk.X, pady=(6, 0))
+        self.profile_label = ttk.Label(profile_frame, text=_('Profile:'))
+        self.profile_label.pack(side=tk.LEFT)
+        self.profile_var = tk.StringVar(value='')
+        self.profile_combo = ttk.Combobox(profile_frame, state='readonly', width=30)
+        self.profile_combo.bind('<<ComboboxSelected>>', self._on_profile_selected)
+        self.profile_combo.pack(side=tk.LEFT, padx=(10, 0))
+        self.save_profile_btn = SecondaryButton(profile_frame, text=_('Save as Profile'), command=self.save_profile)
+        self.save_profile_btn.pack(side=tk.LEFT, padx=(10, 0))
+        self.delete_profile_btn = SecondaryButton(profile_frame, text=_('Delete Profile'), command=self.delete_profile)
+        self.delete_profile_btn.pack(side=tk.LEFT, padx=(10, 0))
+        self._refresh_profiles()
+        self.url_var.trace_add('write', self._on_url_changed)
+
     def _create_tabs(self) -> None:
         """Create the notebook and tabs."""
         self.notebook = ttk.Notebook(self.root)
         self.notebook.pack(fill=tk.BOTH, expand=True, padx=25, pady=(0, 10))
 
-        self.tab_general = GeneralTab(self.notebook)
-        self.tab_network = NetworkTab(self.notebook)
-        self.tab_filters = FiltersTab(self.notebook)
-        self.tab_post = PostTab(self.notebook)
-        self.tab_advanced = AdvancedTab(self.notebook)
+        # Tabs are built when first selected; until then they report their defaults
+        self.tab_general = LazyTab(self.notebook, GeneralTab, on_build=self._watch_tab)
+        self.tab_network = LazyTab(self.notebook, NetworkTab, on_build=self._watch_tab)
+        self.tab_filters = LazyTab(self.notebook, FiltersTab, on_build=self._watch_tab)
+        self.tab_post = LazyTab(self.notebook, PostTab, on_build=self._watch_tab)
+        self.tab_advanced = LazyTab(self.notebook, AdvancedTab, on_build=self._watch_tab)
 
         self.notebook.add(self.tab_general, text=_('General'))
         self.notebook.add(self.tab_network, text=_('Network'))
         self.notebook.add(self.tab_filters, text=_('Filters'))
         self.notebook.add(self.tab_post, text=_('Post-Processing'))
         self.notebook.add(self.tab_advanced, text=_('Advanced'))
+        self.tab_general.build()
 
     def _create_bottom_section(self) -> None:
         """Create status, JS indicator, and progress bar."""
@@ -167,9 +262,8 @@ class YTDownloaderGUI:
             font=('Consolas', 9), state=tk.DISABLED, padx=5, pady=5
         )
         self.preview_text.pack(fill=tk.X)
-        
-        # Initial preview
-        self.root.after(100, self.update_private_preview)
+        self._preview_after: Optional[str] = None
+        self._preview_cmd = ''
 
     def _create_log_area(self) -> None:
         """Create the text area for logs."""
@@ -184,22 +278,128 @@ class YTDownloaderGUI:
 
     def _update_js_label(self) -> None:
         """Update the JS runtime label color and text."""
+        if not self._tools_detected:
+            self.js_label.config(text=_('JS Engine: {}').format(_('Detecting...')), fg='#9e9e9e')
+            return
         color = '#4caf50' if self.js_runtime else '#f44336'
         text = _('JS Engine: {}').format(self.js_runtime or _('Missing (Node.js/Deno not found)'))
         self.js_label.config(text=text, fg=color)
 
+    def _submit_prefetch(self, fn: Callable[..., Any], *args: Any) -> Future:
+        """Run a call on the prefetch thread, tracked so that on_close can cancel it."""
+        future = self.prefetch_executor.submit(fn, *args)
+        self._prefetch_futures = {f for f in self._prefetch_futures if not f.done()}
+        self._prefetch_futures.add(future)
+        return future
+
+    def _start_tool_detection(self) -> None:
+        """Revalidate the detected tools on the prefetch thread; prefetches queue behind it."""
+        self._detect_after = None
+        future = self._submit_prefetch(self._detect_tools, self.config.get('ffmpeg_path', ''))
+        future.add_done_callback(lambda f: self.root.after(0, lambda: self._on_tools_detected(f)))
+
+    @staticmethod
+    def _detect_tools(ffmpeg_path: str) -> Optional[str]:
+        """Import yt-dlp (warming it up for the first download) and revalidate the tool cache."""
+        load_yt_dlp()
+
+        # FFmpeg is checked too, so the Settings window opens with a valid result
+        js_runtime, _ffmpeg = tool_cache.detect(ffmpeg_path)
+        return js_runtime
+
+    def _on_tools_detected(self, future: 'Future[Optional[str]]') -> None:
+        """Show the detected JS runtime."""
+        try:
+            self.js_runtime = future.result()
+        except Exception as e:
+            print(f'Error detecting JS runtime: {e}')
+            self.js_runtime = None
+        self._tools_detected = True
+        self._update_js_label()
+
     def open_settings(self) -> None:
-        """Open the settings window."""
-        SettingsWindow(self.root, self.config, self.update_settings)
+        """Open the settings window, reusing the hidden one if there is one."""
+        if self.settings_window is not None and self.settings_window.winfo_exists():
+            self.settings_window.show(self.config)
+        else:
+            self.settings_window = SettingsWindow(self.root, self.config, self.update_settings)
 
     def update_settings(self, new_config: Dict[str, Any]) -> None:
         """Callback for when settings are saved."""
+        if new_config.get('language') != self.config.get('language') and self.settings_window is not None:
+            # The cached window holds texts of the old language
+            self.settings_window.destroy()
+            self.settings_window = None
         self.config = new_config
         set_language(self.config.get('language', 'en'))
         save_config(self.config)
+        self._apply_queue_settings()
+        self._apply_log_settings()
+        self._apply_api_settings()
         self.update_texts()
         messagebox.showinfo(_('⚙ Settings'), _('Settings saved successfully!'))
 
+    def _apply_queue_settings(self) -> None:
+        """Apply pool size and execution mode changes to the download queue."""
+        workers = self.config.get('max_concurrent_downloads', DEFAULT_MAX_WORKERS)
+        use_processes = self.config.get('execution_mode', 'thread') == 'process'
+        runner = self.queue.runner
+        if isinstance(runner, ProcessRunner) and use_processes:
+            runner.resize(workers)
+        elif isinstance(runner, ProcessRunner) != use_processes:
+            if isinstance(runner, ProcessRunner):
+                runner.shutdown()
+            self.queue.runner = create_runner(self.config.get('execution_mode', 'thread'), workers)
+        self.queue.set_max_workers(workers)
+        bandwidth_scheduler.set_budget(parse_rate(self.config.get('global_rate_limit')))
+
+    def _apply_log_settings(self) -> None:
+        """Apply the log line cap and log file settings."""
+        self.log_buffer.set_max_lines(self.config.get('log_max_lines', DEFAULT_MAX_LINES))
+        self.log_buffer.set_spill_path(get_log_path() if self.config.get('log_to_file') else None)
+
+    def _apply_api_settings(self) -> None:
+        """Start, stop or move the local job API."""
+        enabled = self.config.get('api_enabled', False)
+        port = self.config.get('api_port', DEFAULT_PORT)
+        if self.api_server is not None and (not enabled or self.api_server.port != port):
+            self.api_server.stop()
+            self.api_server = None
+        if enabled and self.api_server is None:
+            server = ApiServer(self.queue, lambda: dict(self._api_ui_data), self.profiles, port=port)
+            try:
+                server.start()
+            except OSError as e:
+                print(f'Error starting API server: {e}')
+                self.log(_('Could not start the local API on port {}').format(port))
+                return
+            self.api_server = server
+            self.log(_('Local API listening on http://127.0.0.1:{}').format(server.port))
+            self.log(_('API token file: {}').format(get_api_token_path()))
+
+    def on_close(self) -> None:
+        """Stop the download queue and close the window."""
+        if self.api_server is not None:
+            self.api_server.stop()
+        if self._prefetch_after is not None:
+            self.root.after_cancel(self._prefetch_after)
+        if self._detect_after is not None:
+            self.root.after_cancel(self._detect_after)
+        self.root.after_cancel(self._pump_after)
+        if self._preview_after is not None:
+            self.root.after_cancel(self._preview_after)
+        # shutdown(cancel_futures=True) needs Python 3.9
+        for future in list(self._prefetch_futures):
+            future.cancel()
+        self.prefetch_executor.shutdown(wait=False)
+        self.log_buffer.close()
+        self.queue.shutdown()
+        if isinstance(self.queue.runner, ProcessRunner):
+            self.queue.runner.shutdown(kill=True)
+        # Saves the cookie jars of warm instances
+        ydl_pool.close_all()
+        self.root.destroy()
+
     def update_texts(self) -> None:
         """Update all UI elements with the current language."""
         self.root.title(_('yt-dlp Visual Downloader'))
@@ -211,6 +411,10 @@ class YTDownloaderGUI:
         self.log_label_widget.config(text=_('Log Output:'))
         self.url_entry.placeholder = _('https://www.youtube.com/watch?v=...')
         self.url_entry._add_placeholder()
+        self.profile_label.config(text=_('Profile:'))
+        self.save_profile_btn.config(text=_('Save as Profile'))
+        self.delete_profile_btn.config(text=_('Delete Profile'))
+        self._refresh_profiles()
         self.preview_label.config(text=_('Command Preview:'))
 
         self.notebook.tab(self.tab_general, text=_('General'))
@@ -229,9 +433,20 @@ class YTDownloaderGUI:
         self.update_private_preview()
 
     def log(self, message: str) -> None:
-        """Append a message to the log area."""
+        """Append a message to the log; the view is updated on the next pump tick."""
+        self.log_buffer.append(message)
+
+    def _flush_log(self) -> None:
+        """Insert buffered log lines in one batch and trim the view to the line cap."""
+        lines = self.log_buffer.take_pending()
+        if not lines:
+            return
         self.log_text.config(state=tk.NORMAL)
-        self.log_text.insert(tk.END, message + '\n')
+        self.log_text.insert(tk.END, '\n'.join(lines) + '\n')
+        # The Text widget always ends with an empty line after the last newline
+        excess = int(self.log_text.index('end-1c').split('.')[0]) - 1 - self.log_buffer.max_lines
+        if excess > 0:
+            self.log_text.delete('1.0', f'{excess + 1}.0')
         self.log_text.see(tk.END)
         self.log_text.config(state=tk.DISABLED)
 
@@ -244,7 +459,7 @@ class YTDownloaderGUI:
         self.progress_bar['value'] = percent
 
     def get_ui_data(self) -> Dict[str, Any]:
-        """Collect all UI data for logic processing."""
+        """Collect all UI data for logic processing, with the selected profile applied."""
         path = self.config.get('output_dir', '.')
         ui_data = self.config.copy()
         ui_data.update({
@@ -252,30 +467,151 @@ class YTDownloaderGUI:
             'output_dir': path,
             'proxy_config': self.config.get('proxy_url', ''),
         })
-        ui_data.update(self.tab_general.get_data())
-        ui_data.update(self.tab_network.get_data())
-        ui_data.update(self.tab_filters.get_data())
-        ui_data.update(self.tab_post.get_data())
-        ui_data.update(self.tab_advanced.get_data())
+        ui_data.update(self._get_tab_data())
+        profile = self.profiles.get(self.profile_var.get())
+        if profile is not None:
+            ui_data = profile.apply(ui_data)
         return ui_data
 
+    def _get_tab_data(self) -> Dict[str, Any]:
+        """Collect the settings of all tabs."""
+        tab_data: Dict[str, Any] = {}
+        tab_data.update(self.tab_general.get_data())
+        tab_data.update(self.tab_network.get_data())
+        tab_data.update(self.tab_filters.get_data())
+        tab_data.update(self.tab_post.get_data())
+        tab_data.update(self.tab_advanced.get_data())
+        return tab_data
+
+    def _refresh_profiles(self) -> None:
+        """Fill the profile selector; the first entry means the current tab settings."""
+        names = self.profiles.names()
+        self.profile_combo['values'] = [_('(Current Settings)')] + names
+        if self.profile_var.get() not in names:
+            self.profile_var.set('')
+        self.profile_combo.set(self.profile_var.get() or _('(Current Settings)'))
+
+    def _on_profile_selected(self, _event: Any = None) -> None:
+        """Remember the selected profile; index 0 selects the current tab settings."""
+        self.profile_var.set('' if self.profile_combo.current() <= 0 else self.profile_combo.get())
+
+    def save_profile(self) -> None:
+        """Freeze the current tab settings into a named profile."""
+        name = simpledialog.askstring(_('Save as Profile'), _('Profile name:'), parent=self.root)
+        if not name or not name.strip():
+            return
+        profile = OptionProfile(name.strip(), self._get_tab_data())
+        error = profile.validate()
+        if error:
+            messagebox.showwarning(_('Profile Error'), error)
+            return
+        self.profiles.put(profile)
+        self.profile_var.set(profile.name)
+        self._refresh_profiles()
+
+    def delete_profile(self) -> None:
+        """Delete the selected profile."""
+        name = self.profile_var.get()
+        if name:
+            self.profiles.remove(name)
+            self._refresh_profiles()
+
+    def _watch_preview_inputs(self) -> None:
+        """Trace the URL and profile so edits mark the command preview dirty (tabs: see _watch_tab)."""
+        self.url_var.trace_add('write', self._mark_preview_dirty)
+        self.profile_var.trace_add('write', self._mark_preview_dirty)
+        self._mark_preview_dirty()
+
+    def _watch_tab(self, tab: ttk.Frame) -> None:
+        """Trace every variable of a tab as soon as it is built."""
+        for value in vars(tab).values():
+            if isinstance(value, tk.Variable):
+                value.trace_add('write', self._mark_preview_dirty)
+
+    def _mark_preview_dirty(self, *_args: Any) -> None:
+        """Schedule a preview render; bursts of changes are rendered once."""
+        if self._preview_after is None:
+            self._preview_after = self.root.after(PREVIEW_DELAY_MS, self.update_private_preview)
+
     def update_private_preview(self) -> None:
         """Internal helper to update the command preview text."""
+        if self._preview_after is not None:
+            self.root.after_cancel(self._preview_after)
+            self._preview_after = None
         ui_data = self.get_ui_data()
+        self._api_ui_data = {k: v for k, v in ui_data.items() if k != 'video_url'}
         cmd = get_command_preview(ui_data)
-        
+        plan = format_plan(ui_data)
+        if plan:
+            key, selected = self._selected_plan
+            if selected and key == self._plan_key(ui_data):
+                plan = selected
+            cmd += '\n# ' + plan
+        if cmd == self._preview_cmd:
+            return
+        self._preview_cmd = cmd
+
         self.preview_text.config(state=tk.NORMAL)
         self.preview_text.delete(1.0, tk.END)
         self.preview_text.insert(tk.END, cmd)
         self.preview_text.config(state=tk.DISABLED)
-        
-        # Schedule next update if anything changed (polling approach for simplicity with Entry widgets)
-        self.root.after(500, self.update_private_preview)
 
-    def start_download_thread(self) -> None:
-        """Start the download in a background thread."""
+    @staticmethod
+    def _plan_key(ui_data: Dict[str, Any]) -> Tuple[Any, ...]:
+        """Options a prefetched format plan depends on."""
+        return tuple(ui_data.get(k) for k in ('video_url', 'format_mode', 'video_ext', 'quality', 'avoid_merge'))
+
+    def _on_url_changed(self, *_args: Any) -> None:
+        """Restart the prefetch timer whenever the URL is edited."""
+        if self._prefetch_after is not None:
+            self.root.after_cancel(self._prefetch_after)
+        self._prefetch_after = self.root.after(PREFETCH_DELAY_MS, self._start_prefetch)
+
+    def _start_prefetch(self) -> None:
+        """Extract the current URL in the background and show what it points to."""
+        self._prefetch_after = None
         url = self.url_var.get().strip()
-        if not url:
+        if url == self._prefetch_url:
+            return
+        self._prefetch_url = url
+        if not url or url == self.url_entry.placeholder or '://' not in url:
+            self.url_info_label.config(text='')
+            return
+
+        self.url_info_label.config(text=_('Fetching video info...'))
+        ui_data = self.get_ui_data()
+        ui_data['video_url'] = url
+        key = self._plan_key(ui_data)
+        future = self._submit_prefetch(self._prefetch, url, ui_data)
+        future.add_done_callback(lambda f: self.root.after(0, lambda: self._on_prefetch_done(url, f, key)))
+
+    def _prefetch(self, url: str, ui_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Run prefetch_info unless the URL was edited while waiting for the executor."""
+        if url != self._prefetch_url:
+            return None
+        return prefetch_info(ui_data)
+
+    def _on_prefetch_done(
+        self, url: str, future: 'Future[Optional[Dict[str, Any]]]', key: Tuple[Any, ...] = (),
+    ) -> None:
+        """Show the prefetch result (and its format plan in the preview) if the URL has not changed since."""
+        if url != self._prefetch_url:
+            return
+        try:
+            summary = future.result()
+        except Exception as e:
+            print(f'Error prefetching video info: {e}')
+            self.url_info_label.config(text=_('Could not fetch video info'))
+            return
+        self.url_info_label.config(text=format_summary(summary) if summary else '')
+        if summary and summary.get('plan'):
+            self._selected_plan = (key, summary['plan'])
+            self._mark_preview_dirty()
+
+    def enqueue_download(self) -> None:
+        """Add the URL (or batch file) to the download queue."""
+        url = self.url_var.get().strip()
+        if not url or url == self.url_entry.placeholder:
             messagebox.showwarning(_('Input Error'), _('Please enter a valid URL'))
             return
 
@@ -288,60 +624,80 @@ class YTDownloaderGUI:
                 messagebox.showwarning(_('Path Error'), _('Output directory does not exist and cannot be created:\n{}').format(path))
                 return
 
-        # Prepare UI
-        self.download_btn.config(state=tk.DISABLED, text=_('DOWNLOADING...'))
-        self.progress_bar['value'] = 0
-        self.log_text.config(state=tk.NORMAL)
-        self.log_text.delete(1.0, tk.END)
-        self.log_text.config(state=tk.DISABLED)
+        # A new batch starts once the previous one has drained
+        if self.queue.is_idle():
+            self.batch_jobs = {}
+            self.progress_bar['value'] = 0
 
-        # Build data snapshot for the thread
-        ui_data = self.get_ui_data()
-
-        thread = threading.Thread(target=self.download, args=(ui_data,))
-        thread.daemon = True
-        thread.start()
-
-    def download(self, ui_data: Dict[str, Any]) -> None:
-        """The actual download process (runs in thread)."""
-        url = ui_data['video_url']
-        ydl_opts = build_ydl_opts(ui_data, self)
-        
-        # Batch support
-        if os.path.isfile(url):
-            ydl_opts['batchfile'] = url
-            urls = [] # yt-dlp will read from batchfile
-        else:
-            urls = [url]
+        # Each job keeps its own snapshot of the current settings
+        jobs = self.queue.submit(self.get_ui_data())
+        self.batch_jobs.update((job.id, job) for job in jobs)
+        self.log(_('Queued {} download(s)').format(len(jobs)))
+        self.url_var.set('')
+        self._update_queue_status()
 
+    def _pump_events(self) -> None:
+        """
+        Drain queued job events on the Tk main thread.
+        Log lines are inserted in one batch and the status is refreshed once per tick.
+        """
         try:
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                ydl.download(urls)
-            
-            self.root.after(0, lambda: self.log(_('Success')))
-            self.root.after(0, lambda: self.update_status(_('Completed')))
-            self.root.after(0, lambda: messagebox.showinfo(_('Success'), _('Download Finished!')))
-        except DownloadError as e:
-            self.root.after(0, lambda: self.log(f'{_("Error")}: {e}'))
-            self.root.after(0, lambda: self.update_status(_('Error occurred')))
-            self.root.after(0, lambda: messagebox.showerror(_('Error'), str(e)))
+            lines = []
+            changed = False
+            job_done = False
+            for job, event, data in self.events.drain():
+                changed = True
+                if event == 'log':
+                    lines.append(data)
+                elif event == 'status':
+                    # Playlist entries fanned out by the queue join the current batch
+                    if data == JOB_QUEUED:
+                        # Jobs submitted through the API after a batch has drained start a new one
+                        if all(j.done for j in self.batch_jobs.values()):
+                            self.batch_jobs = {}
+                        self.batch_jobs.setdefault(job.id, job)
+                    elif data == JOB_FAILED:
+                        lines.append(f'{_("Error")}: {job.error}')
+                    elif job.done:
+                        lines.append(_('Success'))
+                    job_done = job_done or job.done
+            if lines:
+                self.log('\n'.join(lines))
+            self._flush_log()
+            if changed:
+                self._update_queue_status()
+            if job_done and self.queue.is_idle():
+                self._on_batch_finished()
         except Exception as e:
-            self.root.after(0, lambda: self.log(f'Unexpected error: {e}'))
-            self.root.after(0, lambda: self.update_status(_('Error occurred')))
-            self.root.after(0, lambda: messagebox.showerror(_('Error'), f'An unexpected error occurred: {e}'))
-        finally:
-            self.root.after(0, lambda: self.download_btn.config(state=tk.NORMAL, text=_('START DOWNLOAD')))
-
-    def progress_hook(self, d: Dict[str, Any]) -> None:
-        """Hook called by yt-dlp to report progress."""
-        if d['status'] == 'downloading':
-            try:
-                p_str = d.get('_percent_str', '0%').replace('%', '').strip()
-                progress = float(p_str)
-                self.root.after(0, lambda: self.update_progress(progress))
-                self.root.after(0, lambda: self.update_status(f'Downloading: {d.get("_percent_str")}'))
-            except (ValueError, TypeError):
-                pass
-        elif d['status'] == 'finished':
-            self.root.after(0, lambda: self.update_progress(100))
-            self.root.after(0, lambda: self.update_status('Download Complete, processing...'))
+            print(f'Error processing job events: {e}')
+        # Rescheduled only now so a modal message box cannot re-enter the pump
+        self._pump_after = self.root.after(PUMP_INTERVAL_MS, self._pump_events)
+
+    def _update_queue_status(self) -> None:
+        """Show batch progress and queue counts."""
+        if self.batch_jobs:
+            progress = sum(job.progress for job in self.batch_jobs.values()) / len(self.batch_jobs)
+            self.update_progress(progress)
+        depths = self.queue.depths()
+        download, post = depths['download'], depths['post']
+        if download['active'] or download['queued']:
+            status = _('Downloading: {:.1f}% (active: {}, queued: {})').format(
+                self.progress_bar['value'], download['active'], download['queued'],
+            )
+        elif post['active'] or post['queued']:
+            status = _('Downloaded: {:.1f}%').format(self.progress_bar['value'])
+        else:
+            return
+        if post['active'] or post['queued']:
+            status += '  |  ' + _('Post-processing (active: {}, queued: {})').format(post['active'], post['queued'])
+        self.update_status(status)
+
+    def _on_batch_finished(self) -> None:
+        """Report the outcome once every job of the batch is done."""
+        failed = [job for job in self.batch_jobs.values() if job.status == JOB_FAILED]
+        if failed:
+            self.update_status(_('Error occurred'))
+            messagebox.showerror(_('Error'), _('{} of {} downloads failed').format(len(failed), len(self.batch_jobs)))
+        else:
+            self.update_status(_('Completed'))
+            messagebox.showinfo(_('Success'), _('Download Finished!'))
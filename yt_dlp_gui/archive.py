@@ -0,0 +1,92 @@
+"""
+Download archive for yt-dlp GUI.
+An indexed SQLite set of '<extractor> <id>' keys, passed to yt-dlp as its download_archive.
+"""
+
+from __future__ import annotations
+
+import os
+import sqlite3
+import threading
+from typing import Iterable, Optional
+
+from .config import get_config_path
+
+ARCHIVE_NAME = 'yt-dlp-gui-archive.db'
+
+_archive: Optional['DownloadArchive'] = None
+_archive_lock = threading.Lock()
+
+
+def get_archive_path() -> str:
+    """
+    Get the absolute path to the download archive database.
+
+    @return: Path in the same directory as the config file
+    """
+    return os.path.join(os.path.dirname(get_config_path()), ARCHIVE_NAME)
+
+
+class DownloadArchive:
+    """
+    Set-like download archive backed by a SQLite primary-key index.
+    yt-dlp checks it with 'in' before extracting a URL or a flat playlist
+    entry, and calls add() once a download is complete.
+    """
+
+    def __init__(self, path: Optional[str] = None) -> None:
+        """
+        Open (and create if needed) the archive database.
+
+        @param path: Database path, defaults to get_archive_path()
+        """
+        self.path = path or get_archive_path()
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        with self._lock:
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.execute('PRAGMA synchronous=NORMAL')
+            self._conn.execute('CREATE TABLE IF NOT EXISTS archive (id TEXT PRIMARY KEY) WITHOUT ROWID')
+
+    def __contains__(self, archive_id: object) -> bool:
+        with self._lock:
+            return self._conn.execute('SELECT 1 FROM archive WHERE id = ?', (archive_id,)).fetchone() is not None
+
+    def __bool__(self) -> bool:
+        # yt-dlp skips lookups on a falsy archive; counting rows would cost a full scan
+        return True
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute('SELECT COUNT(*) FROM archive').fetchone()[0]
+
+    def add(self, archive_id: str) -> None:
+        """Record a downloaded item."""
+        with self._lock:
+            self._conn.execute('INSERT OR IGNORE INTO archive (id) VALUES (?)', (archive_id,))
+
+    def update(self, archive_ids: Iterable[str]) -> None:
+        """Record many items in one transaction, e.g. from a yt-dlp archive text file."""
+        with self._lock:
+            self._conn.execute('BEGIN')
+            try:
+                self._conn.executemany('INSERT OR IGNORE INTO archive (id) VALUES (?)', ((i,) for i in archive_ids))
+            except Exception:
+                self._conn.execute('ROLLBACK')
+                raise
+            self._conn.execute('COMMIT')
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+def get_archive() -> DownloadArchive:
+    """Get the archive shared by all jobs of this process, opening it on first use."""
+    global _archive
+    with _archive_lock:
+        if _archive is None:
+            _archive = DownloadArchive()
+        return _archive
@@ -0,0 +1,149 @@
+"""
+Shared bandwidth scheduling for concurrent download jobs.
+A single budget is split between active jobs by weight and enforced with token buckets.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any, Dict, Optional
+
+# Weights for the Network tab's bandwidth priority
+PRIORITY_WEIGHTS: Dict[str, float] = {
+    'Low': 0.5,
+    'Normal': 1.0,
+    'High': 2.0,
+}
+
+# Seconds of traffic a bucket may save up while a job is idle
+BURST_SECONDS = 1.0
+
+
+class _Bucket:
+    """Token bucket of a single job."""
+
+    def __init__(self, weight: float) -> None:
+        self.weight = weight
+        self.rate = 0.0
+        self.tokens = 0.0
+        self.stamp = time.monotonic()
+
+    def refill(self, now: float) -> None:
+        if self.rate:
+            self.tokens = min(self.rate * BURST_SECONDS, self.tokens + (now - self.stamp) * self.rate)
+        self.stamp = now
+
+
+class BandwidthScheduler:
+    """
+    Process-wide download budget shared by all active jobs.
+    Each active job gets a share of the budget proportional to its weight.
+    Shares are rebalanced whenever a job becomes active or inactive.
+    """
+
+    def __init__(self, budget: Optional[float] = None) -> None:
+        """
+        Initialize the scheduler.
+
+        @param budget: Total bytes per second, or None for unlimited
+        """
+        self.budget = budget
+        self._buckets: Dict[str, _Bucket] = {}
+        self._lock = threading.Lock()
+
+    def set_budget(self, budget: Optional[float]) -> None:
+        """Change the total budget and rebalance the active jobs."""
+        with self._lock:
+            self.budget = budget or None
+            self._rebalance()
+
+    def activate(self, key: str, weight: float = 1.0) -> None:
+        """Give a job a share of the budget."""
+        with self._lock:
+            if key not in self._buckets:
+                self._buckets[key] = _Bucket(max(weight, 0.01))
+                self._rebalance()
+
+    def deactivate(self, key: str) -> None:
+        """Return a job's share to the other active jobs."""
+        with self._lock:
+            if self._buckets.pop(key, None) is not None:
+                self._rebalance()
+
+    def share(self, key: str) -> Optional[float]:
+        """Current rate of a job in bytes per second, None when unlimited."""
+        with self._lock:
+            bucket = self._buckets.get(key)
+            return bucket.rate if bucket and bucket.rate else None
+
+    def consume(self, key: str, nbytes: int) -> float:
+        """
+        Charge downloaded bytes to a job and sleep until its bucket is out of debt.
+
+        @param key: Job key
+        @param nbytes: Bytes downloaded since the last call
+        @return: Seconds slept
+        """
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None or not bucket.rate:
+                return 0.0
+            now = time.monotonic()
+            bucket.refill(now)
+            bucket.tokens -= nbytes
+            delay = -bucket.tokens / bucket.rate if bucket.tokens < 0 else 0.0
+        if delay:
+            time.sleep(delay)
+        return delay
+
+    def _rebalance(self) -> None:
+        """Recompute every job's rate. Caller must hold the lock."""
+        now = time.monotonic()
+        total_weight = sum(b.weight for b in self._buckets.values())
+        for bucket in self._buckets.values():
+            bucket.refill(now)
+            bucket.rate = self.budget * bucket.weight / total_weight if self.budget else 0.0
+
+
+class JobThrottle:
+    """
+    yt-dlp progress hook that charges a job's downloaded bytes to the scheduler.
+    The job holds a share only while one of its files is downloading.
+    """
+
+    def __init__(self, scheduler: BandwidthScheduler, key: str, weight: float = 1.0) -> None:
+        """
+        Initialize the throttle.
+
+        @param scheduler: Scheduler holding the shared budget
+        @param key: Unique job key
+        @param weight: Relative share of the budget
+        """
+        self.scheduler = scheduler
+        self.key = key
+        self.weight = weight
+        self._seen: Dict[str, int] = {}
+
+    def progress_hook(self, d: Dict[str, Any]) -> None:
+        """Hook called by yt-dlp to report progress."""
+        status = d.get('status')
+        if status == 'downloading':
+            self.scheduler.activate(self.key, self.weight)
+            name = d.get('tmpfilename') or d.get('filename') or ''
+            downloaded = d.get('downloaded_bytes') or 0
+            # The first report of a resumed file includes bytes fetched earlier
+            delta = downloaded - self._seen.get(name, downloaded)
+            self._seen[name] = downloaded
+            if delta > 0:
+                self.scheduler.consume(self.key, delta)
+        elif status in ('finished', 'error'):
+            self.scheduler.deactivate(self.key)
+
+    def close(self) -> None:
+        """Release the job's share."""
+        self.scheduler.deactivate(self.key)
+
+
+# Budget shared by every job running in this process
+scheduler = BandwidthScheduler()
@@ -7,11 +7,20 @@ import json
 import os
 from typing import Any, Dict
 
-from yt_dlp.utils import expand_path
-
 CONFIG_NAME = 'yt-dlp-gui.json'
 
 
+def expand_path(path: str) -> str:
+    """
+    Expand '~' and environment variables in a path, like yt_dlp.utils.expand_path
+    (which is not imported here so that loading the config stays cheap).
+
+    @param path: Path as stored in the config
+    @return: Expanded path
+    """
+    return os.path.expandvars(os.path.expanduser(path))
+
+
 def get_config_path() -> str:
     """
     Get the absolute path to the GUI configuration file.
@@ -35,10 +44,23 @@ def load_config() -> Dict[str, Any]:
     default_config: Dict[str, Any] = {
         'output_dir': os.getcwd(),
         'cookies_path': '',
+        'ffmpeg_path': '',
         'data_sync_id': '',
         'proxy_url': '',
         'language': 'en',
         'theme': 'dark',
+        'max_concurrent_downloads': 3,
+        'execution_mode': 'thread',
+        'global_rate_limit': '',
+        'adaptive_fragments': False,
+        'max_fragments': 8,
+        'max_chunk_size': '10M',
+        'staging_dir': '',
+        'use_archive': False,
+        'log_max_lines': 5000,
+        'log_to_file': False,
+        'api_enabled': False,
+        'api_port': 8765,
     }
 
     config_path = get_config_path()
@@ -59,6 +81,8 @@ def load_config() -> Dict[str, Any]:
         default_config['output_dir'] = expand_path(default_config['output_dir'])
     if default_config['cookies_path']:
         default_config['cookies_path'] = expand_path(default_config['cookies_path'])
+    if default_config['staging_dir']:
+        default_config['staging_dir'] = expand_path(default_config['staging_dir'])
 
     return default_config
 
@@ -0,0 +1,81 @@
+"""
+Default tab settings for yt-dlp GUI.
+The values each tab starts with, available without importing tkinter.
+"""
+
+from typing import Any, Dict
+
+GENERAL_DEFAULTS: Dict[str, Any] = {
+    'format_mode': 'Video+Audio',
+    'video_ext': 'mp4',
+    'audio_ext': 'mp3',
+    'quality': 'Best',
+    'avoid_merge': False,
+    'music_mode': False,
+    'year_folder': True,
+    'custom_template_active': False,
+    'custom_template': '%(title)s.%(ext)s',
+}
+
+NETWORK_DEFAULTS: Dict[str, Any] = {
+    'browser': 'none',
+    'user_agent': '',
+    'rate_limit': '',
+    'bandwidth_priority': 'Normal',
+    'timeout': '',
+    'source_ip': '',
+    'proxy_override': '',
+}
+
+FILTERS_DEFAULTS: Dict[str, Any] = {
+    'playlist_items': '',
+    'date': '',
+    'datebefore': '',
+    'dateafter': '',
+    'min_filesize': '',
+    'max_filesize': '',
+    'match_filter': '',
+    'playlist_parallel': False,
+}
+
+POST_DEFAULTS: Dict[str, Any] = {
+    'embed_metadata': True,
+    'embed_thumbnail': True,
+    'embed_subs': False,
+    'embed_chapters': True,
+    'sub_langs': 'en,zh.*',
+    'sponsorblock': '',
+    'write_desc': False,
+    'write_info': False,
+    'write_thumbnail_disk': False,
+}
+
+ADVANCED_DEFAULTS: Dict[str, Any] = {
+    'legacy_ssl': False,
+    'live_start': False,
+    'part_files': True,
+    'restrict_filenames': False,
+    'force_overwrite': False,
+    'retries': '10',
+    'wait_video': '',
+    'extra_args': '',
+}
+
+# Settings of all tabs combined, as returned by the GUI before any edit
+TAB_DEFAULTS: Dict[str, Any] = {
+    **GENERAL_DEFAULTS, **NETWORK_DEFAULTS, **FILTERS_DEFAULTS, **POST_DEFAULTS, **ADVANCED_DEFAULTS,
+}
+
+
+def base_ui_data(config: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Build the UI data the GUI would produce with untouched tabs.
+
+    @param config: Loaded configuration
+    @return: UI data without a URL
+    """
+    ui_data = dict(config)
+    ui_data['output_dir'] = config.get('output_dir', '.')
+    ui_data['proxy_config'] = config.get('proxy_url', '')
+    ui_data.update(TAB_DEFAULTS)
+    return ui_data
@@ -0,0 +1,203 @@
+"""
+Disk space admission control for yt-dlp GUI.
+Before a video is downloaded, its size (from 'filesize'/'filesize_approx' of the
+selected formats) is reserved on the filesystems it will be written to: the
+staging folder, if any, and the output directory. A video that does not fit next
+to the reservations of the running jobs waits until one of them finishes.
+"""
+
+from __future__ import annotations
+
+import errno
+import os
+import shutil
+import threading
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
+
+from .prefetch import estimate_size
+
+if TYPE_CHECKING:
+    import yt_dlp
+
+# Space left free on every filesystem, for metadata, thumbnails and other jobs' unknown sizes
+RESERVE_MARGIN = 256 * 1024 * 1024
+
+# Merging writes the output while the downloaded parts still exist
+MERGE_FACTOR = 2
+
+# Seconds between free space checks while waiting, for space freed outside the queue
+POLL_INTERVAL = 5.0
+
+
+def filesystem_of(path: str) -> Tuple[str, int]:
+    """
+    Find the filesystem a path will be written to.
+
+    @param path: Directory, possibly not created yet
+    @return: (nearest existing ancestor, device ID)
+    """
+    path = os.path.abspath(path)
+    while not os.path.exists(path):
+        parent = os.path.dirname(path)
+        if parent == path:
+            break
+        path = parent
+    return path, os.stat(path).st_dev
+
+
+def space_needs(info: Dict[str, Any], output_dir: str, staging_dir: Optional[str] = None) -> Dict[str, int]:
+    """
+    Compute the space a video needs on each directory it is written to.
+
+    @param info: Info dict after format selection
+    @param output_dir: Output directory of the job
+    @param staging_dir: Staging folder of the job, if any
+    @return: Bytes per directory; empty if the size is unknown
+    """
+    size = estimate_size(info)
+    if not size:
+        return {}
+    download_size = size * MERGE_FACTOR if info.get('requested_formats') else size
+    if staging_dir is None:
+        return {output_dir: download_size}
+    return {staging_dir: download_size, output_dir: size}
+
+
+class DiskBudget:
+    """
+    Space reserved on each filesystem by running jobs, checked against the free space.
+    Thread-safe; a job holds at most one reservation, replaced by its next video.
+    """
+
+    def __init__(
+        self, margin: int = RESERVE_MARGIN, usage: Callable[[str], Any] = shutil.disk_usage,
+        poll_interval: float = POLL_INTERVAL,
+    ) -> None:
+        """
+        Initialize a budget with no reservations.
+
+        @param margin: Bytes kept free on every filesystem
+        @param usage: Callable returning an object with a 'free' attribute for a path
+        @param poll_interval: Seconds between free space checks while waiting
+        """
+        self.margin = margin
+        self.usage = usage
+        self.poll_interval = poll_interval
+        self._reserved: Dict[str, Dict[int, int]] = {}
+        self._cond = threading.Condition()
+
+    def reserve(self, key: str, needs: Dict[str, int], log: Optional[Callable[[str], None]] = None) -> None:
+        """
+        Reserve space for a job, waiting until it fits.
+        Raises OSError (ENOSPC) if it cannot fit even once the other jobs are done.
+
+        @param key: Job ID; replaces the job's previous reservation
+        @param needs: Bytes per directory, as returned by space_needs()
+        @param log: Optional callable receiving a line when the job has to wait
+        """
+        devices: Dict[int, Tuple[str, int]] = {}
+        for path, size in needs.items():
+            root, dev = filesystem_of(path)
+            # A staging folder on the output filesystem is moved by a rename
+            if size > devices.get(dev, (root, 0))[1]:
+                devices[dev] = (root, size)
+        with self._cond:
+            # Files of the job's previous video are on disk now and count against the free space
+            if self._reserved.pop(key, None):
+                self._cond.notify_all()
+            waiting = False
+            while True:
+                short = self._shortfall(devices)
+                if not short:
+                    self._reserved[key] = {dev: size for dev, (_root, size) in devices.items()}
+                    if waiting and log is not None:
+                        log('[disk] Enough free space, resuming')
+                    return
+                # Nothing this budget holds will free up on a filesystem without other reservations
+                hopeless = [entry for entry in short if not entry[3]]
+                root, size, available, _others = (hopeless or short)[0]
+                if hopeless:
+                    raise OSError(
+                        errno.ENOSPC,
+                        f'Not enough disk space on "{root}": {_mib(size)} needed, {_mib(available)} available',
+                    )
+                if not waiting and log is not None:
+                    log(f'[disk] Waiting for {_mib(size)} free on "{root}" ({_mib(available)} available)')
+                waiting = True
+                self._cond.wait(self.poll_interval)
+
+    def _shortfall(self, devices: Dict[int, Tuple[str, int]]) -> List[Tuple[str, int, int, int]]:
+        """
+        Find the filesystems without room for a reservation. Call with the lock held.
+
+        @return: (directory, bytes needed, bytes available, bytes reserved by other jobs) per filesystem
+        """
+        short = []
+        for dev, (root, size) in devices.items():
+            others = sum(reserved.get(dev, 0) for reserved in self._reserved.values())
+            available = max(0, self.usage(root).free - self.margin - others)
+            if size > available:
+                short.append((root, size, available, others))
+        return short
+
+    def release(self, key: str) -> None:
+        """
+        Drop a job's reservation and wake the waiting jobs.
+
+        @param key: Job ID
+        """
+        with self._cond:
+            if self._reserved.pop(key, None):
+                self._cond.notify_all()
+
+
+class DiskAdmission:
+    """
+    Stands in for YoutubeDL.pre_process during one job.
+    Reserves each video's space once its formats are selected, right before the download.
+    """
+
+    def __init__(
+        self, budget: DiskBudget, key: str, ydl: 'yt_dlp.YoutubeDL', output_dir: str,
+        staging_dir: Optional[str] = None, log: Optional[Callable[[str], None]] = None,
+    ) -> None:
+        """
+        Route the instance's 'before_dl' stage through the budget.
+
+        @param budget: Budget shared by the queue's jobs
+        @param key: Job ID
+        @param ydl: YoutubeDL borrowed by the job
+        @param output_dir: Output directory of the job
+        @param staging_dir: Staging folder of the job, if any
+        @param log: Optional callable receiving the waiting messages
+        """
+        self.budget = budget
+        self.key = key
+        self.ydl = ydl
+        self.output_dir = output_dir
+        self.staging_dir = staging_dir
+        self.log = log
+        ydl.pre_process = self.pre_process
+
+    def pre_process(
+        self, ie_info: Dict[str, Any], key: str = 'pre_process', files_to_move: Optional[Dict[str, Any]] = None,
+    ) -> Any:
+        """Reserve space before the download, then run yt-dlp's own pre_process."""
+        if key == 'before_dl':
+            needs = space_needs(ie_info, self.output_dir, self.staging_dir)
+            if needs:
+                self.budget.reserve(self.key, needs, self.log)
+        return type(self.ydl).pre_process(self.ydl, ie_info, key, files_to_move)
+
+    def uninstall(self) -> None:
+        """Give the instance its own pre_process back."""
+        self.ydl.__dict__.pop('pre_process', None)
+
+
+def _mib(size: int) -> str:
+    """Format a byte count in MiB."""
+    return f'{size / (1024 * 1024):.0f} MiB'
+
+
+# Budget shared by the download queues of this process
+disk_budget = DiskBudget()
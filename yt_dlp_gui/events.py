@@ -0,0 +1,82 @@
+"""
+Event channel for yt-dlp GUI.
+Download workers push job events from any thread; the UI drains them at a fixed rate.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Any, Dict, List, Tuple
+
+# Interval of the UI pump that drains the channel (25 Hz)
+PUMP_INTERVAL_MS = 40
+
+Event = Tuple[Any, str, Any]
+
+
+class EventChannel:
+    """
+    Thread-safe buffer of (job, event, data) tuples.
+    Progress events are coalesced to the latest one per job; log and status
+    events are kept in order.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty channel."""
+        self._lock = threading.Lock()
+        self._events: List[Event] = []
+        self._progress: Dict[str, Event] = {}
+
+    def put(self, job: Any, event: str, data: Any) -> None:
+        """
+        Add an event. Signature matches DownloadQueue listeners.
+
+        @param job: Job the event belongs to
+        @param event: 'status', 'progress' or 'log'
+        @param data: Event payload
+        """
+        with self._lock:
+            if event == 'progress':
+                self._progress[job.id] = (job, event, data)
+            else:
+                self._events.append((job, event, data))
+
+    def drain(self) -> List[Event]:
+        """
+        Take every pending event.
+
+        @return: Ordered log/status events followed by the latest progress event of each job
+        """
+        with self._lock:
+            events, self._events = self._events, []
+            progress, self._progress = self._progress, {}
+        events.extend(progress.values())
+        return events
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._events) + len(self._progress)
+
+
+def event_record(job: Any, event: str, data: Any) -> Dict[str, Any]:
+    """
+    Convert a queue event to a JSON-serializable record.
+
+    @param job: Job the event belongs to
+    @param event: 'status', 'progress' or 'log'
+    @param data: Event payload
+    @return: Record with 'event' and 'job' keys
+    """
+    record: Dict[str, Any] = {'event': event, 'job': job.id, 'url': job.url}
+    if event == 'status':
+        record.update(status=data, title=job.title, error=job.error, filename=job.filename)
+        if job.parent_id:
+            record['parent'] = job.parent_id
+    elif event == 'progress':
+        record.update(
+            progress=round(job.progress, 1), downloaded_bytes=job.downloaded_bytes,
+            speed=data.get('speed'), eta=data.get('eta'), filename=job.filename,
+        )
+    else:
+        record['message'] = data
+    return record
@@ -0,0 +1,230 @@
+"""
+Execution backends for download jobs.
+Jobs run either in the queue's worker threads or in a reusable pool of worker processes.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .bandwidth import scheduler as bandwidth_scheduler
+from .jobs import Job, JobHooks, run_job
+from .lazy import load_yt_dlp
+from .logic import parse_rate
+
+EXECUTION_MODES = ('thread', 'process')
+
+# Progress fields relayed from worker processes; the full dict holds the unpicklable info_dict
+PROGRESS_FIELDS = (
+    'status', 'downloaded_bytes', 'total_bytes', 'total_bytes_estimate', 'speed', 'eta', 'elapsed',
+    'filename', 'tmpfilename', 'fragment_index', 'fragment_count', '_percent_str',
+)
+
+# Seconds to wait for a worker's trailing events after its job returned
+DRAIN_TIMEOUT = 5.0
+
+# Event ending the relay thread of a runner that was shut down
+_STOP_RELAY = ('', 'stop', None)
+
+_event_queue: Optional[Any] = None
+
+
+def _init_worker(event_queue: Any) -> None:
+    """Store the event queue in a freshly started worker process."""
+    global _event_queue
+    _event_queue = event_queue
+
+
+class _RelayHooks:
+    """
+    Job hooks living in a worker process.
+    Pushes progress and log events back to the GUI process.
+    """
+
+    def __init__(self, job_id: str) -> None:
+        self.job_id = job_id
+
+    def progress_hook(self, d: Dict[str, Any]) -> None:
+        """Relay the picklable part of a yt-dlp progress dict."""
+        _event_queue.put((self.job_id, 'progress', {k: d[k] for k in PROGRESS_FIELDS if k in d}))
+
+    def log(self, message: str) -> None:
+        """Relay a log line."""
+        _event_queue.put((self.job_id, 'log', message))
+
+
+def _run_in_worker(job_id: str, url: str, ui_data: Dict[str, Any], budget: Optional[float]) -> Optional[str]:
+    """
+    Run a job inside a worker process.
+
+    @param budget: This worker's slice of the global bandwidth budget
+    @return: Error message if the download failed, None otherwise
+    """
+    bandwidth_scheduler.set_budget(budget)
+    job = Job(url, ui_data)
+    job.id = job_id
+    try:
+        run_job(job, _RelayHooks(job_id))
+    except Exception as e:
+        return str(e)
+    finally:
+        _event_queue.put((job_id, 'done', None))
+    return None
+
+
+class ProcessRunner:
+    """
+    Job runner that executes each job in a worker process from a reusable pool.
+    Progress and log events are relayed back over a queue and replayed on the job's hooks.
+    The global bandwidth budget is split evenly between the worker processes.
+    """
+
+    def __init__(self, max_workers: int) -> None:
+        """
+        Initialize the runner and its event relay thread.
+
+        @param max_workers: Number of worker processes
+        """
+        # 'spawn' keeps the children independent of the Tk main loop and its threads
+        self._ctx = multiprocessing.get_context('spawn')
+        self._events = self._ctx.Queue()
+        self._lock = threading.Lock()
+        self._active: Dict[str, Tuple[JobHooks, threading.Event]] = {}
+        self._retired: List[ProcessPoolExecutor] = []
+        self._closed = False
+        self.max_workers = max(1, int(max_workers))
+        self._executor = self._create_executor()
+
+        self._relay = threading.Thread(target=self._relay_events, daemon=True)
+        self._relay.start()
+
+    def _create_executor(self) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(
+            max_workers=self.max_workers, mp_context=self._ctx,
+            initializer=_init_worker, initargs=(self._events,),
+        )
+
+    def resize(self, max_workers: int) -> None:
+        """Replace the pool with one of a new size. Running jobs finish in the old pool."""
+        max_workers = max(1, int(max_workers))
+        with self._lock:
+            if max_workers == self.max_workers:
+                return
+            self.max_workers = max_workers
+            old, self._executor = self._executor, self._create_executor()
+            # Kept until their workers exit, so that shutdown(kill=True) still reaches them
+            self._retired = [ex for ex in self._retired if any(p.is_alive() for p in _executor_processes(ex))]
+            self._retired.append(old)
+        old.shutdown(wait=False)
+
+    def __call__(self, job: Job, hooks: JobHooks) -> None:
+        """Run a job in a worker process and block until its events are replayed."""
+        load_yt_dlp()
+        from yt_dlp.utils import DownloadError
+
+        # Worker processes cannot share live token buckets, so each gets an equal slice
+        budget = parse_rate(job.ui_data.get('global_rate_limit'))
+        budget = budget / self.max_workers if budget else None
+        for warning in process_mode_warnings(hooks, budget, self.max_workers):
+            hooks.log(f'[WARN] {warning}')
+
+        drained = threading.Event()
+        with self._lock:
+            self._active[job.id] = (hooks, drained)
+            executor = self._executor
+        try:
+            try:
+                error = executor.submit(_run_in_worker, job.id, job.url, job.ui_data, budget).result()
+            except BrokenProcessPool:
+                # A worker died (crash or kill); start over with a fresh pool
+                with self._lock:
+                    if self._executor is executor and not self._closed:
+                        self._executor = self._create_executor()
+                raise DownloadError('Worker process terminated unexpectedly')
+            drained.wait(DRAIN_TIMEOUT)
+        finally:
+            with self._lock:
+                self._active.pop(job.id, None)
+                last = self._closed and not self._active
+            if last:
+                self._events.put(_STOP_RELAY)
+        if error:
+            raise DownloadError(error)
+
+    def _relay_events(self) -> None:
+        """Replay events from worker processes on the matching job hooks, until shutdown and the last job."""
+        while True:
+            job_id, event, data = self._events.get()
+            with self._lock:
+                if event == 'stop' and not self._active:
+                    break
+                entry = self._active.get(job_id)
+            if entry is None:
+                continue
+            hooks, drained = entry
+            if event == 'progress':
+                hooks.progress_hook(data)
+            elif event == 'log':
+                hooks.log(data)
+            elif event == 'done':
+                drained.set()
+
+    def shutdown(self, kill: bool = False) -> None:
+        """
+        Stop accepting jobs. Workers exit once their current job is done, and the
+        event relay thread once the last running job has returned.
+
+        @param kill: Terminate this runner's worker processes right away
+        """
+        with self._lock:
+            self._closed = True
+            executors = self._retired + [self._executor]
+            self._retired = []
+        for executor in executors:
+            processes = _executor_processes(executor)
+            executor.shutdown(wait=False)
+            if kill:
+                for process in processes:
+                    process.terminate()
+        self._events.put(_STOP_RELAY)
+
+
+def _executor_processes(executor: ProcessPoolExecutor) -> List[Any]:
+    """List the worker processes of an executor; empty once it has cleaned up after shutdown."""
+    return list((getattr(executor, '_processes', None) or {}).values())
+
+
+def process_mode_warnings(hooks: Any, budget: Optional[float], max_workers: int) -> List[str]:
+    """
+    List the queue features a job loses by running in a worker process.
+
+    @param hooks: Job hooks of the queue, with its post_stage and disk_budget
+    @param budget: The job's slice of the global bandwidth budget
+    @param max_workers: Number of worker processes
+    @return: One line per feature that applies to the job
+    """
+    warnings = []
+    if getattr(hooks, 'post_stage', None) is not None:
+        warnings.append('Worker process mode: post-processing runs in the worker instead of the post-processing stage')
+    if getattr(hooks, 'disk_budget', None) is not None:
+        warnings.append('Worker process mode: disk space is not reserved before downloading')
+    if budget and max_workers > 1:
+        warnings.append(f'Worker process mode: this job is limited to 1/{max_workers} of the total bandwidth limit')
+    return warnings
+
+
+def create_runner(mode: str, max_workers: int) -> Callable[[Job, JobHooks], None]:
+    """
+    Create the job runner for an execution mode.
+
+    @param mode: 'thread' runs jobs in the queue threads, 'process' in worker processes
+    @param max_workers: Pool size for the process mode
+    @return: Runner callable for DownloadQueue
+    """
+    if mode == 'process':
+        return ProcessRunner(max_workers)
+    return run_job
@@ -0,0 +1,89 @@
+"""
+Extra CLI arguments for yt-dlp GUI.
+Parses the Advanced tab's free-form arguments with yt-dlp's own option parser,
+once per distinct string.
+"""
+
+from __future__ import annotations
+
+import copy
+import shlex
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from .lazy import load_yt_dlp
+
+MAX_ENTRIES = 32
+
+ParseResult = Tuple[Dict[str, Any], Optional[str]]
+
+
+def _error_message(error: Exception) -> str:
+    """Reduce an optparse error (usage text included) to its last line."""
+    lines = [line for line in str(error).splitlines() if line.strip()]
+    message = lines[-1] if lines else type(error).__name__
+    return message.split('error: ', 1)[-1]
+
+
+class ExtraArgsCache:
+    """
+    Thread-safe LRU of parsed extra arguments keyed by the raw string.
+    Only the options that differ from yt-dlp's defaults are kept, so merging
+    them does not reset anything the GUI has set.
+    """
+
+    def __init__(self, max_entries: int = MAX_ENTRIES) -> None:
+        """
+        Initialize the cache.
+
+        @param max_entries: Maximum number of distinct argument strings kept
+        """
+        self.max_entries = max_entries
+        self._entries: 'OrderedDict[str, ParseResult]' = OrderedDict()
+        self._defaults: Optional[Dict[str, Any]] = None
+        self._lock = threading.Lock()
+
+    def parse(self, raw: str) -> ParseResult:
+        """
+        Parse an argument string, or return the cached result.
+
+        @param raw: Arguments as typed, e.g. '-N 4 --no-mtime'
+        @return: (options to merge into ydl_opts, error message or None)
+        """
+        raw = raw.strip()
+        if not raw:
+            return {}, None
+        with self._lock:
+            result = self._entries.get(raw)
+            if result is not None:
+                self._entries.move_to_end(raw)
+        if result is None:
+            result = self._parse(raw)
+            with self._lock:
+                self._entries[raw] = result
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+        opts, error = result
+        return copy.deepcopy(opts), error
+
+    def _parse(self, raw: str) -> ParseResult:
+        """Run yt-dlp's option parser and keep the non-default options."""
+        yt_dlp = load_yt_dlp()
+
+        try:
+            # shlex.split helps handle quoted arguments correctly
+            parsed = yt_dlp.parse_options(shlex.split(raw)).ydl_opts
+            if self._defaults is None:
+                self._defaults = yt_dlp.parse_options([]).ydl_opts
+        except Exception as e:
+            return {}, _error_message(e)
+        return {k: v for k, v in parsed.items() if k not in self._defaults or self._defaults[k] != v}, None
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+# Cache shared by the Advanced tab and every job of this process
+extra_args_cache = ExtraArgsCache()
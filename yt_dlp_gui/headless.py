@@ -0,0 +1,143 @@
+"""
+Headless entry point for yt-dlp GUI.
+Runs the download queue without Tk and prints one JSON object per line:
+'status', 'progress' and 'log' events, then a final 'summary'. With --serve it
+keeps running and takes jobs from the local API (see server.py).
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import time
+from typing import Any, Dict, List, Optional, Set, TextIO
+
+from .bandwidth import scheduler as bandwidth_scheduler
+from .config import load_config
+from .defaults import base_ui_data
+from .events import EventChannel, event_record
+from .executors import EXECUTION_MODES, ProcessRunner, create_runner
+from .jobs import DEFAULT_MAX_WORKERS, JOB_FAILED, JOB_FINISHED, DownloadQueue
+from .journal import JobJournal
+from .logic import parse_rate
+from .postprocess import default_post_workers
+from .profiles import ProfileStore
+from .server import DEFAULT_PORT, ApiServer, get_api_token_path
+from .ydlpool import ydl_pool
+
+# Seconds between two reports; progress is coalesced to the latest value per job
+REPORT_INTERVAL = 0.5
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Create the command line parser for headless mode."""
+    parser = argparse.ArgumentParser(
+        prog='yt-dlp-gui --headless',
+        description='Download URLs with the yt-dlp GUI settings, without a window.',
+    )
+    parser.add_argument('urls', nargs='*', metavar='URL', help='URLs to download')
+    parser.add_argument('-a', '--batch-file', action='append', default=[], help='File with one URL per line')
+    parser.add_argument('-p', '--profile', help='Name of a saved option profile')
+    parser.add_argument('-o', '--output-dir', help='Output directory (default: from the config file)')
+    parser.add_argument('-j', '--jobs', type=int, help='Number of concurrent downloads')
+    parser.add_argument('--mode', choices=EXECUTION_MODES, help='Run downloads in threads or worker processes')
+    parser.add_argument(
+        '--journal', action='store_true', help='Record jobs in the job journal and resume unfinished ones',
+    )
+    parser.add_argument(
+        '--serve', type=int, nargs='?', const=DEFAULT_PORT, metavar='PORT',
+        help=f'Keep running and accept jobs on http://127.0.0.1:PORT (default {DEFAULT_PORT})',
+    )
+    return parser
+
+
+def main(argv: Optional[List[str]] = None, out: TextIO = sys.stdout) -> int:
+    """
+    Run headless downloads.
+
+    @param argv: Arguments without the program name and '--headless'
+    @param out: Stream receiving the JSON lines
+    @return: Exit code: 0 on success, 1 if a download failed, 2 on usage errors
+    """
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    config = load_config()
+    ui_data = base_ui_data(config)
+    if args.output_dir:
+        ui_data['output_dir'] = os.path.abspath(os.path.expanduser(args.output_dir))
+    profiles = ProfileStore()
+    if args.profile:
+        profile = profiles.get(args.profile)
+        if profile is None:
+            print(f'Error: unknown profile {args.profile!r}', file=sys.stderr)
+            return 2
+        ui_data = profile.apply(ui_data)
+    os.makedirs(ui_data['output_dir'], exist_ok=True)
+
+    workers = max(1, args.jobs or config.get('max_concurrent_downloads', DEFAULT_MAX_WORKERS))
+    runner = create_runner(args.mode or config.get('execution_mode', 'thread'), workers)
+    journal = JobJournal() if args.journal else None
+    bandwidth_scheduler.set_budget(parse_rate(config.get('global_rate_limit')))
+
+    channel = EventChannel()
+    queue = DownloadQueue(workers, runner=runner, journal=journal, post_workers=default_post_workers())
+    queue.add_listener(channel.put)
+
+    jobs = queue.restore()
+    for url in list(args.urls) + list(args.batch_file):
+        jobs.extend(queue.submit(dict(ui_data, video_url=url)))
+
+    def write(record: Dict[str, Any]) -> None:
+        out.write(json.dumps(record, ensure_ascii=False, default=str) + '\n')
+
+    # In server mode jobs arrive over the local API and the process runs until Ctrl+C
+    server: Optional[ApiServer] = None
+    if args.serve is not None:
+        server = ApiServer(queue, lambda: dict(ui_data), profiles, port=args.serve)
+        try:
+            server.start()
+        except OSError as e:
+            print(f'Error starting API server: {e}', file=sys.stderr)
+            queue.shutdown()
+            return 2
+        write({'event': 'listening', 'url': f'http://127.0.0.1:{server.port}', 'token_file': get_api_token_path()})
+        out.flush()
+    elif not jobs:
+        parser.print_usage(sys.stderr)
+        return 2
+
+    reported: Set[str] = set()
+    interrupted = False
+    try:
+        while True:
+            # Stop only once the final status event of every finished job has been written
+            done = queue.is_idle()
+            for job, event, data in channel.drain():
+                write(event_record(job, event, data))
+                if event == 'status' and job.done:
+                    reported.add(job.id)
+            out.flush()
+            if server is None and done and all(job.id in reported for job in queue.jobs.values() if job.done):
+                break
+            time.sleep(REPORT_INTERVAL)
+    except KeyboardInterrupt:
+        interrupted = True
+    finally:
+        if server is not None:
+            server.stop()
+        queue.shutdown()
+        if isinstance(runner, ProcessRunner):
+            runner.shutdown(kill=True)
+        ydl_pool.close_all()
+        if journal is not None:
+            journal.close()
+    if interrupted and server is None:
+        return 130
+
+    counts = queue.stats()
+    write({'event': 'summary', 'finished': counts[JOB_FINISHED], 'failed': counts[JOB_FAILED]})
+    out.flush()
+    return 1 if counts[JOB_FAILED] else 0
@@ -0,0 +1,207 @@
+"""
+Extraction cache for yt-dlp GUI.
+Keeps unprocessed extract_info results in a size-bounded LRU with a TTL, so
+retries, requeues and previews do not hit the site again.
+"""
+
+from __future__ import annotations
+
+import copy
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit, urlunsplit
+
+from .logic import VISITOR_STAMP_FORMAT
+
+DEFAULT_TTL = 30 * 60
+DEFAULT_MAX_ENTRIES = 256
+
+# Signed media URLs are dropped this many seconds before they expire
+EXPIRY_MARGIN = 5 * 60
+
+# YoutubeDL params that change what an extraction returns, e.g. media URLs bound to the client IP
+FINGERPRINT_PARAMS = (
+    'proxy', 'source_address', 'cookiefile', 'cookiesfrombrowser', 'user_agent', 'http_headers',
+    'extractor_args', 'geo_verification_proxy', 'geo_bypass_country', 'geo_bypass_ip_block',
+    'username', 'usenetrc', 'impersonate', 'legacyserverconnect',
+)
+
+
+def normalize_url(url: str) -> str:
+    """
+    Normalize a URL for use as a cache key.
+    Lowercases scheme and host and drops the fragment.
+
+    @param url: URL as entered by the user
+    @return: Normalized URL
+    """
+    parts = urlsplit(url.strip())
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path, parts.query, ''))
+
+
+def signed_url_expiry(info: Dict[str, Any]) -> Optional[float]:
+    """
+    Find the earliest expiry timestamp of the signed format URLs in an info dict.
+
+    @param info: Unprocessed info dict
+    @return: Unix timestamp, or None if no URL carries an 'expire' parameter
+    """
+    expiry = None
+    for fmt in info.get('formats') or [info]:
+        url = fmt.get('url')
+        if not isinstance(url, str) or 'expire' not in url:
+            continue
+        value = parse_qs(urlsplit(url).query).get('expire')
+        if not value:
+            continue
+        try:
+            stamp = float(value[0])
+        except ValueError:
+            continue
+        expiry = stamp if expiry is None else min(expiry, stamp)
+    return expiry
+
+
+def _is_visitor_stamp(value: Any) -> bool:
+    """Whether an extractor argument value is the per-job timestamp of Music Optimization."""
+    try:
+        datetime.strptime(value, VISITOR_STAMP_FORMAT)
+    except (TypeError, ValueError):
+        return False
+    return True
+
+
+def _without_visitor_stamp(extractor_args: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Drop the visitor timestamp that build_ydl_opts stamps on every music mode job.
+
+    @param extractor_args: 'extractor_args' YoutubeDL param
+    @return: The arguments without the timestamp; a user-supplied visitor_data is kept
+    """
+    youtube = extractor_args.get('youtube')
+    if not isinstance(youtube, dict) or not youtube.get('visitor_data'):
+        return extractor_args
+    if not all(_is_visitor_stamp(value) for value in youtube['visitor_data']):
+        return extractor_args
+    youtube = {key: value for key, value in youtube.items() if key != 'visitor_data'}
+    return dict(extractor_args, youtube=youtube)
+
+
+def extraction_fingerprint(params: Dict[str, Any]) -> str:
+    """
+    Fingerprint the options an extraction result depends on.
+
+    @param params: YoutubeDL params
+    @return: Short hash; equal for options that extract the same result
+    """
+    relevant = {key: params.get(key) for key in FINGERPRINT_PARAMS if params.get(key)}
+    if isinstance(relevant.get('extractor_args'), dict):
+        relevant['extractor_args'] = _without_visitor_stamp(relevant['extractor_args'])
+    data = json.dumps(relevant, sort_keys=True, default=str)
+    return hashlib.sha1(data.encode('utf-8')).hexdigest()[:16]
+
+
+class InfoCache:
+    """
+    Thread-safe LRU cache of extraction results keyed by normalized URL and by
+    '<extractor> <id>', each within an options fingerprint (see extraction_fingerprint).
+    Entries expire after the TTL or shortly before their signed media URLs do,
+    whichever comes first.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, ttl: float = DEFAULT_TTL) -> None:
+        """
+        Initialize the cache.
+
+        @param max_entries: Maximum number of cached info dicts
+        @param ttl: Seconds an entry stays valid
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: 'OrderedDict[Tuple[str, str], Tuple[float, Dict[str, Any]]]' = OrderedDict()
+        self._aliases: Dict[Tuple[str, str], Tuple[str, str]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _id_key(info: Dict[str, Any]) -> Optional[str]:
+        extractor = info.get('extractor_key') or info.get('ie_key')
+        if extractor and info.get('id'):
+            return f'{extractor.lower()} {info["id"]}'
+        return None
+
+    def get(self, url: str, fingerprint: str = '') -> Optional[Dict[str, Any]]:
+        """
+        Get a copy of the cached info for a URL.
+
+        @param url: URL or '<extractor> <id>' key
+        @param fingerprint: Fingerprint of the options the info is needed for
+        @return: Info dict, or None on a miss or expired entry
+        """
+        with self._lock:
+            key = self._aliases.get((fingerprint, normalize_url(url))) or self._aliases.get((fingerprint, url))
+            entry = self._entries.get(key) if key else None
+            if entry is None:
+                return None
+            expires, info = entry
+            if expires <= time.time():
+                self._remove(key)
+                return None
+            self._entries.move_to_end(key)
+        return copy.deepcopy(info)
+
+    def put(self, url: str, info: Dict[str, Any], fingerprint: str = '') -> None:
+        """
+        Cache a single-video extraction result. Playlists and live streams are not cached.
+
+        @param url: URL the info was extracted from
+        @param info: Unprocessed info dict
+        @param fingerprint: Fingerprint of the options the info was extracted with
+        """
+        if info.get('_type', 'video') != 'video' or info.get('is_live'):
+            return
+        expires = time.time() + self.ttl
+        signed = signed_url_expiry(info)
+        if signed is not None:
+            expires = min(expires, signed - EXPIRY_MARGIN)
+        if expires <= time.time():
+            return
+
+        key = (fingerprint, self._id_key(info) or normalize_url(url))
+        try:
+            stored = copy.deepcopy(info)
+        except TypeError:
+            # Some extractors return lazy (generator) fragment lists
+            return
+        with self._lock:
+            self._remove(key)
+            self._entries[key] = (expires, stored)
+            for alias in {key[1], normalize_url(url), normalize_url(info.get('webpage_url') or url)}:
+                self._aliases[(fingerprint, alias)] = key
+            while len(self._entries) > self.max_entries:
+                self._remove(next(iter(self._entries)))
+
+    def discard(self, url: str) -> None:
+        """Drop the entries for a URL under every fingerprint, e.g. after its media URLs were rejected."""
+        with self._lock:
+            names = {normalize_url(url), url}
+            for key in {key for (_fingerprint, alias), key in self._aliases.items() if alias in names}:
+                self._remove(key)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def _remove(self, key: Tuple[str, str]) -> None:
+        """Remove an entry and its aliases. Caller must hold the lock."""
+        if self._entries.pop(key, None) is not None:
+            for alias in [a for a, k in self._aliases.items() if k == key]:
+                del self._aliases[alias]
+
+
+# Cache shared by every job running in this process
+info_cache = InfoCache()
@@ -0,0 +1,474 @@
+"""
+Download job queue for yt-dlp GUI.
+Runs queued download jobs on a resizable pool of worker threads; their
+post-processing can be handed to a separate stage.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import os
+import shutil
+import threading
+import time
+import uuid
+from collections import OrderedDict, deque
+from typing import TYPE_CHECKING, Any, Callable, Deque, Dict, List, Optional
+
+from .bandwidth import PRIORITY_WEIGHTS, JobThrottle
+from .bandwidth import scheduler as bandwidth_scheduler
+from .diskspace import DiskAdmission, DiskBudget, disk_budget
+from .infocache import InfoCache, extraction_fingerprint, info_cache
+from .lazy import load_yt_dlp
+from .playlist import expand_playlist
+from .postprocess import PostHandoff, PostStage
+from .staging import StagingMove, staging_path
+from .tuning import tuner
+from .ydlpool import YdlPool, ydl_pool
+
+if TYPE_CHECKING:
+    import yt_dlp
+
+JOB_QUEUED = 'queued'
+JOB_RUNNING = 'running'
+JOB_PROCESSING = 'processing'
+JOB_FINISHED = 'finished'
+JOB_FAILED = 'failed'
+
+DEFAULT_MAX_WORKERS = 3
+
+# Minimum seconds between journal writes of a job's download progress
+JOURNAL_INTERVAL = 2.0
+
+
+class Job:
+    """
+    A single download request with its own snapshot of the UI data.
+    """
+
+    def __init__(self, url: str, ui_data: Dict[str, Any]) -> None:
+        """
+        Initialize the job.
+
+        @param url: URL to download
+        @param ui_data: UI data snapshot used to build the yt-dlp options
+        """
+        self.id = uuid.uuid4().hex[:12]
+        self.url = url
+        self.ui_data = dict(ui_data, video_url=url)
+        self.title: Optional[str] = None
+        self.parent_id: Optional[str] = None
+        self.status = JOB_QUEUED
+        self.progress = 0.0
+        self.downloaded_bytes = 0
+        self.filename: Optional[str] = None
+        self.error: Optional[str] = None
+        self.journaled_at = 0.0
+
+    @property
+    def done(self) -> bool:
+        """Whether the job has reached a final state."""
+        return self.status in (JOB_FINISHED, JOB_FAILED)
+
+
+class JobHooks:
+    """
+    Per-job stand-in for the GUI passed to build_ydl_opts.
+    Forwards yt-dlp progress and log messages to the queue listeners.
+    """
+
+    def __init__(self, download_queue: 'DownloadQueue', job: Job) -> None:
+        """
+        Initialize the hooks.
+
+        @param download_queue: Queue that owns the job
+        @param job: Job the hooks report for
+        """
+        self.queue = download_queue
+        self.job = job
+        self.post_stage = download_queue.post_stage
+        self.disk_budget = download_queue.disk_budget
+
+    def progress_hook(self, d: Dict[str, Any]) -> None:
+        """Hook called by yt-dlp to report progress."""
+        if d.get('status') == 'downloading':
+            total = d.get('total_bytes') or d.get('total_bytes_estimate')
+            if total:
+                self.job.progress = min(100.0, d.get('downloaded_bytes', 0) * 100.0 / total)
+        elif d.get('status') == 'finished':
+            self.job.progress = 100.0
+        self.job.downloaded_bytes = d.get('downloaded_bytes') or self.job.downloaded_bytes
+        self.job.filename = d.get('filename') or self.job.filename
+        self.queue._checkpoint(self.job, force=d.get('status') == 'finished')
+        self.queue._emit(self.job, 'progress', d)
+
+    def log(self, message: str) -> None:
+        """Forward a log line from MyLogger."""
+        self.queue._emit(self.job, 'log', message)
+
+
+def download_url(ydl: 'yt_dlp.YoutubeDL', url: str, cache: InfoCache = info_cache) -> None:
+    """
+    Download a URL, reusing a cached extraction result when there is one.
+    Only the raw extraction is cached; format selection runs again for every job.
+    Like YoutubeDL.download(), --break-on-existing, --break-match-filter and
+    --max-downloads end the job cleanly.
+
+    @param ydl: YoutubeDL instance configured for the job
+    @param url: URL to download
+    @param cache: Extraction cache
+    """
+    from yt_dlp.utils import (
+        ExistingVideoReached, MaxDownloadsReached, RejectedVideoReached, UnavailableVideoError,
+    )
+
+    try:
+        if ydl.params.get('wait_for_video'):
+            # Scheduled streams need yt-dlp's own wait-and-retry loop
+            ydl.download([url])
+            return
+
+        fingerprint = extraction_fingerprint(ydl.params)
+        info = cache.get(url, fingerprint)
+        if info is None:
+            info = ydl.extract_info(url, download=False, process=False)
+            if info is None:
+                # Skipped, e.g. already in the download archive
+                return
+            cache.put(url, info, fingerprint)
+        ydl.process_ie_result(info, download=True)
+    except UnavailableVideoError as e:
+        ydl.report_error(e)
+    except (ExistingVideoReached, RejectedVideoReached, MaxDownloadsReached) as e:
+        ydl.to_screen(f'[info] {e}')
+
+
+def run_job(job: Job, hooks: JobHooks, pool: YdlPool = ydl_pool) -> Optional[PostHandoff]:
+    """
+    Download a job in the calling thread with a warm YoutubeDL instance from the pool.
+    If the hooks carry a post_stage, post-processing is handed to it; if they carry a
+    disk_budget, each video waits for its space to be reserved before downloading.
+
+    @param job: Job to run
+    @param hooks: Hooks that receive the job's progress and log output
+    @param pool: Pool lending instances built for the job's options
+    @return: Handoff to wait on if post-processing was deferred, None if the job is complete
+    """
+    # Charge the job's traffic to the shared bandwidth budget
+    weight = PRIORITY_WEIGHTS.get(job.ui_data.get('bandwidth_priority', 'Normal'), 1.0)
+    throttle = JobThrottle(bandwidth_scheduler, job.id, weight)
+    progress_hooks = [throttle.progress_hook, hooks.progress_hook]
+    tuning = tuner.for_job(job.url, job.ui_data) if job.ui_data.get('adaptive_fragments') else None
+    if tuning is not None:
+        progress_hooks.insert(0, tuning.progress_hook)
+    post_stage: Optional[PostStage] = getattr(hooks, 'post_stage', None)
+    budget: Optional[DiskBudget] = getattr(hooks, 'disk_budget', None)
+    staging = staging_path(job.ui_data, job.id)
+    try:
+        with contextlib.ExitStack() as stack:
+            ydl = stack.enter_context(pool.borrow(job.ui_data, hooks, progress_hooks))
+            if tuning is not None:
+                tuning.apply(ydl.params)
+            if staging is not None:
+                # yt-dlp checks home (output_dir) for existing files and writes everything else to temp
+                ydl.params['paths'] = dict(ydl.params.get('paths') or {}, temp=staging)
+                move = StagingMove(ydl, lambda path: setattr(job, 'filename', path))
+                stack.callback(move.uninstall)
+            if budget is not None:
+                admission = DiskAdmission(
+                    budget, job.id, ydl, job.ui_data.get('output_dir') or os.getcwd(), staging, hooks.log,
+                )
+                stack.callback(admission.uninstall)
+            if post_stage is None:
+                download_url(ydl, job.url)
+                return None
+            handoff = PostHandoff(post_stage, ydl)
+            # On failure, files already handed off are finished before the instance goes back
+            stack.callback(handoff.wait)
+            download_url(ydl, job.url)
+            # Otherwise the stage returns the instance after the last file
+            return handoff if handoff.detach(stack.pop_all()) else None
+    except Exception:
+        # Media URLs may have been rejected; a retry must extract again
+        info_cache.discard(job.url)
+        raise
+    finally:
+        throttle.close()
+
+
+class DownloadQueue:
+    """
+    Queue of download jobs executed by a pool of worker threads.
+    Listeners are called from worker threads with (job, event, data), where
+    event is one of 'status', 'progress' or 'log'.
+    Jobs with 'playlist_parallel' set are flat-extracted first and replaced by
+    one child job per playlist entry. With a journal, every job is persisted and
+    unfinished jobs can be requeued with restore(). With post_workers, post-processing
+    runs on a separate stage and jobs stay 'processing' until it is done. Jobs with a
+    'staging_dir' work in a subfolder of it, removed when they finish.
+    Jobs reserve their disk space on disk_budget and hold it until they finish.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        runner: Callable[[Job, JobHooks], Optional[PostHandoff]] = run_job,
+        expander: Callable[[Dict[str, Any], Any], Optional[List[Dict[str, Any]]]] = expand_playlist,
+        journal: Optional[Any] = None,
+        post_workers: Optional[int] = None,
+        budget: Optional[DiskBudget] = disk_budget,
+    ) -> None:
+        """
+        Initialize the queue.
+
+        @param max_workers: Maximum number of jobs running at the same time
+        @param runner: Callable that performs the download of a job
+        @param expander: Callable returning the playlist entries of a job, or None for single videos
+        @param journal: Optional JobJournal persisting the jobs
+        @param post_workers: Post-processing threads; None runs post-processing in the download workers
+        @param budget: Disk space budget shared with other queues; None disables admission control
+        """
+        self.max_workers = max(1, int(max_workers))
+        self.runner = runner
+        self.expander = expander
+        self.journal = journal
+        self.post_stage = PostStage(post_workers) if post_workers else None
+        self.disk_budget = budget
+        self.jobs: 'OrderedDict[str, Job]' = OrderedDict()
+        self._pending: Deque[Job] = deque()
+        self._workers: List[threading.Thread] = []
+        # Workers waiting for a job, including those just started
+        self._idle = 0
+        self._listeners: List[Callable[[Job, str, Any], None]] = []
+        self._cond = threading.Condition()
+        self._closed = False
+
+    def add_listener(self, listener: Callable[[Job, str, Any], None]) -> None:
+        """Register a callable to receive job events."""
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[[Job, str, Any], None]) -> None:
+        """Unregister a listener added with add_listener."""
+        try:
+            self._listeners.remove(listener)
+        except ValueError:
+            pass
+
+    def submit(self, ui_data: Dict[str, Any], batch_files: bool = True) -> List[Job]:
+        """
+        Queue one job per URL. A path to a batch file queues every URL it lists.
+
+        @param ui_data: UI data snapshot; 'video_url' holds the URL or batch file path
+        @param batch_files: Whether a local path is read as a batch file; off for remote callers
+        @return: The queued jobs
+        """
+        url = ui_data.get('video_url', '').strip()
+        if batch_files and os.path.isfile(url):
+            load_yt_dlp()
+            from yt_dlp.utils import read_batch_urls
+            with open(url, 'r', encoding='utf-8') as f:
+                urls = read_batch_urls(f)
+        else:
+            urls = [url] if url else []
+
+        return self._enqueue([Job(u, ui_data) for u in urls])
+
+    def restore(self) -> List[Job]:
+        """
+        Requeue the jobs the journal recorded as queued, running or post-processing.
+        Downloads resume from their .part files.
+
+        @return: The requeued jobs
+        """
+        if self.journal is None:
+            return []
+        jobs = []
+        for row in self.journal.unfinished():
+            job = Job(row['url'], dict(row['options'], resume=True))
+            job.id = row['id']
+            job.title = row['title']
+            job.parent_id = row['parent_id']
+            job.downloaded_bytes = row['bytes_done']
+            job.filename = row['output_path']
+            jobs.append(job)
+        return self._enqueue(jobs)
+
+    def _enqueue(self, jobs: List[Job], parent: Optional[Job] = None) -> List[Job]:
+        """
+        Append jobs to the pending deque and wake the workers.
+
+        @param jobs: Jobs to queue
+        @param parent: Playlist job the jobs were expanded from. The journal marks it finished
+            together with recording them, so a restart never expands it a second time.
+        """
+        if self.journal is not None:
+            self.journal.record(jobs, finished=parent.id if parent is not None else None)
+        with self._cond:
+            for job in jobs:
+                self.jobs[job.id] = job
+                self._pending.append(job)
+            self._spawn_workers()
+            self._cond.notify_all()
+        for job in jobs:
+            self._emit(job, 'status', job.status)
+        return jobs
+
+    def snapshot(self) -> List[Job]:
+        """List every job of the queue, oldest first."""
+        with self._cond:
+            return list(self.jobs.values())
+
+    def set_max_workers(self, max_workers: int) -> None:
+        """Resize the worker pool. Surplus workers exit after their current job."""
+        with self._cond:
+            self.max_workers = max(1, int(max_workers))
+            self._spawn_workers()
+            self._cond.notify_all()
+
+    def stats(self) -> Dict[str, int]:
+        """Count jobs per status."""
+        counts = {JOB_QUEUED: 0, JOB_RUNNING: 0, JOB_PROCESSING: 0, JOB_FINISHED: 0, JOB_FAILED: 0}
+        with self._cond:
+            for job in self.jobs.values():
+                counts[job.status] += 1
+        return counts
+
+    def depths(self) -> Dict[str, Dict[str, int]]:
+        """
+        Get the load of each stage of the pipeline.
+
+        @return: {'download': {...}, 'post': {...}}, each with 'active' and 'queued' counts
+        """
+        counts = self.stats()
+        post = self.post_stage.depth() if self.post_stage is not None else {'active': 0, 'queued': 0}
+        return {'download': {'active': counts[JOB_RUNNING], 'queued': counts[JOB_QUEUED]}, 'post': post}
+
+    def is_idle(self) -> bool:
+        """Whether no job is queued, running or post-processing."""
+        counts = self.stats()
+        return not counts[JOB_QUEUED] and not counts[JOB_RUNNING] and not counts[JOB_PROCESSING]
+
+    def shutdown(self) -> None:
+        """Stop accepting work and let idle workers exit."""
+        with self._cond:
+            self._closed = True
+            self._pending.clear()
+            self._cond.notify_all()
+        if self.post_stage is not None:
+            self.post_stage.shutdown()
+
+    def _spawn_workers(self) -> None:
+        """Start workers up to the pool size while jobs outnumber idle workers. Caller must hold the lock."""
+        while len(self._workers) < self.max_workers and len(self._pending) > self._idle:
+            worker = threading.Thread(target=self._worker_loop, daemon=True)
+            self._workers.append(worker)
+            self._idle += 1
+            worker.start()
+
+    def _worker_loop(self) -> None:
+        """Take jobs from the pending deque until the pool shrinks or closes."""
+        me = threading.current_thread()
+        while True:
+            with self._cond:
+                while not self._pending and not self._closed and len(self._workers) <= self.max_workers:
+                    self._cond.wait()
+                if self._closed or not self._pending or len(self._workers) > self.max_workers:
+                    self._workers.remove(me)
+                    self._idle -= 1
+                    return
+                job = self._pending.popleft()
+                self._idle -= 1
+                job.status = JOB_RUNNING
+            if self.journal is not None:
+                self.journal.update(job.id, status=job.status)
+            self._emit(job, 'status', job.status)
+            self._run(job)
+            with self._cond:
+                self._idle += 1
+
+    def _run(self, job: Job) -> None:
+        """Run a single job and record its final state, or wait for its post-processing."""
+        hooks = JobHooks(self, job)
+        handoff = None
+        try:
+            if not (job.ui_data.get('playlist_parallel') and self._fan_out(job, hooks)):
+                handoff = self.runner(job, hooks)
+        except Exception as e:
+            self._finish(job, str(e))
+            return
+        if handoff is None:
+            self._finish(job, None)
+            return
+        self._set_processing(job)
+        handoff.when_done(lambda error: self._finish(job, error))
+
+    def _set_processing(self, job: Job) -> None:
+        """Mark a downloaded job as waiting for post-processing."""
+        if job.status == JOB_PROCESSING:
+            return
+        job.status = JOB_PROCESSING
+        if self.journal is not None:
+            self.journal.update(job.id, status=job.status)
+        self._emit(job, 'status', job.status)
+
+    def _finish(self, job: Job, error: Optional[str]) -> None:
+        """Remove the job's staging folder, then record its final state."""
+        staging = staging_path(job.ui_data, job.id)
+        if staging is not None:
+            # Finished files have been moved out; partial files of a failed job are not resumed
+            shutil.rmtree(staging, ignore_errors=True)
+        self._complete(job, error)
+
+    def _complete(self, job: Job, error: Optional[str]) -> None:
+        """Record the final state of a job and free its disk space reservation."""
+        if self.disk_budget is not None:
+            self.disk_budget.release(job.id)
+        if error is not None:
+            job.error = error
+            job.status = JOB_FAILED
+        else:
+            job.progress = 100.0
+            job.status = JOB_FINISHED
+        if self.journal is not None:
+            self.journal.update(
+                job.id, status=job.status, error=job.error, bytes_done=job.downloaded_bytes, output_path=job.filename,
+            )
+        self._emit(job, 'status', job.status)
+
+    def _fan_out(self, job: Job, hooks: JobHooks) -> bool:
+        """
+        Replace a playlist job by one child job per entry.
+
+        @return: True if the job was a playlist and its entries were queued
+        """
+        entries = self.expander(job.ui_data, hooks)
+        if entries is None:
+            return False
+
+        # Entries are already selected, so children must not re-apply playlist_items
+        child_data = dict(job.ui_data, playlist_items='', playlist_parallel=False)
+        children = []
+        for entry in entries:
+            child = Job(entry['url'], child_data)
+            child.title = entry.get('title')
+            child.parent_id = job.id
+            children.append(child)
+        hooks.log(f'[playlist] Queued {len(children)} entries for parallel download')
+        self._enqueue(children, parent=job)
+        return True
+
+    def _checkpoint(self, job: Job, force: bool = False) -> None:
+        """Write a job's download progress to the journal, at most every JOURNAL_INTERVAL seconds."""
+        now = time.monotonic()
+        if self.journal is None or (not force and now - job.journaled_at < JOURNAL_INTERVAL):
+            return
+        job.journaled_at = now
+        self.journal.update(job.id, bytes_done=job.downloaded_bytes, output_path=job.filename)
+
+    def _emit(self, job: Job, event: str, data: Any) -> None:
+        """Dispatch an event to every listener."""
+        for listener in list(self._listeners):
+            try:
+                listener(job, event, data)
+            except Exception as e:
+                print(f'Error in job listener: {e}')
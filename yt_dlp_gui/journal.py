@@ -0,0 +1,150 @@
+"""
+Persistent job journal for yt-dlp GUI.
+Records every queued job in a SQLite database (WAL mode) next to the config file,
+so unfinished jobs can be requeued after a crash or restart.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional
+
+from .config import get_config_path
+from .jobs import JOB_FAILED, JOB_FINISHED, JOB_PROCESSING, JOB_QUEUED, JOB_RUNNING
+
+JOURNAL_NAME = 'yt-dlp-gui-jobs.db'
+
+# Finished jobs older than this are purged when the journal is opened
+RETENTION_SECONDS = 7 * 24 * 3600
+
+_SCHEMA = '''
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    url TEXT NOT NULL,
+    options TEXT NOT NULL,
+    status TEXT NOT NULL,
+    bytes_done INTEGER NOT NULL DEFAULT 0,
+    output_path TEXT,
+    title TEXT,
+    parent_id TEXT,
+    error TEXT,
+    created REAL NOT NULL,
+    updated REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status);
+'''
+
+_UPDATABLE = ('status', 'bytes_done', 'output_path', 'title', 'error')
+
+
+def get_journal_path() -> str:
+    """
+    Get the absolute path to the job journal database.
+
+    @return: Path in the same directory as the config file
+    """
+    return os.path.join(os.path.dirname(get_config_path()), JOURNAL_NAME)
+
+
+class JobJournal:
+    """
+    Durable store of job URL, option snapshot, status, bytes done and output path.
+    Safe to use from several threads.
+    """
+
+    def __init__(self, path: Optional[str] = None) -> None:
+        """
+        Open (and create if needed) the journal database.
+
+        @param path: Database path, defaults to get_journal_path()
+        """
+        self.path = path or get_journal_path()
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._conn.row_factory = sqlite3.Row
+        with self._lock:
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.execute('PRAGMA synchronous=NORMAL')
+            self._conn.executescript(_SCHEMA)
+            self._conn.execute(
+                'DELETE FROM jobs WHERE status IN (?, ?) AND updated < ?',
+                (JOB_FINISHED, JOB_FAILED, time.time() - RETENTION_SECONDS),
+            )
+
+    def record(self, jobs: Iterable[Any], finished: Optional[str] = None) -> None:
+        """
+        Insert or replace jobs with their full option snapshots, in one transaction.
+
+        @param jobs: Jobs to record
+        @param finished: Optional ID of a job marked finished in the same transaction,
+            e.g. the playlist job the recorded jobs were expanded from
+        """
+        now = time.time()
+        rows = [
+            (
+                job.id, job.url, json.dumps(job.ui_data, default=str), job.status, job.downloaded_bytes,
+                job.filename, job.title, job.parent_id, job.error, now, now,
+            )
+            for job in jobs
+        ]
+        with self._lock:
+            self._conn.execute('BEGIN')
+            try:
+                self._conn.executemany(
+                    'INSERT OR REPLACE INTO jobs (id, url, options, status, bytes_done, output_path, title, parent_id,'
+                    ' error, created, updated) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                    rows,
+                )
+                if finished is not None:
+                    self._conn.execute(
+                        'UPDATE jobs SET status = ?, updated = ? WHERE id = ?', (JOB_FINISHED, now, finished),
+                    )
+            except Exception:
+                self._conn.execute('ROLLBACK')
+                raise
+            self._conn.execute('COMMIT')
+
+    def update(self, job_id: str, **fields: Any) -> None:
+        """
+        Update columns of a recorded job.
+
+        @param job_id: Job ID
+        @param fields: Column values (status, bytes_done, output_path, title, error)
+        """
+        columns = [k for k in fields if k in _UPDATABLE]
+        if not columns:
+            return
+        assignments = ', '.join(f'{k} = ?' for k in columns)
+        with self._lock:
+            self._conn.execute(
+                f'UPDATE jobs SET {assignments}, updated = ? WHERE id = ?',
+                [fields[k] for k in columns] + [time.time(), job_id],
+            )
+
+    def unfinished(self) -> List[Dict[str, Any]]:
+        """
+        Get jobs that were queued, running or post-processing when the app stopped.
+
+        @return: Rows as dictionaries, options decoded, oldest first
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                'SELECT * FROM jobs WHERE status IN (?, ?, ?) ORDER BY created, rowid',
+                (JOB_QUEUED, JOB_RUNNING, JOB_PROCESSING),
+            ).fetchall()
+        result = []
+        for row in rows:
+            item = dict(row)
+            item['options'] = json.loads(item['options'])
+            result.append(item)
+        return result
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
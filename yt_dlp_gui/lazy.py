@@ -0,0 +1,24 @@
+"""
+Deferred yt-dlp import for yt-dlp GUI.
+yt-dlp is only imported when first needed, so the window opens quickly.
+"""
+
+from __future__ import annotations
+
+import threading
+from types import ModuleType
+
+_import_lock = threading.Lock()
+
+
+def load_yt_dlp() -> ModuleType:
+    """
+    Import yt-dlp, serializing the first import.
+    Two threads importing it at the same time can trip over its circular imports
+    and see a partially initialized module.
+
+    @return: The yt_dlp module
+    """
+    with _import_lock:
+        import yt_dlp
+    return yt_dlp
@@ -0,0 +1,108 @@
+"""
+Log model for yt-dlp GUI.
+Keeps the most recent log lines in a ring buffer, hands new lines to the view in
+batches and optionally appends the full history to a file.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from collections import deque
+from typing import IO, Deque, List, Optional
+
+from .config import get_config_path
+
+LOG_NAME = 'yt-dlp-gui.log'
+DEFAULT_MAX_LINES = 5000
+MIN_LINES = 100
+
+
+def get_log_path() -> str:
+    """
+    Get the absolute path to the spilled log file.
+
+    @return: Path in the same directory as the config file
+    """
+    return os.path.join(os.path.dirname(get_config_path()), LOG_NAME)
+
+
+class LogBuffer:
+    """
+    Bounded, thread-safe log history.
+    The view calls take_pending() periodically and inserts the returned lines at once.
+    """
+
+    def __init__(self, max_lines: int = DEFAULT_MAX_LINES, spill_path: Optional[str] = None) -> None:
+        """
+        Initialize the buffer.
+
+        @param max_lines: Number of lines kept in memory and in the view
+        @param spill_path: File receiving every line, or None to keep only the buffer
+        """
+        self._lock = threading.Lock()
+        self.max_lines = max(MIN_LINES, max_lines)
+        self._lines: Deque[str] = deque(maxlen=self.max_lines)
+        self._pending: List[str] = []
+        self._spill: Optional[IO[str]] = None
+        self.set_spill_path(spill_path)
+
+    def append(self, message: str) -> None:
+        """
+        Add a message; multi-line messages become several lines.
+
+        @param message: Log text
+        """
+        lines = message.split('\n')
+        with self._lock:
+            self._lines.extend(lines)
+            self._pending.extend(lines)
+            if self._spill is not None:
+                stamp = time.strftime('%Y-%m-%d %H:%M:%S')
+                self._spill.writelines(f'{stamp} {line}\n' for line in lines)
+
+    def take_pending(self) -> List[str]:
+        """
+        Take the lines added since the last call and flush the spill file.
+
+        @return: New lines, at most max_lines of the most recent ones
+        """
+        with self._lock:
+            pending, self._pending = self._pending[-self.max_lines:], []
+            if self._spill is not None and pending:
+                self._spill.flush()
+        return pending
+
+    def lines(self) -> List[str]:
+        """Get the lines currently held in memory, oldest first."""
+        with self._lock:
+            return list(self._lines)
+
+    def set_max_lines(self, max_lines: int) -> None:
+        """Change the line cap, dropping the oldest lines if needed."""
+        with self._lock:
+            self.max_lines = max(MIN_LINES, max_lines)
+            self._lines = deque(self._lines, maxlen=self.max_lines)
+
+    def set_spill_path(self, path: Optional[str]) -> None:
+        """
+        Start, stop or redirect spilling to disk.
+
+        @param path: Log file to append to, or None to stop spilling
+        """
+        with self._lock:
+            if self._spill is not None and self._spill.name == path:
+                return
+            if self._spill is not None:
+                self._spill.close()
+                self._spill = None
+            if path:
+                try:
+                    self._spill = open(path, 'a', encoding='utf-8')
+                except OSError as e:
+                    print(f'Error opening log file: {e}')
+
+    def close(self) -> None:
+        """Close the spill file."""
+        self.set_spill_path(None)
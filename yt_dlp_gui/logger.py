@@ -29,6 +29,15 @@ class MyLogger:
         """
         return self.ansi_escape.sub('', msg)
 
+    def _emit(self, msg: str) -> None:
+        """
+        Send a line to the log sink. Sinks (such as job hooks) are thread-safe;
+        the GUI picks the lines up through its event channel.
+
+        @param msg: The cleaned log line
+        """
+        self.gui.log(msg)
+
     def debug(self, msg: str) -> None:
         """Handle debug messages (mostly ignored in UI)."""
         pass
@@ -36,12 +45,12 @@ class MyLogger:
     def warning(self, msg: str) -> None:
         """Handle warning messages."""
         clean_msg = self.strip_ansi(msg)
-        self.gui.root.after(0, lambda: self.gui.log(f'[WARN] {clean_msg}'))
+        self._emit(f'[WARN] {clean_msg}')
 
     def error(self, msg: str) -> None:
         """Handle error messages."""
         clean_msg = self.strip_ansi(msg)
-        self.gui.root.after(0, lambda: self.gui.log(f'[ERROR] {clean_msg}'))
+        self._emit(f'[ERROR] {clean_msg}')
 
     def info(self, msg: str) -> None:
         """Handle informational messages."""
@@ -49,5 +58,5 @@ class MyLogger:
         # yt-dlp sends a lot of info, we want to filter some or just show it
         # suppress the long download progress logs in the text area, since we have a progress bar
         if not clean_msg.startswith('[download] '):
-            self.gui.root.after(0, lambda: self.gui.log(clean_msg))
+            self._emit(clean_msg)
 
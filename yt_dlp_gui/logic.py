@@ -5,13 +5,16 @@ Handles JS runtime detection and downloader option construction.
 
 from __future__ import annotations
 
+import copy
+import functools
 import os
-import shlex
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Any, Dict, List, Optional
-
-from yt_dlp.utils._jsruntime import BunJsRuntime, DenoJsRuntime, NodeJsRuntime, QuickJsRuntime
+from typing import Any, Callable, Dict, Hashable, Iterator, List, Optional, Tuple
 
+from .archive import get_archive
+from .extraargs import extra_args_cache
+from .lazy import load_yt_dlp
 from .logger import MyLogger
 
 
@@ -37,6 +40,9 @@ def detect_js_runtime() -> Optional[str]:
 
     @return: Name of the detected runtime or None
     """
+    load_yt_dlp()
+    from yt_dlp.utils._jsruntime import BunJsRuntime, DenoJsRuntime, NodeJsRuntime, QuickJsRuntime
+
     # Priority order: Deno, Bun, Node, QuickJS
     runtimes = [
         DenoJsRuntime(),
@@ -44,15 +50,23 @@ def detect_js_runtime() -> Optional[str]:
         NodeJsRuntime(),
         QuickJsRuntime(),
     ]
-    for rt in runtimes:
-        try:
-            if rt.info and rt.info.supported:
-                return rt.info.name
-        except Exception:
-            continue
+    # Each probe spawns a process; run them side by side and pick by priority
+    with ThreadPoolExecutor(max_workers=len(runtimes), thread_name_prefix='js-probe') as executor:
+        infos = list(executor.map(_probe_js_runtime, runtimes))
+    for info in infos:
+        if info and info.supported:
+            return info.name
     return None
 
 
+def _probe_js_runtime(runtime: Any) -> Any:
+    """Run one runtime's version probe; errors count as not found."""
+    try:
+        return runtime.info
+    except Exception:
+        return None
+
+
 def get_ffmpeg_info(ffmpeg_location: Optional[str] = None) -> Dict[str, Any]:
     """
     Detect FFmpeg info using yt-dlp's FFmpegPostProcessor.
@@ -60,6 +74,7 @@ def get_ffmpeg_info(ffmpeg_location: Optional[str] = None) -> Dict[str, Any]:
     @param ffmpeg_location: Optional path to ffmpeg folder or executable
     @return: Dictionary with availability, path, and version
     """
+    load_yt_dlp()
     from yt_dlp.postprocessor.ffmpeg import FFmpegPostProcessor
     
     # We need a dummy downloader or None
@@ -79,30 +94,328 @@ def get_ffmpeg_info(ffmpeg_location: Optional[str] = None) -> Dict[str, Any]:
     }
 
 
+def parse_rate(value: Any) -> Optional[int]:
+    """
+    Parse a rate such as '5M' or '500K' into bytes per second.
+
+    @param value: Rate string or number
+    @return: Bytes per second, or None if empty or invalid
+    """
+    if isinstance(value, (int, float)):
+        return int(value) if value > 0 else None
+    value = str(value or '').strip()
+    if not value:
+        return None
+    load_yt_dlp()
+    from yt_dlp.utils import parse_bytes
+    return parse_bytes(value) or None
+
+
+# Source codecs (format 'acodec' prefixes) that FFmpegExtractAudio copies into each target
+AUDIO_COPY_SOURCES = {'m4a': 'mp4a', 'aac': 'mp4a', 'opus': 'opus', 'vorbis': 'vorbis'}
+
+
+def audio_format(target: str) -> str:
+    """
+    Get the format selector for an audio target, preferring sources that can be stream-copied.
+
+    @param target: Audio format from the UI ('best' keeps the source codec)
+    @return: yt-dlp format selector
+    """
+    source = AUDIO_COPY_SOURCES.get(target)
+    if source:
+        return f'bestaudio[acodec^={source}]/bestaudio/best'
+    return 'bestaudio/best'
+
+
+def source_audio_codec(acodec: Optional[str]) -> Optional[str]:
+    """
+    Map a format's acodec (e.g. 'mp4a.40.2') to the codec name ffprobe reports.
+
+    @param acodec: Audio codec of the downloaded format
+    @return: Codec name, or None if unknown
+    """
+    if not acodec or acodec == 'none':
+        return None
+    name = acodec.split('.')[0].lower()
+    return {'mp4a': 'aac', 'ac-3': 'ac3', 'ec-3': 'eac3'}.get(name, name)
+
+
+def audio_action(info: Dict[str, Any], target: str) -> str:
+    """
+    Predict what FFmpegExtractAudio does with a downloaded file, following its own rules.
+
+    @param info: Info dict of the file (ext, acodec)
+    @param target: Requested audio format
+    @return: 'keep' (left as is), 'copy' (remuxed with stream copy) or 'transcode'
+    """
+    load_yt_dlp()
+    from yt_dlp.postprocessor.ffmpeg import ACODECS, FFmpegExtractAudioPP
+
+    if target == 'best' and info.get('ext') in FFmpegExtractAudioPP.COMMON_AUDIO_EXTS:
+        return 'keep'
+    codec = source_audio_codec(info.get('acodec'))
+    if codec == 'aac' and target in ('m4a', 'best'):
+        return 'copy'
+    if (target == 'best' or target == codec) and codec in ACODECS:
+        return 'copy'
+    return 'transcode'
+
+
+class AudioReport:
+    """
+    Post-processor hook logging, for every file, whether its audio is copied or transcoded.
+    """
+
+    def __init__(self, gui: Any, target: str) -> None:
+        """
+        Initialize the hook.
+
+        @param gui: Object with log() receiving the report
+        @param target: Requested audio format
+        """
+        self.gui = gui
+        self.target = target
+
+    def __call__(self, d: Dict[str, Any]) -> None:
+        """Hook called by yt-dlp around each post-processor run."""
+        if d.get('postprocessor') != 'ExtractAudio' or d.get('status') != 'started':
+            return
+        info = d.get('info_dict') or {}
+        action = audio_action(info, self.target)
+        codec = source_audio_codec(info.get('acodec')) or info.get('ext')
+        title = info.get('title') or info.get('filepath')
+        if action == 'transcode':
+            self.gui.log(f'[audio] Transcoding {codec} to {self.target}: {title}')
+        elif action == 'copy':
+            self.gui.log(f'[audio] Stream copy ({codec}): {title}')
+        else:
+            self.gui.log(f'[audio] Kept original {info.get("ext")}: {title}')
+
+
+# Fraction of the best video's height a pre-muxed format may lack and still be preferred
+MERGE_TOLERANCE = 0.1
+
+# Selector used when no pre-muxed format is close enough (yt-dlp's default)
+MERGE_FALLBACK = 'bv*+ba/b'
+
+
+class MergeAvoidingSelector:
+    """
+    Format selector (a callable 'format' option) that takes a pre-muxed format
+    in the requested container when it is within the tolerance of the best video
+    the format sort allows, and falls back to merging best video and audio.
+    The fallback is compiled by the YoutubeDL using the options (see bind_format_selector).
+    """
+
+    def __init__(self, ext: str, tolerance: float = MERGE_TOLERANCE, fallback: str = MERGE_FALLBACK) -> None:
+        """
+        Initialize the selector.
+
+        @param ext: Requested container; also the merge output format of the fallback
+        @param tolerance: Fraction of the best height a pre-muxed format may lack
+        @param fallback: Format spec used when merging is needed
+        """
+        self.ext = ext
+        self.tolerance = tolerance
+        self.fallback = fallback
+        self._fallback_selector: Optional[Callable[[Dict[str, Any]], Any]] = None
+
+    def bind(self, ydl: Any) -> None:
+        """
+        Compile the fallback with the instance that selects formats, so it follows that
+        instance's options (multiple streams, format checks and their network settings).
+
+        @param ydl: YoutubeDL created with the options holding this selector
+        """
+        self._fallback_selector = ydl.build_format_selector(self.fallback)
+
+    def pick_muxed(self, formats: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """
+        Find the pre-muxed format to download instead of a merge.
+
+        @param formats: Formats sorted from worst to best, as yt-dlp passes them
+        @return: The format, or None if merging is needed
+        """
+        videos = [f for f in formats if f.get('vcodec') != 'none']
+        muxed = [f for f in videos if f.get('acodec') != 'none' and f.get('ext') == self.ext]
+        if not muxed:
+            return None
+        best, candidate = videos[-1], muxed[-1]
+        if candidate is best:
+            return candidate
+        best_height, height = best.get('height'), candidate.get('height')
+        if best_height and height and height >= best_height * (1 - self.tolerance):
+            return candidate
+        return None
+
+    def __call__(self, ctx: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+        """Yield the formats to download; called by yt-dlp with the selection context."""
+        candidate = self.pick_muxed(ctx['formats'])
+        if candidate is not None:
+            yield candidate
+        elif self._fallback_selector is None:
+            raise RuntimeError('MergeAvoidingSelector was not bound to its YoutubeDL')
+        else:
+            yield from self._fallback_selector(ctx)
+
+
+def bind_format_selector(ydl: Any) -> None:
+    """
+    Bind a MergeAvoidingSelector in an instance's options to that instance.
+    Call once after creating a YoutubeDL from build_ydl_opts.
+
+    @param ydl: New YoutubeDL instance
+    """
+    selector = ydl.params.get('format')
+    if isinstance(selector, MergeAvoidingSelector):
+        selector.bind(ydl)
+
+
+def format_plan(ui_data: Dict[str, Any]) -> Optional[str]:
+    """
+    Describe the format plan of the options before the formats are known.
+
+    @param ui_data: UI data snapshot
+    @return: One line, or None when merge avoidance is off
+    """
+    if ui_data.get('format_mode') == 'Audio Only' or not ui_data.get('avoid_merge'):
+        return None
+    ext = ui_data.get('video_ext', 'mp4')
+    return (
+        f'Format plan: pre-muxed {ext} within {MERGE_TOLERANCE:.0%} of the best allowed height, '
+        f'otherwise merge video+audio into {ext}'
+    )
+
+
+def describe_selection(info: Dict[str, Any]) -> Optional[str]:
+    """
+    Describe the formats yt-dlp selected for a processed info dict.
+
+    @param info: Info dict after format selection
+    @return: One line, or None if nothing was selected
+    """
+    details = ' '.join(str(v) for v in (info.get('resolution'), info.get('ext')) if v)
+    suffix = f' ({details})' if details else ''
+    requested = info.get('requested_formats')
+    if requested:
+        ids = '+'.join(str(f.get('format_id')) for f in requested)
+        return f'Format plan: merge {ids}{suffix}'
+    if info.get('format_id'):
+        return f'Format plan: single format {info["format_id"]}{suffix}, no merge'
+    return None
+
+
+# Fields that differ between jobs of a batch; they are stamped on the compiled options
+JOB_FIELDS = frozenset({'video_url', 'resume', 'title', 'parent_id'})
+
+# Format of the visitor timestamp Music Optimization sends with every job
+VISITOR_STAMP_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+
 def build_ydl_opts(ui_data: Dict[str, Any], gui: Any) -> Dict[str, Any]:
     """
     Build the yt-dlp options dictionary from GUI input data.
+    The static part is compiled once per distinct set of options (see compile_ydl_opts);
+    per-job fields, logger, hooks and the files found on disk are stamped on a copy.
 
     @param ui_data: Dictionary containing all UI field values
     @param gui: Reference to the GUI instance for logger and hooks
     @return: yt-dlp options dictionary
     """
+    snapshot = freeze_ui_data({k: v for k, v in ui_data.items() if k not in JOB_FIELDS})
+    try:
+        compiled, warnings = _compile_cached(snapshot)
+    except TypeError:
+        # Unhashable values (e.g. objects passed by a caller) skip the cache
+        messages: List[str] = []
+        compiled = compile_ydl_opts(ui_data, messages)
+        warnings = tuple(messages)
+    for warning in warnings:
+        print(warning)
+    ydl_opts = copy.deepcopy(compiled)
+    ydl_opts['logger'] = MyLogger(gui)
+    ydl_opts['progress_hooks'] = [gui.progress_hook]
+    if ui_data.get('format_mode') == 'Audio Only':
+        ydl_opts['postprocessor_hooks'] = [AudioReport(gui, ui_data.get('audio_ext') or 'best')]
+
+    # The cookies file may be created or deleted at any time, so it is looked up for every job
+    cookies = cookies_file(ui_data)
+    if cookies:
+        ydl_opts.setdefault('cookiefile', cookies)
+
+    # Known items are skipped before any network extraction
+    if ui_data.get('use_archive') and 'download_archive' not in ydl_opts:
+        ydl_opts['download_archive'] = get_archive()
+
+    # Jobs restored from the journal continue their .part files
+    if ui_data.get('resume'):
+        ydl_opts['continuedl'] = True
+        ydl_opts['overwrites'] = False
+
+    # Music Optimization sends a fresh visitor timestamp with every job
+    if ui_data.get('music_mode'):
+        youtube_args = ydl_opts.setdefault('extractor_args', {}).setdefault('youtube', {})
+        youtube_args.setdefault('visitor_data', [datetime.now().strftime(VISITOR_STAMP_FORMAT)])
+
+    return ydl_opts
+
+
+def cookies_file(ui_data: Dict[str, Any]) -> Optional[str]:
+    """
+    Get the cookies file to pass to yt-dlp, checked on disk at the time of the call.
+
+    @param ui_data: Dictionary containing all UI field values
+    @return: Path of the existing cookies file, or None if there is none or a browser is used
+    """
+    path = (ui_data.get('cookies_path') or '').strip()
+    if path and ui_data.get('browser', 'none') == 'none' and os.path.exists(path):
+        return path
+    return None
+
+
+@functools.lru_cache(maxsize=32)
+def _compile_cached(snapshot: Tuple[Tuple[str, Any], ...]) -> Tuple[Dict[str, Any], Tuple[str, ...]]:
+    """
+    Memoized compile_ydl_opts on a snapshot made by freeze_ui_data. Callers must copy the result.
+
+    @return: (options, warnings to report on every use)
+    """
+    warnings: List[str] = []
+    return compile_ydl_opts(dict(snapshot), warnings), tuple(warnings)
+
+
+def compile_ydl_opts(ui_data: Dict[str, Any], warnings: Optional[List[str]] = None) -> Dict[str, Any]:
+    """
+    Build the job-independent part of the yt-dlp options: formats, output template,
+    network, filters, post-processing and parsed extra arguments.
+    Only translates the options; nothing on disk is checked (see build_ydl_opts).
+
+    @param ui_data: Dictionary containing all UI field values
+    @param warnings: Optional list receiving the messages about invalid values instead of printing them
+    @return: yt-dlp options without logger, hooks, per-job fields or the cookies file
+    """
+    load_yt_dlp()
+    from yt_dlp.utils import DateRange, match_filter_func, parse_bytes
+
+    warn = print if warnings is None else warnings.append
     path = ui_data.get('output_dir', os.getcwd())
-    
+    # With a staging folder the template is relative to paths.home, so that each job can set paths.temp
+    staging = bool((ui_data.get('staging_dir') or '').strip())
+    base = '' if staging else path
+
     # Configure output template
     custom_tmpl = ui_data.get('custom_template', '').strip()
     if ui_data.get('custom_template_active') and custom_tmpl:
-        out_tmpl = os.path.join(path, custom_tmpl)
+        out_tmpl = os.path.join(base, custom_tmpl)
     elif ui_data.get('year_folder'):
-        out_tmpl = os.path.join(path, '%(upload_date>%Y)s', '%(title)s.%(ext)s')
+        out_tmpl = os.path.join(base, '%(upload_date>%Y)s', '%(title)s.%(ext)s')
     else:
-        out_tmpl = os.path.join(path, '%(title)s.%(ext)s')
+        out_tmpl = os.path.join(base, '%(title)s.%(ext)s')
 
     # Basic Options
     ydl_opts: Dict[str, Any] = {
         'outtmpl': out_tmpl,
-        'logger': MyLogger(gui),
-        'progress_hooks': [gui.progress_hook],
         'writethumbnail': ui_data.get('embed_thumbnail') or ui_data.get('write_thumbnail_disk'),
         'addmetadata': ui_data.get('embed_metadata'),
         'writesubtitles': ui_data.get('embed_subs'),
@@ -113,6 +426,8 @@ def build_ydl_opts(ui_data: Dict[str, Any], gui: Any) -> Dict[str, Any]:
         'restrictfilenames': ui_data.get('restrict_filenames'),
         'overwrites': ui_data.get('force_overwrite'),
     }
+    if staging:
+        ydl_opts['paths'] = {'home': path}
 
     # Post Processors
     postprocessors: List[Dict[str, Any]] = []
@@ -130,11 +445,12 @@ def build_ydl_opts(ui_data: Dict[str, Any], gui: Any) -> Dict[str, Any]:
     # Format Selection
     mode = ui_data.get('format_mode')
     if mode == 'Audio Only':
-        fmt = ui_data.get('audio_ext')
-        ydl_opts['format'] = 'bestaudio/best'
+        # 'best' keeps the source codec; FFmpegExtractAudio then remuxes with stream copy
+        fmt = ui_data.get('audio_ext') or 'best'
+        ydl_opts['format'] = audio_format(fmt)
         postprocessors.append({
             'key': 'FFmpegExtractAudio',
-            'preferredcodec': fmt if fmt != 'best' else 'mp3',
+            'preferredcodec': fmt,
         })
     else:
         # Video + Audio
@@ -152,6 +468,8 @@ def build_ydl_opts(ui_data: Dict[str, Any], gui: Any) -> Dict[str, Any]:
         height_constraint = q_map.get(quality, '')
 
         ydl_opts['merge_output_format'] = vid_ext
+        if ui_data.get('avoid_merge'):
+            ydl_opts['format'] = MergeAvoidingSelector(vid_ext)
 
         if height_constraint:
             h_val = height_constraint.replace('[height<=', '').replace(']', '')
@@ -163,8 +481,9 @@ def build_ydl_opts(ui_data: Dict[str, Any], gui: Any) -> Dict[str, Any]:
         ydl_opts['postprocessors'] = postprocessors
 
     # Network
-    if ui_data.get('rate_limit'):
-        ydl_opts['ratelimit'] = ui_data['rate_limit']
+    rate_limit = parse_rate(ui_data.get('rate_limit'))
+    if rate_limit:
+        ydl_opts['ratelimit'] = rate_limit
     
     if ui_data.get('timeout'):
         try:
@@ -187,19 +506,30 @@ def build_ydl_opts(ui_data: Dict[str, Any], gui: Any) -> Dict[str, Any]:
     if ui_data.get('user_agent'):
         ydl_opts['user_agent'] = ui_data['user_agent']
 
-    cookies_file = ui_data.get('cookies_path', '').strip()
-    if cookies_file and os.path.exists(cookies_file) and browser == 'none':
-        ydl_opts['cookiefile'] = cookies_file
-
     # FFmpeg Location
     ffmpeg_loc = ui_data.get('ffmpeg_path', '').strip()
     if ffmpeg_loc:
         ydl_opts['ffmpeg_location'] = ffmpeg_loc
 
-    # Filters
-    for key in ['playlist_items', 'date', 'datebefore', 'dateafter', 'min_filesize', 'max_filesize', 'match_filter']:
-        if ui_data.get(key):
-            ydl_opts[key] = ui_data[key]
+    # Filters (converted the same way the yt-dlp CLI does)
+    if ui_data.get('playlist_items'):
+        ydl_opts['playlist_items'] = ui_data['playlist_items']
+
+    try:
+        if ui_data.get('date'):
+            ydl_opts['daterange'] = DateRange.day(ui_data['date'])
+        elif ui_data.get('dateafter') or ui_data.get('datebefore'):
+            ydl_opts['daterange'] = DateRange(ui_data.get('dateafter') or None, ui_data.get('datebefore') or None)
+    except ValueError as e:
+        warn(f'Error parsing date filter: {e}')
+
+    for key in ['min_filesize', 'max_filesize']:
+        size = parse_bytes(str(ui_data.get(key) or '').strip())
+        if size:
+            ydl_opts[key] = size
+
+    if ui_data.get('match_filter', '').strip():
+        ydl_opts['match_filter'] = match_filter_func(ui_data['match_filter'].strip())
 
     # Advanced / Retries
     if ui_data.get('retries'):
@@ -227,12 +557,11 @@ def build_ydl_opts(ui_data: Dict[str, Any], gui: Any) -> Dict[str, Any]:
     # Extractor Args (Music Optimization)
     extractor_args: Dict[str, Any] = {}
     if ui_data.get('music_mode'):
-        current_timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        # visitor_data is stamped per job by build_ydl_opts
         extractor_args = {
             'youtubetab': {'skip': ['webpage']},
             'youtube': {
                 'player_skip': ['webpage', 'configs'],
-                'visitor_data': [current_timestamp],
             },
         }
 
@@ -245,27 +574,44 @@ def build_ydl_opts(ui_data: Dict[str, Any], gui: Any) -> Dict[str, Any]:
     if extractor_args:
         ydl_opts['extractor_args'] = extractor_args
 
-    # Custom Extra Arguments
+    # Custom Extra Arguments (parsed once per distinct string, then reused by every job)
     extra_args = ui_data.get('extra_args', '').strip()
     if extra_args:
-        from yt_dlp.options import parseOpts
-        try:
-            # shlex.split helps handle quoted arguments correctly
-            args_list = shlex.split(extra_args)
-            _, _, _, extra_ydl_opts = parseOpts(args_list)
-            # Merge extra_ydl_opts into ydl_opts
-            ydl_opts.update(extra_ydl_opts)
-        except Exception as e:
-            # In a real app, we might want to log this or notify the user
-            print(f"Error parsing extra arguments: {e}")
+        extra_ydl_opts, error = extra_args_cache.parse(extra_args)
+        if error:
+            warn(f'Error parsing extra arguments: {error}')
+        ydl_opts.update(extra_ydl_opts)
 
     return ydl_opts
 
 
+def freeze_ui_data(value: Any) -> Hashable:
+    """
+    Convert UI data into an immutable, hashable snapshot.
+    Dictionaries become sorted tuples of items and lists become tuples.
+
+    @param value: UI data dictionary (or a value inside it)
+    @return: Hashable snapshot
+    """
+    if isinstance(value, dict):
+        return tuple(sorted((k, freeze_ui_data(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple, set)):
+        return tuple(freeze_ui_data(v) for v in value)
+    return value
+
+
 def get_command_preview(ui_data: Dict[str, Any]) -> str:
     """
     Generate a CLI command preview string based on the current UI data.
+    Results are memoized on an immutable snapshot of the inputs.
     """
+    return _render_command_preview(freeze_ui_data(ui_data))
+
+
+@functools.lru_cache(maxsize=64)
+def _render_command_preview(snapshot: Tuple[Tuple[str, Any], ...]) -> str:
+    """Build the preview string from a snapshot made by freeze_ui_data."""
+    ui_data = dict(snapshot)
     cmd = ['yt-dlp']
     
     # URL
@@ -275,7 +621,9 @@ def get_command_preview(ui_data: Dict[str, Any]) -> str:
     
     # Basic options that map simply to CLI
     if ui_data.get('format_mode') == 'Audio Only':
-        cmd.extend(['-f', 'ba/b', '-x', '--audio-format', ui_data.get('audio_ext', 'mp3')])
+        fmt = ui_data.get('audio_ext') or 'best'
+        source = AUDIO_COPY_SOURCES.get(fmt)
+        cmd.extend(['-f', f'ba[acodec^={source}]/ba/b' if source else 'ba/b', '-x', '--audio-format', fmt])
     else:
         ext = ui_data.get('video_ext', 'mp4')
         quality = ui_data.get('quality', 'Best')
@@ -1,7 +1,20 @@
-import tkinter as tk
-from .app import YTDownloaderGUI
+import multiprocessing
+import sys
+
 
 def run_app():
+    # Required for the worker process pool in frozen (PyInstaller) builds
+    multiprocessing.freeze_support()
+
+    # Headless mode never imports tkinter
+    if '--headless' in sys.argv[1:]:
+        from .headless import main
+        argv = [arg for arg in sys.argv[1:] if arg != '--headless']
+        sys.exit(main(argv))
+
+    import tkinter as tk
+    from .app import YTDownloaderGUI
+
     root = tk.Tk()
     app = YTDownloaderGUI(root)
     root.mainloop()
@@ -0,0 +1,82 @@
+"""
+Playlist fan-out for yt-dlp GUI.
+Flat-extracts a playlist once so its entries can be downloaded as separate parallel jobs.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional
+
+from .infocache import InfoCache, extraction_fingerprint, info_cache
+from .lazy import load_yt_dlp
+from .logic import bind_format_selector, build_ydl_opts
+
+
+def flat_extract(ui_data: Dict[str, Any], gui: Any, cache: InfoCache = info_cache) -> Optional[Dict[str, Any]]:
+    """
+    Extract a URL without resolving playlist entries.
+    The Filters tab settings (playlist items, dates, match filter) are applied by yt-dlp.
+    A single video is left unprocessed and cached, so that its download skips extraction.
+
+    @param ui_data: UI data snapshot of the job
+    @param gui: Hooks object for logger output
+    @param cache: Extraction cache
+    @return: yt-dlp info dict, or None if the URL was skipped
+    """
+    yt_dlp = load_yt_dlp()
+
+    ydl_opts = build_ydl_opts(ui_data, gui)
+    ydl_opts.update({
+        'extract_flat': 'in_playlist',
+        'skip_download': True,
+        'progress_hooks': [],
+        'postprocessors': [],
+    })
+    url = ui_data['video_url']
+    with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+        bind_format_selector(ydl)
+        fingerprint = extraction_fingerprint(ydl.params)
+        info = cache.get(url, fingerprint)
+        if info is not None:
+            return info
+        info = ydl.extract_info(url, download=False, process=False)
+        if info is None:
+            return None
+        if info.get('_type', 'video') == 'video':
+            cache.put(url, info, fingerprint)
+            return info
+        return ydl.process_ie_result(info, download=False)
+
+
+def playlist_entries(info: Dict[str, Any]) -> Optional[List[Dict[str, Any]]]:
+    """
+    Get the downloadable entries of a flat-extracted playlist.
+
+    @param info: Info dict returned by flat_extract
+    @return: Entries with a URL, or None if the info is not a playlist
+    """
+    if info.get('_type') not in ('playlist', 'multi_video'):
+        return None
+    entries = []
+    for entry in info.get('entries') or []:
+        if not entry:
+            continue
+        url = entry.get('url') or entry.get('webpage_url')
+        if url:
+            entries.append(dict(entry, url=url))
+    return entries
+
+
+def expand_playlist(
+    ui_data: Dict[str, Any], gui: Any, cache: InfoCache = info_cache,
+) -> Optional[List[Dict[str, Any]]]:
+    """
+    Flat-extract a URL and return its playlist entries.
+
+    @param ui_data: UI data snapshot of the job
+    @param gui: Hooks object for logger output
+    @param cache: Extraction cache receiving a single video for its download
+    @return: Entries to download, or None if the URL is a single video
+    """
+    info = flat_extract(ui_data, gui, cache)
+    return playlist_entries(info) if info is not None else None
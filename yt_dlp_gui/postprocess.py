@@ -0,0 +1,291 @@
+"""
+Post-processing stage for yt-dlp GUI.
+yt-dlp runs FFmpeg (merging, audio extraction, embedding) inline after each
+download, leaving the network idle while it transcodes. Download workers hand
+every downloaded file to a separate pool of threads sized to the CPU cores and
+move on to the next job.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import functools
+import os
+import threading
+from collections import deque
+from typing import TYPE_CHECKING, Any, Callable, Deque, Dict, List, Optional, Set
+
+if TYPE_CHECKING:
+    import yt_dlp
+
+
+def default_post_workers() -> int:
+    """
+    Get the default size of the post-processing pool.
+
+    @return: Number of CPU cores available to this process
+    """
+    try:
+        return max(1, len(os.sched_getaffinity(0)))
+    except (AttributeError, OSError):
+        return max(1, os.cpu_count() or 1)
+
+
+class PostStage:
+    """
+    Pool of threads running post-processing tasks in submission order.
+    Workers are started on demand, up to max_workers.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None) -> None:
+        """
+        Initialize the stage.
+
+        @param max_workers: Tasks running at the same time, defaults to the CPU cores
+        """
+        self.max_workers = max(1, int(max_workers or default_post_workers()))
+        self.active = 0
+        self._tasks: Deque[Callable[[], None]] = deque()
+        self._workers: List[threading.Thread] = []
+        self._cond = threading.Condition()
+        self._closed = False
+
+    def submit(self, task: Callable[[], None]) -> None:
+        """
+        Queue a task. After shutdown() it runs in the calling thread instead.
+
+        @param task: Callable taking no arguments
+        """
+        with self._cond:
+            if not self._closed:
+                self._tasks.append(task)
+                while len(self._workers) < min(self.max_workers, len(self._tasks) + self.active):
+                    worker = threading.Thread(target=self._worker_loop, daemon=True)
+                    self._workers.append(worker)
+                    worker.start()
+                self._cond.notify()
+                return
+        self._run(task)
+
+    def depth(self) -> Dict[str, int]:
+        """Count running and waiting tasks."""
+        with self._cond:
+            return {'active': self.active, 'queued': len(self._tasks)}
+
+    def shutdown(self) -> None:
+        """Drop waiting tasks and let idle workers exit."""
+        with self._cond:
+            self._closed = True
+            self._tasks.clear()
+            self._cond.notify_all()
+
+    def _worker_loop(self) -> None:
+        """Run tasks until the stage closes."""
+        me = threading.current_thread()
+        while True:
+            with self._cond:
+                while not self._tasks and not self._closed:
+                    self._cond.wait()
+                if not self._tasks:
+                    self._workers.remove(me)
+                    return
+                task = self._tasks.popleft()
+                self.active += 1
+            try:
+                self._run(task)
+            finally:
+                with self._cond:
+                    self.active -= 1
+
+    @staticmethod
+    def _run(task: Callable[[], None]) -> None:
+        """Run a task, reporting unexpected errors."""
+        try:
+            task()
+        except Exception as e:
+            print(f'Error in post-processing task: {e}')
+
+
+class PostHandoff:
+    """
+    Stands in for YoutubeDL.post_process and record_download_archive during one job.
+    Files that need post-processors are queued on the stage, one at a time and
+    in download order, since they share the instance's post-processors. A video
+    is added to the download archive only after its files were post-processed
+    successfully. The job's YoutubeDL stays borrowed (so its log lines still
+    reach the job) until the last of them is done.
+    """
+
+    def __init__(self, stage: PostStage, ydl: 'yt_dlp.YoutubeDL') -> None:
+        """
+        Route the instance's post-processing to the stage.
+
+        @param stage: Stage running the deferred post-processing
+        @param ydl: YoutubeDL borrowed by the job
+        """
+        self.stage = stage
+        self.ydl = ydl
+        self.errors: List[str] = []
+        self._cond = threading.Condition()
+        self._submitted = 0
+        self._pending = 0
+        self._queued: Deque[Callable[[], None]] = deque()
+        self._running = False
+        self._failed_ids: Set[str] = set()
+        self._release: Optional[contextlib.ExitStack] = None
+        self._releasing = False
+        self._finished = False
+        self._callbacks: List[Callable[[Optional[str]], None]] = []
+        ydl.post_process = self.post_process
+        ydl.record_download_archive = self.record_download_archive
+
+    @property
+    def error(self) -> Optional[str]:
+        """First post-processing error of the job, if any."""
+        with self._cond:
+            return self.errors[0] if self.errors else None
+
+    def post_process(
+        self, filename: str, info: Dict[str, Any], files_to_move: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Queue the post-processing of a downloaded file; called by yt-dlp's process_info.
+        Files without post-processors only have to be moved, which runs inline. So does
+        everything when yt-dlp would use the final file on the download thread right
+        after this returns: post hooks, 'after_video' post-processors, and playlist
+        post-processors, which run once the last entry returns.
+
+        @return: The info dict, updated later in place by the stage
+        """
+        pps = getattr(self.ydl, '_pps', {})
+        if (
+            pps.get('playlist') or pps.get('after_video') or getattr(self.ydl, '_post_hooks', None)
+            or (not info.get('__postprocessors') and not pps.get('post_process'))
+        ):
+            return type(self.ydl).post_process(self.ydl, filename, info, files_to_move)
+        with self._cond:
+            self._submitted += 1
+        self._schedule(functools.partial(self._post_process, filename, info, files_to_move))
+        return info
+
+    def record_download_archive(self, info: Dict[str, Any]) -> None:
+        """
+        Add a video to the download archive once its queued post-processing succeeded;
+        called by yt-dlp's process_video_result after the video's files were handed off.
+
+        @param info: Info dict of the video
+        """
+        with self._cond:
+            deferred = self._pending > 0
+        if deferred:
+            self._schedule(functools.partial(self._record, info))
+        else:
+            self._record(info)
+
+    def _schedule(self, task: Callable[[], None]) -> None:
+        """Queue a task behind the job's earlier ones, submitting it to the stage if none is running."""
+        with self._cond:
+            self._pending += 1
+            if self._running:
+                self._queued.append(task)
+                return
+            self._running = True
+        self.stage.submit(functools.partial(self._run, task))
+
+    def _post_process(self, filename: str, info: Dict[str, Any], files_to_move: Optional[Dict[str, Any]]) -> None:
+        """Run yt-dlp's own post_process, remembering the video if it fails."""
+        try:
+            type(self.ydl).post_process(self.ydl, filename, info, files_to_move)
+        except Exception as e:
+            with self._cond:
+                self.errors.append(f'Postprocessing: {e}')
+                self._failed_ids.add(self.ydl._make_archive_id(info))
+
+    def _record(self, info: Dict[str, Any]) -> None:
+        """Run yt-dlp's own record_download_archive unless the video failed post-processing."""
+        with self._cond:
+            failed = self.ydl._make_archive_id(info) in self._failed_ids
+        if not failed:
+            type(self.ydl).record_download_archive(self.ydl, info)
+
+    def _run(self, task: Callable[[], None]) -> None:
+        """Run one task of the job on a stage thread, then submit the next one."""
+        try:
+            task()
+        except Exception as e:
+            with self._cond:
+                self.errors.append(str(e))
+        finally:
+            with self._cond:
+                self._pending -= 1
+                self._cond.notify_all()
+                following = self._queued.popleft() if self._queued else None
+                self._running = following is not None
+                release = self._take_release()
+            if following is not None:
+                self.stage.submit(functools.partial(self._run, following))
+            if release:
+                self._complete()
+
+    def _take_release(self) -> bool:
+        """Whether the caller should release the job now. Call with the lock held."""
+        if self._pending or self._release is None or self._releasing:
+            return False
+        self._releasing = True
+        return True
+
+    def _uninstall(self) -> None:
+        """Give the instance its own post_process and record_download_archive back."""
+        self.ydl.__dict__.pop('post_process', None)
+        self.ydl.__dict__.pop('record_download_archive', None)
+
+    def detach(self, release: contextlib.ExitStack) -> bool:
+        """
+        End the download part of the job.
+
+        @param release: Exit stack returning the borrowed instance, closed after the last task
+        @return: True if post-processing was deferred and the job must wait for when_done()
+        """
+        self._uninstall()
+        with self._cond:
+            deferred = self._submitted > 0
+            if deferred:
+                self._release = release
+                ready = self._take_release()
+        if not deferred:
+            release.close()
+            return False
+        if ready:
+            self._complete()
+        return True
+
+    def wait(self) -> None:
+        """Block until queued post-processing is done; used when the download fails."""
+        self._uninstall()
+        with self._cond:
+            while self._pending:
+                self._cond.wait()
+
+    def when_done(self, callback: Callable[[Optional[str]], None]) -> None:
+        """
+        Call back with the job's post-processing error (None on success) once every task is done.
+
+        @param callback: Called at once if post-processing already finished
+        """
+        with self._cond:
+            if not self._finished:
+                self._callbacks.append(callback)
+                return
+        callback(self.error)
+
+    def _complete(self) -> None:
+        """Return the borrowed instance and notify the waiting callbacks."""
+        try:
+            self._release.close()
+        except Exception as e:
+            print(f'Error releasing YoutubeDL instance: {e}')
+        with self._cond:
+            self._finished = True
+            callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            callback(self.error)
@@ -0,0 +1,107 @@
+"""
+Metadata prefetch for yt-dlp GUI.
+Extracts a URL in the background while the user is still choosing options,
+and stores the result in the extraction cache for the actual download.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, Optional
+
+from .i18n import _
+from .infocache import InfoCache, extraction_fingerprint, info_cache
+from .lazy import load_yt_dlp
+from .logic import bind_format_selector, build_ydl_opts, describe_selection
+
+
+class _SilentHooks:
+    """Discards logger output and progress of a prefetch."""
+
+    def progress_hook(self, d: Dict[str, Any]) -> None:
+        pass
+
+    def log(self, message: str) -> None:
+        pass
+
+
+def estimate_size(info: Dict[str, Any]) -> Optional[int]:
+    """
+    Estimate the download size of a processed info dict.
+
+    @param info: Info dict after format selection
+    @return: Size in bytes, or None if unknown
+    """
+    formats = info.get('requested_formats') or [info]
+    sizes = [f.get('filesize') or f.get('filesize_approx') for f in formats]
+    if not all(sizes):
+        return None
+    return sum(sizes)
+
+
+def prefetch_info(ui_data: Dict[str, Any], cache: InfoCache = info_cache) -> Optional[Dict[str, Any]]:
+    """
+    Extract a URL without downloading and summarize it.
+    Single videos are cached so that a download of the same URL skips extraction.
+
+    @param ui_data: UI data snapshot; 'video_url' holds the URL
+    @param cache: Extraction cache
+    @return: Summary with 'title', 'duration', 'format_count', 'size', 'plan' and 'playlist',
+             or None if the URL was skipped (e.g. already in the download archive)
+    """
+    yt_dlp = load_yt_dlp()
+
+    url = ui_data['video_url']
+    ydl_opts = build_ydl_opts(ui_data, _SilentHooks())
+    ydl_opts.update({'quiet': True, 'progress_hooks': [], 'postprocessors': []})
+
+    with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+        bind_format_selector(ydl)
+        fingerprint = extraction_fingerprint(ydl.params)
+        info = cache.get(url, fingerprint)
+        if info is None:
+            info = ydl.extract_info(url, download=False, process=False)
+            if info is None:
+                return None
+            cache.put(url, info, fingerprint)
+
+        if info.get('_type', 'video') != 'video':
+            return {
+                'title': info.get('title'), 'duration': None, 'format_count': 0, 'size': None, 'plan': None,
+                'playlist': True,
+            }
+
+        format_count = len(info.get('formats') or [])
+        # Format selection on a copy gives the size of what the current options would download
+        processed = ydl.process_ie_result(cache.get(url, fingerprint) or info, download=False)
+
+    return {
+        'title': info.get('title'),
+        'duration': info.get('duration'),
+        'format_count': format_count,
+        'size': estimate_size(processed or {}),
+        'plan': describe_selection(processed or {}),
+        'playlist': False,
+    }
+
+
+def format_summary(summary: Dict[str, Any]) -> str:
+    """
+    Format a prefetch summary for display below the URL entry.
+
+    @param summary: Result of prefetch_info
+    @return: One-line description
+    """
+    load_yt_dlp()
+    from yt_dlp.utils import format_bytes, formatSeconds
+
+    title = summary.get('title') or _('Untitled')
+    if summary.get('playlist'):
+        return _('Playlist: {}').format(title)
+    parts = [title]
+    if summary.get('duration'):
+        parts.append(formatSeconds(summary['duration']))
+    if summary.get('format_count'):
+        parts.append(_('{} formats').format(summary['format_count']))
+    if summary.get('size'):
+        parts.append('~' + format_bytes(summary['size']))
+    return '  •  '.join(parts)
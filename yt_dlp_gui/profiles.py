@@ -0,0 +1,162 @@
+"""
+Option profiles for yt-dlp GUI.
+A profile is a named, frozen set of tab settings (format, network, filters,
+post-processing, advanced). Profiles are saved next to the config file and can
+be chosen per job.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+from typing import Any, Dict, Iterator, List, Optional
+
+from .config import get_config_path
+from .logic import JOB_FIELDS, compile_ydl_opts, freeze_ui_data
+
+PROFILES_NAME = 'yt-dlp-gui-profiles.json'
+
+
+def get_profiles_path() -> str:
+    """
+    Get the absolute path to the profiles file.
+
+    @return: Path in the same directory as the config file
+    """
+    return os.path.join(os.path.dirname(get_config_path()), PROFILES_NAME)
+
+
+class OptionProfile:
+    """
+    Immutable, hashable set of option values.
+    Applying a profile to a job only overlays its values on the job's UI data;
+    the compiled yt-dlp options are shared through build_ydl_opts' cache.
+    """
+
+    __slots__ = ('name', '_items', '_hash')
+
+    def __init__(self, name: str, settings: Dict[str, Any]) -> None:
+        """
+        Freeze a profile.
+
+        @param name: Display name
+        @param settings: Tab settings; per-job fields such as the URL are dropped
+        """
+        items = freeze_ui_data({k: v for k, v in settings.items() if k not in JOB_FIELDS})
+        object.__setattr__(self, 'name', name)
+        object.__setattr__(self, '_items', items)
+        object.__setattr__(self, '_hash', hash((name, items)))
+
+    def __setattr__(self, key: str, value: Any) -> None:
+        raise AttributeError('OptionProfile is immutable')
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, OptionProfile) and (self.name, self._items) == (other.name, other._items)
+
+    def __repr__(self) -> str:
+        return f'OptionProfile({self.name!r})'
+
+    @property
+    def settings(self) -> Dict[str, Any]:
+        """The profile values as a new dictionary."""
+        return dict(self._items)
+
+    def apply(self, ui_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Overlay the profile on a job's UI data.
+
+        @param ui_data: Job UI data (URL, output directory, config values)
+        @return: New UI data dictionary with 'profile' set to the profile name
+        """
+        data = dict(ui_data)
+        data.update(self._items)
+        data['profile'] = self.name
+        return data
+
+    def validate(self) -> Optional[str]:
+        """
+        Compile the profile once to surface invalid values before jobs are queued.
+
+        @return: Error message, or None if the options compile
+        """
+        try:
+            compile_ydl_opts(self.settings)
+        except Exception as e:
+            return str(e)
+        return None
+
+
+class ProfileStore:
+    """
+    Named profiles persisted as JSON next to the config file.
+    """
+
+    def __init__(self, path: Optional[str] = None) -> None:
+        """
+        Load profiles from disk.
+
+        @param path: Profiles file, defaults to get_profiles_path()
+        """
+        self.path = path or get_profiles_path()
+        self._lock = threading.Lock()
+        self._profiles: Dict[str, OptionProfile] = {}
+        self.load()
+
+    def load(self) -> None:
+        """(Re)read the profiles file; a missing or broken file gives an empty store."""
+        profiles = {}
+        if os.path.exists(self.path):
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    for name, settings in json.load(f).items():
+                        profiles[name] = OptionProfile(name, settings)
+            except Exception as e:
+                print(f'Error loading profiles: {e}')
+        with self._lock:
+            self._profiles = profiles
+
+    def save(self) -> None:
+        """Write all profiles to disk."""
+        with self._lock:
+            data = {name: profile.settings for name, profile in self._profiles.items()}
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            with open(self.path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=4, ensure_ascii=False, default=str)
+        except Exception as e:
+            print(f'Error saving profiles: {e}')
+
+    def get(self, name: str) -> Optional[OptionProfile]:
+        """Get a profile by name."""
+        with self._lock:
+            return self._profiles.get(name)
+
+    def put(self, profile: OptionProfile) -> None:
+        """Add or replace a profile and save the store."""
+        with self._lock:
+            self._profiles[profile.name] = profile
+        self.save()
+
+    def remove(self, name: str) -> None:
+        """Delete a profile and save the store."""
+        with self._lock:
+            removed = self._profiles.pop(name, None)
+        if removed is not None:
+            self.save()
+
+    def names(self) -> List[str]:
+        """Profile names in alphabetical order."""
+        with self._lock:
+            return sorted(self._profiles)
+
+    def __iter__(self) -> Iterator[OptionProfile]:
+        with self._lock:
+            return iter(list(self._profiles.values()))
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._profiles)
@@ -0,0 +1,283 @@
+"""
+Local job API for yt-dlp GUI.
+A loopback HTTP/JSON server in front of the download queue:
+
+    POST /jobs          {"url": ..., "urls": [...], "profile": ..., "options": {...}}
+    GET  /jobs          queue state
+    GET  /jobs/<id>     one job
+    GET  /events        newline-delimited JSON event stream
+
+Every request needs an "Authorization: Bearer <token>" header, with the token
+from the api token file next to the configuration file.
+"""
+
+from __future__ import annotations
+
+import hmac
+import json
+import os
+import secrets
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional
+
+from .config import get_config_path
+from .defaults import TAB_DEFAULTS
+from .events import EventChannel, event_record
+from .jobs import DownloadQueue, Job
+from .profiles import ProfileStore
+
+DEFAULT_PORT = 8765
+LOOPBACK_HOSTS = ('127.0.0.1', 'localhost', '[::1]')
+
+# Seconds between two writes of the event stream
+STREAM_INTERVAL = 0.5
+
+API_TOKEN_NAME = 'yt-dlp-gui-api-token'
+
+# Tab options a request may override; the rest (paths, tools, extra arguments) stay local
+API_OPTIONS = frozenset(TAB_DEFAULTS) - {'extra_args', 'custom_template', 'custom_template_active'}
+
+
+def get_api_token_path() -> str:
+    """
+    Get the path of the API token file, next to the configuration file.
+
+    @return: Absolute path to the token file
+    """
+    return os.path.join(os.path.dirname(get_config_path()), API_TOKEN_NAME)
+
+
+def load_api_token(path: Optional[str] = None) -> str:
+    """
+    Read the API token, creating the file readable by the current user only if missing.
+
+    @param path: Token file, defaults to get_api_token_path()
+    @return: The token
+    """
+    path = path or get_api_token_path()
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            token = f.read().strip()
+        if token:
+            return token
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+    token = secrets.token_urlsafe(32)
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    with os.fdopen(fd, 'w', encoding='utf-8') as f:
+        f.write(token + '\n')
+    return token
+
+
+def job_record(job: Job) -> Dict[str, Any]:
+    """
+    Describe a job for API responses.
+
+    @param job: Job to describe
+    @return: JSON-serializable dictionary
+    """
+    return {
+        'id': job.id, 'url': job.url, 'status': job.status, 'progress': round(job.progress, 1),
+        'downloaded_bytes': job.downloaded_bytes, 'title': job.title, 'filename': job.filename,
+        'error': job.error, 'parent': job.parent_id, 'profile': job.ui_data.get('profile'),
+    }
+
+
+class _ApiHandler(BaseHTTPRequestHandler):
+    """Request handler; the owning ApiServer is reachable as self.server.api."""
+
+    server: '_ApiHTTPServer'
+
+    def log_message(self, format: str, *args: Any) -> None:
+        # Requests are not logged; the GUI log would fill up with event-stream polls
+        pass
+
+    def _send_json(self, status: int, payload: Any) -> None:
+        body = json.dumps(payload, ensure_ascii=False, default=str).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _check_host(self) -> bool:
+        # Rejects DNS-rebinding requests that reach the loopback port under a foreign host name
+        host = (self.headers.get('Host') or '').rsplit(':', 1)[0]
+        if host not in LOOPBACK_HOSTS:
+            self._send_json(403, {'error': 'forbidden host'})
+            return False
+        return True
+
+    def _check_auth(self) -> bool:
+        # Other local users and processes can reach the port too
+        expected = f'Bearer {self.server.api.token}'.encode('utf-8')
+        given = (self.headers.get('Authorization') or '').encode('utf-8')
+        if not hmac.compare_digest(given, expected):
+            body = json.dumps({'error': 'missing or invalid token'}).encode('utf-8')
+            self.send_response(401)
+            self.send_header('WWW-Authenticate', 'Bearer')
+            self.send_header('Content-Type', 'application/json; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            return False
+        return True
+
+    def do_GET(self) -> None:
+        if not (self._check_host() and self._check_auth()):
+            return
+        api = self.server.api
+        path = self.path.split('?', 1)[0].rstrip('/')
+        if path == '/jobs':
+            self._send_json(200, {'jobs': api.list_jobs(), 'stats': api.queue.stats(), 'stages': api.queue.depths()})
+        elif path.startswith('/jobs/'):
+            job = api.queue.jobs.get(path[len('/jobs/'):])
+            if job is None:
+                self._send_json(404, {'error': 'unknown job'})
+            else:
+                self._send_json(200, job_record(job))
+        elif path == '/events':
+            self._stream_events()
+        else:
+            self._send_json(404, {'error': 'not found'})
+
+    def do_POST(self) -> None:
+        if not (self._check_host() and self._check_auth()):
+            return
+        if self.path.split('?', 1)[0].rstrip('/') != '/jobs':
+            self._send_json(404, {'error': 'not found'})
+            return
+        # Requiring JSON forces a CORS preflight, so web pages cannot submit jobs
+        if not (self.headers.get('Content-Type') or '').startswith('application/json'):
+            self._send_json(415, {'error': 'expected application/json'})
+            return
+        try:
+            length = int(self.headers.get('Content-Length') or 0)
+            request = json.loads(self.rfile.read(length) or b'{}')
+            jobs = self.server.api.submit(request)
+        except (ValueError, TypeError) as e:
+            self._send_json(400, {'error': str(e)})
+            return
+        self._send_json(201, {'jobs': [job_record(job) for job in jobs]})
+
+    def _stream_events(self) -> None:
+        """Write queue events as JSON lines until the client disconnects or the server stops."""
+        api = self.server.api
+        channel = EventChannel()
+        api.queue.add_listener(channel.put)
+        try:
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/x-ndjson')
+            self.send_header('Cache-Control', 'no-cache')
+            self.end_headers()
+            while not api.stopping.is_set():
+                lines = [json.dumps(event_record(*event), ensure_ascii=False, default=str) for event in channel.drain()]
+                if lines:
+                    self.wfile.write(('\n'.join(lines) + '\n').encode('utf-8'))
+                    self.wfile.flush()
+                api.stopping.wait(STREAM_INTERVAL)
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+        finally:
+            api.queue.remove_listener(channel.put)
+
+
+class _ApiHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    api: 'ApiServer'
+
+
+class ApiServer:
+    """
+    Loopback HTTP server submitting jobs to a DownloadQueue.
+    Jobs are built from base_ui_data() like the GUI's own downloads.
+    """
+
+    def __init__(
+        self,
+        download_queue: DownloadQueue,
+        base_ui_data: Callable[[], Dict[str, Any]],
+        profiles: Optional[ProfileStore] = None,
+        port: int = DEFAULT_PORT,
+        token: Optional[str] = None,
+    ) -> None:
+        """
+        Initialize the server (not started yet).
+
+        @param download_queue: Queue receiving the jobs
+        @param base_ui_data: Returns the UI data new jobs start from
+        @param profiles: Store for the 'profile' field of requests
+        @param port: TCP port on 127.0.0.1; 0 picks a free port
+        @param token: Bearer token clients must send, defaults to the token file's
+        """
+        self.queue = download_queue
+        self.base_ui_data = base_ui_data
+        self.profiles = profiles
+        self.port = port
+        self.token = token or load_api_token()
+        self.stopping = threading.Event()
+        self._httpd: Optional[_ApiHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Bind the port and serve in a background thread."""
+        self.stopping.clear()
+        self._httpd = _ApiHTTPServer(('127.0.0.1', self.port), _ApiHandler)
+        self._httpd.api = self
+        self.port = self._httpd.server_address[1]
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name='api-server', daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop serving and close open event streams."""
+        self.stopping.set()
+        if self._httpd is not None:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._httpd = None
+
+    def list_jobs(self) -> List[Dict[str, Any]]:
+        """Describe every job of the queue, oldest first."""
+        return [job_record(job) for job in self.queue.snapshot()]
+
+    def submit(self, request: Dict[str, Any]) -> List[Job]:
+        """
+        Queue the URLs of a request.
+
+        Only tab options listed in API_OPTIONS can be overridden, and URLs are never read
+        as local batch files.
+
+        @param request: Decoded JSON body with 'url' or 'urls', optional 'profile' and 'options'
+        @return: The queued jobs
+        """
+        if not isinstance(request, dict):
+            raise ValueError('request body must be a JSON object')
+        urls = list(request.get('urls') or [])
+        if request.get('url'):
+            urls.insert(0, request['url'])
+        if not urls or not all(isinstance(url, str) and url.strip() for url in urls):
+            raise ValueError("'url' or 'urls' must name at least one URL")
+        if any(url.strip().lower().startswith('file:') for url in urls):
+            raise ValueError('local files cannot be downloaded through the API')
+
+        ui_data = self.base_ui_data()
+        profile_name = request.get('profile')
+        if profile_name:
+            profile = self.profiles.get(profile_name) if self.profiles is not None else None
+            if profile is None:
+                raise ValueError(f'unknown profile {profile_name!r}')
+            ui_data = profile.apply(ui_data)
+        options = request.get('options') or {}
+        if not isinstance(options, dict):
+            raise ValueError("'options' must be a JSON object")
+        rejected = sorted(key for key in options if key not in API_OPTIONS)
+        if rejected:
+            raise ValueError(f'options not allowed through the API: {", ".join(rejected)}')
+        ui_data.update(options)
+
+        jobs: List[Job] = []
+        for url in urls:
+            jobs.extend(self.queue.submit(dict(ui_data, video_url=url.strip()), batch_files=False))
+        return jobs
@@ -4,13 +4,19 @@ Allows users to configure global settings like output directory and language.
 """
 
 import os
+import threading
 import tkinter as tk
 from tkinter import filedialog, ttk
-from typing import Any, Callable, Dict
+from typing import Any, Callable, Dict, Optional
 
 from .i18n import LANGUAGES, _
+from .toolcache import tool_cache
+from .tuning import DEFAULT_MAX_FRAGMENTS, FRAGMENTS_LIMIT
 from .widgets import ModernButton, SecondaryButton
 
+# Delay after the last keystroke in the FFmpeg location before it is probed
+DETECT_DELAY_MS = 400
+
 
 class SettingsWindow(tk.Toplevel):
     """
@@ -44,10 +50,11 @@ class SettingsWindow(tk.Toplevel):
         self.configure(bg='#2d2d2d')
 
         self.callback = callback
-        self.result = current_config.copy()
 
         self.transient(parent)
         self.grab_set()
+        # Closing only hides the window; the app shows it again on the next open
+        self.protocol('WM_DELETE_WINDOW', self.hide)
 
         # Notebook for categorized settings
         self.notebook = ttk.Notebook(self)
@@ -59,29 +66,31 @@ class SettingsWindow(tk.Toplevel):
 
         # Language
         ttk.Label(self.tab_general, text=_('Language:')).pack(anchor=tk.W, pady=(0, 5))
-        self.lang_var = tk.StringVar(value=self.result.get('language', 'en'))
-        lang_combo = ttk.Combobox(self.tab_general, state='readonly')
-        lang_combo['values'] = list(LANGUAGES.values())
+        self.lang_var = tk.StringVar()
+        self.lang_combo = ttk.Combobox(self.tab_general, state='readonly')
+        self.lang_combo['values'] = list(LANGUAGES.values())
         rev_lang_map = {v: k for k, v in LANGUAGES.items()}
-        lang_combo.set(LANGUAGES.get(self.lang_var.get(), 'English'))
-        lang_combo.bind('<<ComboboxSelected>>', lambda _: self.lang_var.set(rev_lang_map.get(lang_combo.get(), 'en')))
-        lang_combo.pack(fill=tk.X, pady=(0, 15))
+        self.lang_combo.bind(
+            '<<ComboboxSelected>>', lambda _: self.lang_var.set(rev_lang_map.get(self.lang_combo.get(), 'en')),
+        )
+        self.lang_combo.pack(fill=tk.X, pady=(0, 15))
 
         # Theme
         ttk.Label(self.tab_general, text=_('Theme:')).pack(anchor=tk.W, pady=(0, 5))
-        self.theme_var = tk.StringVar(value=self.result.get('theme', 'dark'))
-        theme_map = {'dark': _('Dark'), 'light': _('Light')}
-        rev_theme_map = {v: k for k, v in theme_map.items()}
-        theme_combo = ttk.Combobox(self.tab_general, state='readonly', values=list(theme_map.values()))
-        theme_combo.set(theme_map.get(self.theme_var.get(), _('Dark')))
-        theme_combo.bind('<<ComboboxSelected>>', lambda _: self.theme_var.set(rev_theme_map.get(theme_combo.get(), 'dark')))
-        theme_combo.pack(fill=tk.X, pady=(0, 15))
+        self.theme_var = tk.StringVar()
+        self.theme_map = {'dark': _('Dark'), 'light': _('Light')}
+        rev_theme_map = {v: k for k, v in self.theme_map.items()}
+        self.theme_combo = ttk.Combobox(self.tab_general, state='readonly', values=list(self.theme_map.values()))
+        self.theme_combo.bind(
+            '<<ComboboxSelected>>', lambda _: self.theme_var.set(rev_theme_map.get(self.theme_combo.get(), 'dark')),
+        )
+        self.theme_combo.pack(fill=tk.X, pady=(0, 15))
 
         # Output Directory
         ttk.Label(self.tab_general, text=_('Output Directory:')).pack(anchor=tk.W, pady=(0, 5))
         path_frame = ttk.Frame(self.tab_general)
         path_frame.pack(fill=tk.X, pady=(0, 15))
-        self.path_var = tk.StringVar(value=self.result.get('output_dir', os.getcwd()))
+        self.path_var = tk.StringVar()
         tk.Entry(
             path_frame, textvariable=self.path_var, bg='#3e3e3e', fg='white',
             insertbackground='white', relief=tk.FLAT, font=('Segoe UI', 10),
@@ -92,7 +101,7 @@ class SettingsWindow(tk.Toplevel):
         ttk.Label(self.tab_general, text=_('Cookies File:')).pack(anchor=tk.W, pady=(0, 5))
         cookies_frame = ttk.Frame(self.tab_general)
         cookies_frame.pack(fill=tk.X, pady=(0, 15))
-        self.cookies_var = tk.StringVar(value=self.result.get('cookies_path', ''))
+        self.cookies_var = tk.StringVar()
         tk.Entry(
             cookies_frame, textvariable=self.cookies_var, bg='#3e3e3e', fg='white',
             insertbackground='white', relief=tk.FLAT, font=('Segoe UI', 10),
@@ -101,12 +110,52 @@ class SettingsWindow(tk.Toplevel):
 
         # Proxy
         ttk.Label(self.tab_general, text=_('Proxy URL:')).pack(anchor=tk.W, pady=(0, 5))
-        self.proxy_var = tk.StringVar(value=self.result.get('proxy_url', ''))
+        self.proxy_var = tk.StringVar()
         tk.Entry(
             self.tab_general, textvariable=self.proxy_var, bg='#3e3e3e', fg='white',
             insertbackground='white', relief=tk.FLAT, font=('Segoe UI', 10),
         ).pack(fill=tk.X, pady=(0, 15), ipady=5)
 
+        # Concurrent Downloads
+        ttk.Label(self.tab_general, text=_('Concurrent Downloads:')).pack(anchor=tk.W, pady=(0, 5))
+        self.workers_var = tk.StringVar()
+        tk.Spinbox(
+            self.tab_general, from_=1, to=16, textvariable=self.workers_var, bg='#3e3e3e', fg='white',
+            insertbackground='white', buttonbackground='#4e4e4e', relief=tk.FLAT, font=('Segoe UI', 10),
+        ).pack(fill=tk.X, pady=(0, 15), ipady=5)
+
+        # Global Bandwidth Limit
+        ttk.Label(self.tab_general, text=_('Total Bandwidth Limit (e.g. 10M):')).pack(anchor=tk.W, pady=(0, 5))
+        self.global_rate_var = tk.StringVar()
+        tk.Entry(
+            self.tab_general, textvariable=self.global_rate_var, bg='#3e3e3e', fg='white',
+            insertbackground='white', relief=tk.FLAT, font=('Segoe UI', 10),
+        ).pack(fill=tk.X, pady=(0, 15), ipady=5)
+
+        # Download Archive
+        self.archive_var = tk.BooleanVar()
+        ttk.Checkbutton(
+            self.tab_general, text=_('Skip Already Downloaded Videos (Archive)'), variable=self.archive_var,
+        ).pack(anchor=tk.W, pady=(0, 15))
+
+        # Execution Mode
+        ttk.Label(self.tab_general, text=_('Run Downloads In:')).pack(anchor=tk.W, pady=(0, 5))
+        self.mode_var = tk.StringVar()
+        self.mode_map = {'thread': _('Threads'), 'process': _('Worker Processes')}
+        rev_mode_map = {v: k for k, v in self.mode_map.items()}
+        self.mode_combo = ttk.Combobox(self.tab_general, state='readonly', values=list(self.mode_map.values()))
+        self.mode_combo.bind(
+            '<<ComboboxSelected>>', lambda _: self.mode_var.set(rev_mode_map.get(self.mode_combo.get(), 'thread')),
+        )
+        self.mode_combo.pack(fill=tk.X, pady=(0, 5))
+        # The post-processing stage and the disk space budget live in this process
+        ttk.Label(
+            self.tab_general, text=_(
+                'Worker processes run post-processing in the download worker, do not reserve disk space '
+                'ahead of downloads, and split the bandwidth limit evenly between the processes.'
+            ), font=('Segoe UI', 9), wraplength=420, justify=tk.LEFT,
+        ).pack(anchor=tk.W, pady=(0, 15))
+
         # --- Tab 2: Tools ---
         self.tab_tools = ttk.Frame(self.notebook, padding=20)
         self.notebook.add(self.tab_tools, text=_('Tools'))
@@ -115,7 +164,7 @@ class SettingsWindow(tk.Toplevel):
         ttk.Label(self.tab_tools, text=_('FFmpeg Location:')).pack(anchor=tk.W, pady=(0, 5))
         ffmpeg_frame = ttk.Frame(self.tab_tools)
         ffmpeg_frame.pack(fill=tk.X, pady=(0, 15))
-        self.ffmpeg_var = tk.StringVar(value=self.result.get('ffmpeg_path', ''))
+        self.ffmpeg_var = tk.StringVar()
         tk.Entry(
             ffmpeg_frame, textvariable=self.ffmpeg_var, bg='#3e3e3e', fg='white',
             insertbackground='white', relief=tk.FLAT, font=('Segoe UI', 10),
@@ -133,30 +182,174 @@ class SettingsWindow(tk.Toplevel):
 
         # Data Sync ID (Moved to Tools or keep in General? Let's put in Tools/Core)
         ttk.Label(self.tab_tools, text=_('Data Sync ID:')).pack(anchor=tk.W, pady=(10, 5))
-        self.sync_var = tk.StringVar(value=self.result.get('data_sync_id', ''))
+        self.sync_var = tk.StringVar()
         tk.Entry(
             self.tab_tools, textvariable=self.sync_var, bg='#3e3e3e', fg='white',
             insertbackground='white', relief=tk.FLAT, font=('Segoe UI', 10),
         ).pack(fill=tk.X, pady=(0, 15), ipady=5)
 
+        # Log Output
+        ttk.Label(self.tab_tools, text=_('Log Line Limit:')).pack(anchor=tk.W, pady=(0, 5))
+        self.log_lines_var = tk.StringVar()
+        tk.Spinbox(
+            self.tab_tools, from_=100, to=100000, increment=500, textvariable=self.log_lines_var, bg='#3e3e3e',
+            fg='white', insertbackground='white', buttonbackground='#4e4e4e', relief=tk.FLAT, font=('Segoe UI', 10),
+        ).pack(fill=tk.X, pady=(0, 15), ipady=5)
+        self.log_file_var = tk.BooleanVar()
+        ttk.Checkbutton(
+            self.tab_tools, text=_('Save Full Log to File'), variable=self.log_file_var,
+        ).pack(anchor=tk.W, pady=(0, 15))
+
+        # Local API
+        self.api_var = tk.BooleanVar()
+        ttk.Checkbutton(
+            self.tab_tools, text=_('Enable Local Job API (127.0.0.1)'), variable=self.api_var,
+        ).pack(anchor=tk.W, pady=(0, 5))
+        ttk.Label(self.tab_tools, text=_('API Port:')).pack(anchor=tk.W, pady=(0, 5))
+        self.api_port_var = tk.StringVar()
+        tk.Entry(
+            self.tab_tools, textvariable=self.api_port_var, bg='#3e3e3e', fg='white',
+            insertbackground='white', relief=tk.FLAT, font=('Segoe UI', 10),
+        ).pack(fill=tk.X, pady=(0, 15), ipady=5)
+
+        # --- Tab 3: Performance ---
+        self.tab_perf = ttk.Frame(self.notebook, padding=20)
+        self.notebook.add(self.tab_perf, text=_('Performance'))
+
+        # Adaptive Fragment Downloads
+        self.adaptive_var = tk.BooleanVar()
+        ttk.Checkbutton(
+            self.tab_perf, text=_('Adaptive Fragment Downloads'), variable=self.adaptive_var,
+        ).pack(anchor=tk.W, pady=(0, 15))
+        ttk.Label(self.tab_perf, text=_('Max Concurrent Fragments:')).pack(anchor=tk.W, pady=(0, 5))
+        self.max_fragments_var = tk.StringVar()
+        tk.Spinbox(
+            self.tab_perf, from_=1, to=FRAGMENTS_LIMIT, textvariable=self.max_fragments_var, bg='#3e3e3e', fg='white',
+            insertbackground='white', buttonbackground='#4e4e4e', relief=tk.FLAT, font=('Segoe UI', 10),
+        ).pack(fill=tk.X, pady=(0, 15), ipady=5)
+        ttk.Label(self.tab_perf, text=_('Max Chunk Size (e.g. 10M):')).pack(anchor=tk.W, pady=(0, 5))
+        self.max_chunk_var = tk.StringVar()
+        tk.Entry(
+            self.tab_perf, textvariable=self.max_chunk_var, bg='#3e3e3e', fg='white',
+            insertbackground='white', relief=tk.FLAT, font=('Segoe UI', 10),
+        ).pack(fill=tk.X, pady=(0, 15), ipady=5)
+
+        # Staging Folder
+        ttk.Label(self.tab_perf, text=_('Staging Folder (local disk, optional):')).pack(anchor=tk.W, pady=(0, 5))
+        staging_frame = ttk.Frame(self.tab_perf)
+        staging_frame.pack(fill=tk.X, pady=(0, 15))
+        self.staging_var = tk.StringVar()
+        tk.Entry(
+            staging_frame, textvariable=self.staging_var, bg='#3e3e3e', fg='white',
+            insertbackground='white', relief=tk.FLAT, font=('Segoe UI', 10),
+        ).pack(side=tk.LEFT, fill=tk.X, expand=True, ipady=5)
+        SecondaryButton(staging_frame, text=_('Browse'), command=self.browse_staging).pack(side=tk.RIGHT, padx=(10, 0))
+
         # Bottom Buttons
         btn_frame = ttk.Frame(self)
         btn_frame.pack(fill=tk.X, padx=20, pady=20)
         ModernButton(btn_frame, text=_('Save Settings'), command=self.save, width=15, pady=8, font=('Segoe UI', 10, 'bold')).pack(side=tk.RIGHT, padx=5)
-        SecondaryButton(btn_frame, text=_('Cancel'), command=self.destroy, width=10, pady=8, font=('Segoe UI', 10, 'bold'), padx=20).pack(side=tk.RIGHT, padx=5)
+        SecondaryButton(btn_frame, text=_('Cancel'), command=self.hide, width=10, pady=8, font=('Segoe UI', 10, 'bold'), padx=20).pack(side=tk.RIGHT, padx=5)
+
+        # Initial values and detection
+        self._detect_after: Optional[str] = None
+        self.load(current_config)
+        self.update_tool_info()
+        self.ffmpeg_var.trace_add('write', self._on_ffmpeg_changed)
+
+    def load(self, config: Dict[str, Any]) -> None:
+        """
+        Fill every field from a configuration.
 
-        # Initial detection
+        @param config: Configuration dictionary
+        """
+        self.result = config.copy()
+        self.lang_var.set(self.result.get('language', 'en'))
+        self.lang_combo.set(LANGUAGES.get(self.lang_var.get(), 'English'))
+        self.theme_var.set(self.result.get('theme', 'dark'))
+        self.theme_combo.set(self.theme_map.get(self.theme_var.get(), _('Dark')))
+        self.path_var.set(self.result.get('output_dir', os.getcwd()))
+        self.cookies_var.set(self.result.get('cookies_path', ''))
+        self.proxy_var.set(self.result.get('proxy_url', ''))
+        self.workers_var.set(str(self.result.get('max_concurrent_downloads', 3)))
+        self.global_rate_var.set(self.result.get('global_rate_limit', ''))
+        self.archive_var.set(self.result.get('use_archive', False))
+        self.mode_var.set(self.result.get('execution_mode', 'thread'))
+        self.mode_combo.set(self.mode_map.get(self.mode_var.get(), _('Threads')))
+        self.ffmpeg_var.set(self.result.get('ffmpeg_path', ''))
+        self.sync_var.set(self.result.get('data_sync_id', ''))
+        self.log_lines_var.set(str(self.result.get('log_max_lines', 5000)))
+        self.log_file_var.set(self.result.get('log_to_file', False))
+        self.api_var.set(self.result.get('api_enabled', False))
+        self.api_port_var.set(str(self.result.get('api_port', 8765)))
+        self.adaptive_var.set(self.result.get('adaptive_fragments', False))
+        self.max_fragments_var.set(str(self.result.get('max_fragments', DEFAULT_MAX_FRAGMENTS)))
+        self.max_chunk_var.set(self.result.get('max_chunk_size', '10M'))
+        self.staging_var.set(self.result.get('staging_dir', ''))
+
+    def show(self, config: Dict[str, Any]) -> None:
+        """
+        Show the hidden window again with the fields reset to a configuration.
+
+        @param config: Current configuration dictionary
+        """
+        self.load(config)
         self.update_tool_info()
-        self.ffmpeg_var.trace_add('write', lambda *_: self.update_tool_info())
+        self.deiconify()
+        self.lift()
+        self.grab_set()
+        self.focus_set()
+
+    def hide(self) -> None:
+        """Hide the window without destroying it."""
+        if self._detect_after is not None:
+            self.after_cancel(self._detect_after)
+            self._detect_after = None
+        self.grab_release()
+        self.withdraw()
+
+    def _on_ffmpeg_changed(self, *_args: Any) -> None:
+        """Restart the detection timer whenever the FFmpeg location is edited."""
+        if self._detect_after is not None:
+            self.after_cancel(self._detect_after)
+        self._detect_after = self.after(DETECT_DELAY_MS, self.update_tool_info)
 
     def update_tool_info(self) -> None:
-        """Update detection labels for ffmpeg/ffprobe."""
-        from .logic import ExecutablePicker
-        info = ExecutablePicker.detect_ffmpeg(self.ffmpeg_var.get())
-        
+        """Update detection labels for ffmpeg/ffprobe; probing runs in the background."""
+        if self._detect_after is not None:
+            self.after_cancel(self._detect_after)
+            self._detect_after = None
+        path = self.ffmpeg_var.get()
+        # Show the last known result until the cache has been revalidated
+        cached = tool_cache.peek_ffmpeg(path)
+        if cached is not None:
+            self._show_tool_info(path, cached)
+        else:
+            detecting = _('Detecting...')
+            self.ffmpeg_status_label.config(text=_('FFmpeg Status: {}').format(detecting))
+            self.ffprobe_status_label.config(text=_('FFprobe Status: {}').format(detecting))
+        threading.Thread(target=self._detect_ffmpeg, args=(path,), daemon=True).start()
+
+    def _detect_ffmpeg(self, path: str) -> None:
+        """Worker thread: revalidate the FFmpeg info and hand it back to the Tk thread."""
+        try:
+            info = tool_cache.ffmpeg_info(path)
+        except Exception as e:
+            print(f'Error detecting FFmpeg: {e}')
+            return
+        try:
+            self.after(0, lambda: self._show_tool_info(path, info))
+        except (RuntimeError, tk.TclError):
+            # The window was closed while probing
+            pass
+
+    def _show_tool_info(self, path: str, info: Dict[str, Any]) -> None:
+        """Show FFmpeg/FFprobe versions, unless the location changed meanwhile."""
+        if not self.winfo_exists() or path != self.ffmpeg_var.get():
+            return
         f_ver = info['version'] or _('Not Found')
         p_ver = info['ffprobe_version'] or _('Not Found')
-        
+
         self.ffmpeg_status_label.config(text=_('FFmpeg Status: {}').format(f_ver))
         self.ffprobe_status_label.config(text=_('FFprobe Status: {}').format(p_ver))
 
@@ -178,8 +371,31 @@ class SettingsWindow(tk.Toplevel):
         if p:
             self.ffmpeg_var.set(p)
 
+    def browse_staging(self) -> None:
+        """Open directory browser for the staging folder."""
+        p = filedialog.askdirectory()
+        if p:
+            self.staging_var.set(p)
+
     def save(self) -> None:
-        """Save settings and close the window."""
+        """Save settings and hide the window."""
+        try:
+            workers = max(1, int(self.workers_var.get()))
+        except ValueError:
+            workers = self.result.get('max_concurrent_downloads', 3)
+        try:
+            log_lines = max(100, int(self.log_lines_var.get()))
+        except ValueError:
+            log_lines = self.result.get('log_max_lines', 5000)
+        try:
+            api_port = min(65535, max(1, int(self.api_port_var.get())))
+        except ValueError:
+            api_port = self.result.get('api_port', 8765)
+        try:
+            max_fragments = min(FRAGMENTS_LIMIT, max(1, int(self.max_fragments_var.get())))
+        except ValueError:
+            max_fragments = self.result.get('max_fragments', DEFAULT_MAX_FRAGMENTS)
+
         self.result.update({
             'language': self.lang_var.get(),
             'theme': self.theme_var.get(),
@@ -188,7 +404,20 @@ class SettingsWindow(tk.Toplevel):
             'data_sync_id': self.sync_var.get(),
             'proxy_url': self.proxy_var.get(),
             'ffmpeg_path': self.ffmpeg_var.get(),
+            'max_concurrent_downloads': workers,
+            'execution_mode': self.mode_var.get(),
+            'global_rate_limit': self.global_rate_var.get().strip(),
+            'use_archive': self.archive_var.get(),
+            'log_max_lines': log_lines,
+            'log_to_file': self.log_file_var.get(),
+            'api_enabled': self.api_var.get(),
+            'api_port': api_port,
+            'adaptive_fragments': self.adaptive_var.get(),
+            'max_fragments': max_fragments,
+            'max_chunk_size': self.max_chunk_var.get().strip(),
+            'staging_dir': self.staging_var.get().strip(),
         })
+        # Hidden first: the callback may destroy the window (e.g. on a language change)
+        self.hide()
         self.callback(self.result)
-        self.destroy()
 
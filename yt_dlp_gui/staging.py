@@ -0,0 +1,151 @@
+"""
+Staging directory support for yt-dlp GUI.
+With a staging folder on fast local storage, each job uses its own subfolder
+there as yt-dlp's temporary path: fragments, merges and post-processing happen
+on local disk, while yt-dlp still checks the output directory for files that
+are already downloaded. Finished files are then moved into the output directory
+atomically, a few at a time, so a slow network share only receives final files.
+"""
+
+from __future__ import annotations
+
+import errno
+import functools
+import os
+import shutil
+import threading
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    import yt_dlp
+
+# Moves to the output directory running at the same time
+MAX_CONCURRENT_MOVES = 2
+
+# Suffix of a file being copied into the output directory, renamed once complete
+MOVING_SUFFIX = '.moving'
+
+_move_slots = threading.BoundedSemaphore(MAX_CONCURRENT_MOVES)
+
+
+def staging_path(ui_data: Dict[str, Any], job_id: str) -> Optional[str]:
+    """
+    Get the staging folder of a job.
+
+    @param ui_data: UI data snapshot of the job
+    @param job_id: Job ID; restored jobs keep theirs and resume their .part files
+    @return: Absolute path, or None if staging is disabled
+    """
+    root = (ui_data.get('staging_dir') or '').strip()
+    if not root:
+        return None
+    return os.path.join(os.path.abspath(root), job_id)
+
+
+def move_file(src: str, dst: str) -> None:
+    """
+    Move a file so that it appears at the destination complete or not at all.
+    A rename on the same filesystem; otherwise a copy next to the destination, then a rename.
+
+    @param src: Source file
+    @param dst: Destination file, replaced if it exists
+    """
+    os.makedirs(os.path.dirname(dst) or '.', exist_ok=True)
+    try:
+        os.replace(src, dst)
+        return
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+    temp = dst + MOVING_SUFFIX
+    try:
+        shutil.copy2(src, temp)
+        os.replace(temp, dst)
+    except BaseException:
+        if os.path.exists(temp):
+            os.remove(temp)
+        raise
+    os.remove(src)
+
+
+def planned_moves(info: Dict[str, Any]) -> Tuple[str, List[Tuple[str, str]]]:
+    """
+    List the moves yt-dlp would make at the end of post-processing, like MoveFilesAfterDownloadPP.
+
+    @param info: Info dict with 'filepath', '__finaldir' and '__files_to_move'
+    @return: (final path of the video, [(source, destination)] for the files to move)
+    """
+    dl_path, dl_name = os.path.split(info['filepath'])
+    final_dir = info.get('__finaldir', dl_path)
+    final_path = os.path.join(final_dir, dl_name)
+    files = dict(info.get('__files_to_move') or {})
+    files[info['filepath']] = final_path
+    moves = []
+    for src, dst in files.items():
+        dst = dst or os.path.join(final_dir, os.path.basename(src))
+        if os.path.abspath(src) != os.path.abspath(dst):
+            moves.append((src, dst))
+    return final_path, moves
+
+
+@functools.lru_cache(maxsize=None)
+def _staging_move_pp_class() -> type:
+    """Define the post-processor class once yt-dlp is loaded."""
+    from yt_dlp.postprocessor.common import PostProcessor
+    from yt_dlp.utils import PostProcessingError
+
+    class StagingMovePP(PostProcessor):
+        """
+        Runs last in the 'post_process' stage and moves the files out of the staging
+        folder itself, so that yt-dlp's own move finds nothing left to do.
+        """
+
+        on_moved: Optional[Callable[[str], None]] = None
+
+        def run(self, info: Dict[str, Any]) -> Tuple[List[str], Dict[str, Any]]:
+            final_path, moves = planned_moves(info)
+            with _move_slots:
+                for src, dst in moves:
+                    if not os.path.exists(src):
+                        self.report_warning(f'File "{src}" cannot be found')
+                        continue
+                    if os.path.exists(dst) and not self.get_param('overwrites', True):
+                        self.report_warning(f'Keeping existing file "{dst}"; "{src}" stays in the staging folder')
+                        continue
+                    self.to_screen(f'Moving file "{src}" to "{dst}"')
+                    try:
+                        move_file(src, dst)
+                    except OSError as e:
+                        raise PostProcessingError(f'Unable to move "{src}" to the output directory: {e}') from e
+            info['filepath'] = final_path
+            info['__files_to_move'] = {}
+            if self.on_moved is not None:
+                self.on_moved(final_path)
+            return [], info
+
+    return StagingMovePP
+
+
+class StagingMove:
+    """
+    Adds the atomic move out of the staging folder to a borrowed YoutubeDL for one job.
+    """
+
+    def __init__(self, ydl: 'yt_dlp.YoutubeDL', on_moved: Optional[Callable[[str], None]] = None) -> None:
+        """
+        Append the move to the instance's 'post_process' stage.
+
+        @param ydl: YoutubeDL borrowed by the job
+        @param on_moved: Optional callable receiving the final path of each video
+        """
+        self.ydl = ydl
+        self.pp = _staging_move_pp_class()(ydl)
+        self.pp.on_moved = on_moved
+        ydl.add_post_processor(self.pp, when='post_process')
+
+    def uninstall(self) -> None:
+        """Remove the move from the instance before it goes back to the pool."""
+        try:
+            self.ydl._pps['post_process'].remove(self.pp)
+        except ValueError:
+            pass
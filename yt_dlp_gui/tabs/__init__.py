@@ -5,7 +5,8 @@ Tabs for yt-dlp GUI.
 from .advanced import AdvancedTab
 from .filters import FiltersTab
 from .general import GeneralTab
+from .lazy import LazyTab
 from .network import NetworkTab
 from .post import PostTab
 
-__all__ = ['GeneralTab', 'NetworkTab', 'FiltersTab', 'PostTab', 'AdvancedTab']
+__all__ = ['GeneralTab', 'NetworkTab', 'FiltersTab', 'PostTab', 'AdvancedTab', 'LazyTab']
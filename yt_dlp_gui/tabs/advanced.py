@@ -2,18 +2,27 @@
 Advanced settings tab for yt-dlp GUI.
 """
 
+import threading
 import tkinter as tk
 from tkinter import ttk
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
+from ..extraargs import extra_args_cache
+from ..defaults import ADVANCED_DEFAULTS
 from ..i18n import _
 
+# Delay after the last keystroke before the extra arguments are parsed
+PARSE_DELAY_MS = 400
+
 
 class AdvancedTab(ttk.Frame):
     """
     Tab for advanced download options.
     """
 
+    # Values of the tab's variables before any edit
+    DEFAULTS = ADVANCED_DEFAULTS
+
     def __init__(self, master: ttk.Notebook, **kwargs: Any) -> None:
         """
         Initialize the Advanced tab.
@@ -26,25 +35,25 @@ class AdvancedTab(ttk.Frame):
         frame.columnconfigure(1, weight=1)
 
         # Basic Advanced
-        self.legacy_ssl_var = tk.BooleanVar()
+        self.legacy_ssl_var = tk.BooleanVar(value=ADVANCED_DEFAULTS['legacy_ssl'])
         self.legacy_ssl_check = ttk.Checkbutton(frame, text=_('Legacy SSL (Fix EOF)'), variable=self.legacy_ssl_var)
         self.legacy_ssl_check.grid(row=0, column=0, columnspan=2, sticky=tk.W, pady=5)
 
-        self.live_start_var = tk.BooleanVar()
+        self.live_start_var = tk.BooleanVar(value=ADVANCED_DEFAULTS['live_start'])
         self.live_start_check = ttk.Checkbutton(frame, text=_('Live From Start'), variable=self.live_start_var)
         self.live_start_check.grid(row=1, column=0, columnspan=2, sticky=tk.W, pady=5)
 
-        self.part_files_var = tk.BooleanVar(value=True)
+        self.part_files_var = tk.BooleanVar(value=ADVANCED_DEFAULTS['part_files'])
         self.part_files_check = ttk.Checkbutton(frame, text=_('Use .part files'), variable=self.part_files_var)
         self.part_files_check.grid(row=2, column=0, columnspan=2, sticky=tk.W, pady=5)
 
-        self.restrict_filenames_var = tk.BooleanVar()
+        self.restrict_filenames_var = tk.BooleanVar(value=ADVANCED_DEFAULTS['restrict_filenames'])
         self.restrict_filenames_check = ttk.Checkbutton(
             frame, text=_('Restrict Filenames (ASCII)'), variable=self.restrict_filenames_var,
         )
         self.restrict_filenames_check.grid(row=3, column=0, columnspan=2, sticky=tk.W, pady=5)
 
-        self.force_overwrite_var = tk.BooleanVar()
+        self.force_overwrite_var = tk.BooleanVar(value=ADVANCED_DEFAULTS['force_overwrite'])
         self.force_overwrite_check = ttk.Checkbutton(
             frame, text=_('Force Overwrite'), variable=self.force_overwrite_var,
         )
@@ -53,7 +62,7 @@ class AdvancedTab(ttk.Frame):
         # Retries
         self.retries_label = ttk.Label(frame, text=_('Retries:'))
         self.retries_label.grid(row=5, column=0, sticky=tk.W, pady=5)
-        self.retries_var = tk.StringVar(value='10')
+        self.retries_var = tk.StringVar(value=ADVANCED_DEFAULTS['retries'])
         tk.Entry(
             frame, textvariable=self.retries_var, bg='#3e3e3e', fg='white', insertbackground='white', relief=tk.FLAT,
         ).grid(row=5, column=1, sticky=tk.EW, padx=10, pady=5, ipady=3)
@@ -61,7 +70,7 @@ class AdvancedTab(ttk.Frame):
         # Wait for video
         self.wait_video_label = ttk.Label(frame, text=_('Wait for Video (seconds):'))
         self.wait_video_label.grid(row=6, column=0, sticky=tk.W, pady=5)
-        self.wait_video_var = tk.StringVar()
+        self.wait_video_var = tk.StringVar(value=ADVANCED_DEFAULTS['wait_video'])
         tk.Entry(
             frame, textvariable=self.wait_video_var, bg='#3e3e3e', fg='white', insertbackground='white', relief=tk.FLAT,
         ).grid(row=6, column=1, sticky=tk.EW, padx=10, pady=5, ipady=3)
@@ -69,11 +78,39 @@ class AdvancedTab(ttk.Frame):
         # Extra Arguments
         self.extra_args_label = ttk.Label(frame, text=_('Extra Arguments (CLI):'))
         self.extra_args_label.grid(row=7, column=0, sticky=tk.W, pady=5)
-        self.extra_args_var = tk.StringVar()
+        self.extra_args_var = tk.StringVar(value=ADVANCED_DEFAULTS['extra_args'])
         tk.Entry(
             frame, textvariable=self.extra_args_var, bg='#3e3e3e', fg='white', insertbackground='white', relief=tk.FLAT,
         ).grid(row=7, column=1, sticky=tk.EW, padx=10, pady=5, ipady=3)
 
+        self.extra_args_error_label = tk.Label(frame, text='', fg='#f48771', bg='#2d2d2d', anchor=tk.W, justify=tk.LEFT)
+        self.extra_args_error_label.grid(row=8, column=1, sticky=tk.EW, padx=10)
+        self._parse_after: Optional[str] = None
+        self.extra_args_var.trace_add('write', self._on_extra_args_changed)
+
+    def _on_extra_args_changed(self, *_args: Any) -> None:
+        """Restart the parse timer whenever the extra arguments are edited."""
+        if self._parse_after is not None:
+            self.after_cancel(self._parse_after)
+        self._parse_after = self.after(PARSE_DELAY_MS, self._start_parse)
+
+    def _start_parse(self) -> None:
+        """Parse the extra arguments in the background; jobs reuse the cached result."""
+        self._parse_after = None
+        raw = self.extra_args_var.get()
+        threading.Thread(target=self._parse, args=(raw,), daemon=True).start()
+
+    def _parse(self, raw: str) -> None:
+        """Worker thread: parse and hand the error (if any) back to the Tk thread."""
+        _opts, error = extra_args_cache.parse(raw)
+        self.after(0, lambda: self._show_parse_error(raw, error))
+
+    def _show_parse_error(self, raw: str, error: Optional[str]) -> None:
+        """Show the parse error below the entry, unless the text changed meanwhile."""
+        if raw != self.extra_args_var.get():
+            return
+        self.extra_args_error_label.config(text=_('Invalid arguments: {}').format(error) if error else '')
+
     def update_texts(self) -> None:
         """Update localized texts."""
         self.legacy_ssl_check.config(text=_('Legacy SSL (Fix EOF)'))
@@ -6,6 +6,7 @@ import tkinter as tk
 from tkinter import ttk
 from typing import Any, Dict
 
+from ..defaults import FILTERS_DEFAULTS
 from ..i18n import _
 
 
@@ -14,6 +15,9 @@ class FiltersTab(ttk.Frame):
     Tab for playlist items and metadata filtering.
     """
 
+    # Values of the tab's variables before any edit
+    DEFAULTS = FILTERS_DEFAULTS
+
     def __init__(self, master: ttk.Notebook, **kwargs: Any) -> None:
         """
         Initialize the Filters tab.
@@ -28,7 +32,7 @@ class FiltersTab(ttk.Frame):
         # Playlist Items
         self.playlist_items_label = ttk.Label(frame, text=_('Playlist Items (e.g. 1,2,5-10):'))
         self.playlist_items_label.grid(row=0, column=0, sticky=tk.W, pady=5)
-        self.playlist_items_var = tk.StringVar()
+        self.playlist_items_var = tk.StringVar(value=FILTERS_DEFAULTS['playlist_items'])
         tk.Entry(
             frame, textvariable=self.playlist_items_var, bg='#3e3e3e', fg='white', insertbackground='white',
             relief=tk.FLAT,
@@ -37,21 +41,21 @@ class FiltersTab(ttk.Frame):
         # Date Filters
         self.date_label = ttk.Label(frame, text=_('Date (YYYYMMDD):'))
         self.date_label.grid(row=1, column=0, sticky=tk.W, pady=5)
-        self.date_var = tk.StringVar()
+        self.date_var = tk.StringVar(value=FILTERS_DEFAULTS['date'])
         tk.Entry(
             frame, textvariable=self.date_var, bg='#3e3e3e', fg='white', insertbackground='white', relief=tk.FLAT,
         ).grid(row=1, column=1, sticky=tk.EW, padx=10, pady=5, ipady=3)
 
         self.datebefore_label = ttk.Label(frame, text=_('Date Before:'))
         self.datebefore_label.grid(row=2, column=0, sticky=tk.W, pady=5)
-        self.datebefore_var = tk.StringVar()
+        self.datebefore_var = tk.StringVar(value=FILTERS_DEFAULTS['datebefore'])
         tk.Entry(
             frame, textvariable=self.datebefore_var, bg='#3e3e3e', fg='white', insertbackground='white', relief=tk.FLAT,
         ).grid(row=2, column=1, sticky=tk.EW, padx=10, pady=5, ipady=3)
 
         self.dateafter_label = ttk.Label(frame, text=_('Date After:'))
         self.dateafter_label.grid(row=3, column=0, sticky=tk.W, pady=5)
-        self.dateafter_var = tk.StringVar()
+        self.dateafter_var = tk.StringVar(value=FILTERS_DEFAULTS['dateafter'])
         tk.Entry(
             frame, textvariable=self.dateafter_var, bg='#3e3e3e', fg='white', insertbackground='white', relief=tk.FLAT,
         ).grid(row=3, column=1, sticky=tk.EW, padx=10, pady=5, ipady=3)
@@ -59,7 +63,7 @@ class FiltersTab(ttk.Frame):
         # Filesize Filters
         self.min_filesize_label = ttk.Label(frame, text=_('Min Filesize (e.g. 50k):'))
         self.min_filesize_label.grid(row=4, column=0, sticky=tk.W, pady=5)
-        self.min_filesize_var = tk.StringVar()
+        self.min_filesize_var = tk.StringVar(value=FILTERS_DEFAULTS['min_filesize'])
         tk.Entry(
             frame, textvariable=self.min_filesize_var, bg='#3e3e3e', fg='white', insertbackground='white',
             relief=tk.FLAT,
@@ -67,7 +71,7 @@ class FiltersTab(ttk.Frame):
 
         self.max_filesize_label = ttk.Label(frame, text=_('Max Filesize (e.g. 50m):'))
         self.max_filesize_label.grid(row=5, column=0, sticky=tk.W, pady=5)
-        self.max_filesize_var = tk.StringVar()
+        self.max_filesize_var = tk.StringVar(value=FILTERS_DEFAULTS['max_filesize'])
         tk.Entry(
             frame, textvariable=self.max_filesize_var, bg='#3e3e3e', fg='white', insertbackground='white',
             relief=tk.FLAT,
@@ -76,12 +80,19 @@ class FiltersTab(ttk.Frame):
         # Match Filters
         self.match_filter_label = ttk.Label(frame, text=_('Match Filter:'))
         self.match_filter_label.grid(row=6, column=0, sticky=tk.W, pady=5)
-        self.match_filter_var = tk.StringVar()
+        self.match_filter_var = tk.StringVar(value=FILTERS_DEFAULTS['match_filter'])
         tk.Entry(
             frame, textvariable=self.match_filter_var, bg='#3e3e3e', fg='white', insertbackground='white',
             relief=tk.FLAT,
         ).grid(row=6, column=1, sticky=tk.EW, padx=10, pady=5, ipady=3)
 
+        # Playlist fan-out
+        self.playlist_parallel_var = tk.BooleanVar(value=FILTERS_DEFAULTS['playlist_parallel'])
+        self.playlist_parallel_check = ttk.Checkbutton(
+            frame, text=_('Download Playlist Entries in Parallel'), variable=self.playlist_parallel_var,
+        )
+        self.playlist_parallel_check.grid(row=7, column=0, columnspan=2, sticky=tk.W, pady=5)
+
     def update_texts(self) -> None:
         """Update localized texts."""
         self.playlist_items_label.config(text=_('Playlist Items (e.g. 1,2,5-10):'))
@@ -91,6 +102,7 @@ class FiltersTab(ttk.Frame):
         self.min_filesize_label.config(text=_('Min Filesize (e.g. 50k):'))
         self.max_filesize_label.config(text=_('Max Filesize (e.g. 50m):'))
         self.match_filter_label.config(text=_('Match Filter:'))
+        self.playlist_parallel_check.config(text=_('Download Playlist Entries in Parallel'))
 
     def get_data(self) -> Dict[str, Any]:
         """Collect tab data."""
@@ -102,4 +114,5 @@ class FiltersTab(ttk.Frame):
             'min_filesize': self.min_filesize_var.get(),
             'max_filesize': self.max_filesize_var.get(),
             'match_filter': self.match_filter_var.get(),
+            'playlist_parallel': self.playlist_parallel_var.get(),
         }
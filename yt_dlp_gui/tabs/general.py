@@ -6,6 +6,7 @@ import tkinter as tk
 from tkinter import ttk
 from typing import Any, Dict
 
+from ..defaults import GENERAL_DEFAULTS
 from ..i18n import _
 
 
@@ -14,6 +15,9 @@ class GeneralTab(ttk.Frame):
     Tab for general download settings.
     """
 
+    # Values of the tab's variables before any edit
+    DEFAULTS = GENERAL_DEFAULTS
+
     def __init__(self, master: ttk.Notebook, **kwargs: Any) -> None:
         """
         Initialize the General tab.
@@ -28,7 +32,7 @@ class GeneralTab(ttk.Frame):
         # Row 0: Format Mode
         self.format_label = ttk.Label(frame, text=_('Format:'))
         self.format_label.grid(row=0, column=0, sticky=tk.W, pady=5)
-        self.format_mode_var = tk.StringVar(value='Video+Audio')
+        self.format_mode_var = tk.StringVar(value=GENERAL_DEFAULTS['format_mode'])
         self.mode_cb = ttk.Combobox(
             frame, textvariable=self.format_mode_var, values=['Video+Audio', 'Audio Only'], state='readonly',
         )
@@ -38,7 +42,7 @@ class GeneralTab(ttk.Frame):
         # Row 1: Video Format
         self.vid_fmt_label = ttk.Label(frame, text=_('Video Extension:'))
         self.vid_fmt_label.grid(row=1, column=0, sticky=tk.W, pady=5)
-        self.video_ext_var = tk.StringVar(value='mp4')
+        self.video_ext_var = tk.StringVar(value=GENERAL_DEFAULTS['video_ext'])
         self.video_ext_cb = ttk.Combobox(
             frame, textvariable=self.video_ext_var, values=['mp4', 'mkv', 'webm'], state='readonly',
         )
@@ -47,46 +51,53 @@ class GeneralTab(ttk.Frame):
         # Row 2: Audio Format
         self.aud_fmt_label = ttk.Label(frame, text=_('Audio Extension:'))
         self.aud_fmt_label.grid(row=2, column=0, sticky=tk.W, pady=5)
-        self.audio_ext_var = tk.StringVar(value='mp3')
+        self.audio_ext_var = tk.StringVar(value=GENERAL_DEFAULTS['audio_ext'])
         self.audio_ext_cb = ttk.Combobox(
-            frame, textvariable=self.audio_ext_var, values=['mp3', 'm4a', 'wav', 'flac', 'best'], state='readonly',
+            frame, textvariable=self.audio_ext_var, values=['mp3', 'm4a', 'opus', 'wav', 'flac', 'best'], state='readonly',
         )
         self.audio_ext_cb.grid(row=2, column=1, sticky=tk.EW, padx=10, pady=5)
 
         # Row 3: Quality
         self.qual_label = ttk.Label(frame, text=_('Quality:'))
         self.qual_label.grid(row=3, column=0, sticky=tk.W, pady=5)
-        self.quality_var = tk.StringVar(value='Best')
+        self.quality_var = tk.StringVar(value=GENERAL_DEFAULTS['quality'])
         self.quality_cb = ttk.Combobox(
             frame, textvariable=self.quality_var,
             values=['Best', '2160p (4K)', '1440p (2K)', '1080p', '720p', '480p'], state='readonly',
         )
         self.quality_cb.grid(row=3, column=1, sticky=tk.EW, padx=10, pady=5)
 
+        # Row 4: Merge avoidance
+        self.avoid_merge_var = tk.BooleanVar(value=GENERAL_DEFAULTS['avoid_merge'])
+        self.avoid_merge_check = ttk.Checkbutton(
+            frame, text=_('Prefer Pre-Merged Formats (Skip FFmpeg Merge)'), variable=self.avoid_merge_var,
+        )
+        self.avoid_merge_check.grid(row=4, column=0, columnspan=2, sticky=tk.W, pady=5)
+
         # Separator
-        ttk.Separator(frame, orient=tk.HORIZONTAL).grid(row=4, column=0, columnspan=2, sticky=tk.EW, pady=15)
+        ttk.Separator(frame, orient=tk.HORIZONTAL).grid(row=5, column=0, columnspan=2, sticky=tk.EW, pady=15)
 
         # Checkboxes
-        self.music_opt_var = tk.BooleanVar()
+        self.music_opt_var = tk.BooleanVar(value=GENERAL_DEFAULTS['music_mode'])
         self.music_opt_check = ttk.Checkbutton(frame, text=_('Music Mode (Optimized)'), variable=self.music_opt_var)
-        self.music_opt_check.grid(row=5, column=0, columnspan=2, sticky=tk.W, pady=5)
+        self.music_opt_check.grid(row=6, column=0, columnspan=2, sticky=tk.W, pady=5)
 
-        self.year_folder_var = tk.BooleanVar(value=True)
+        self.year_folder_var = tk.BooleanVar(value=GENERAL_DEFAULTS['year_folder'])
         self.year_folder_check = ttk.Checkbutton(frame, text=_('Organize by Year'), variable=self.year_folder_var)
-        self.year_folder_check.grid(row=6, column=0, columnspan=2, sticky=tk.W, pady=5)
+        self.year_folder_check.grid(row=7, column=0, columnspan=2, sticky=tk.W, pady=5)
 
         # Custom Template
-        self.custom_tmpl_var = tk.BooleanVar()
+        self.custom_tmpl_var = tk.BooleanVar(value=GENERAL_DEFAULTS['custom_template_active'])
         self.custom_tmpl_check = ttk.Checkbutton(frame, text=_('Custom Output Template:'), variable=self.custom_tmpl_var)
-        self.custom_tmpl_check.grid(row=7, column=0, sticky=tk.W, pady=5)
+        self.custom_tmpl_check.grid(row=8, column=0, sticky=tk.W, pady=5)
         self.custom_tmpl_check.bind('<Button-1>', lambda e: self.root.after(10, self.on_tmpl_toggle))
 
-        self.custom_tmpl_str_var = tk.StringVar(value='%(title)s.%(ext)s')
+        self.custom_tmpl_str_var = tk.StringVar(value=GENERAL_DEFAULTS['custom_template'])
         self.custom_tmpl_entry = tk.Entry(
             frame, textvariable=self.custom_tmpl_str_var, bg='#3e3e3e', fg='white', 
             insertbackground='white', relief=tk.FLAT, state=tk.DISABLED
         )
-        self.custom_tmpl_entry.grid(row=7, column=1, sticky=tk.EW, padx=10, pady=5, ipady=3)
+        self.custom_tmpl_entry.grid(row=8, column=1, sticky=tk.EW, padx=10, pady=5, ipady=3)
 
         self.on_mode_change(None)
 
@@ -96,10 +107,12 @@ class GeneralTab(ttk.Frame):
         if mode == 'Audio Only':
             self.video_ext_cb.configure(state=tk.DISABLED)
             self.quality_cb.configure(state=tk.DISABLED)
+            self.avoid_merge_check.configure(state=tk.DISABLED)
             self.audio_ext_cb.configure(state='readonly')
         else:
             self.video_ext_cb.configure(state='readonly')
             self.quality_cb.configure(state='readonly')
+            self.avoid_merge_check.configure(state=tk.NORMAL)
             self.audio_ext_cb.configure(state=tk.DISABLED)
 
     def on_tmpl_toggle(self, *args: Any) -> None:
@@ -121,6 +134,7 @@ class GeneralTab(ttk.Frame):
         self.vid_fmt_label.config(text=_('Video Extension:'))
         self.aud_fmt_label.config(text=_('Audio Extension:'))
         self.qual_label.config(text=_('Quality:'))
+        self.avoid_merge_check.config(text=_('Prefer Pre-Merged Formats (Skip FFmpeg Merge)'))
         self.music_opt_check.config(text=_('Music Mode (Optimized)'))
         self.year_folder_check.config(text=_('Organize by Year'))
         self.custom_tmpl_check.config(text=_('Custom Output Template:'))
@@ -132,6 +146,7 @@ class GeneralTab(ttk.Frame):
             'video_ext': self.video_ext_var.get(),
             'audio_ext': self.audio_ext_var.get(),
             'quality': self.quality_var.get(),
+            'avoid_merge': self.avoid_merge_var.get(),
             'music_mode': self.music_opt_var.get(),
             'year_folder': self.year_folder_var.get(),
             'custom_template_active': self.custom_tmpl_var.get(),
@@ -0,0 +1,63 @@
+"""
+Lazily built notebook page for yt-dlp GUI.
+"""
+
+import tkinter as tk
+from tkinter import ttk
+from typing import Any, Callable, Dict, Optional, Type
+
+
+class LazyTab(ttk.Frame):
+    """
+    Notebook page that builds its tab the first time it is selected.
+    Until then get_data() returns the tab class's DEFAULTS, which is exactly what
+    the tab reports when built and left untouched.
+    """
+
+    def __init__(
+        self,
+        master: ttk.Notebook,
+        tab_class: Type[ttk.Frame],
+        on_build: Optional[Callable[[ttk.Frame], None]] = None,
+        **kwargs: Any,
+    ) -> None:
+        """
+        Initialize an empty page.
+
+        @param master: Notebook the page is added to
+        @param tab_class: Tab to build, with a DEFAULTS class attribute
+        @param on_build: Called with the tab once it has been built
+        """
+        super().__init__(master, **kwargs)
+        self.tab_class = tab_class
+        self.content: Optional[ttk.Frame] = None
+        self._on_build = on_build
+        master.bind('<<NotebookTabChanged>>', self._on_tab_changed, add='+')
+
+    def _on_tab_changed(self, _event: tk.Event) -> None:
+        """Build the tab when its page becomes the selected one."""
+        if self.content is None and self.master.select() == str(self):
+            self.build()
+
+    def build(self) -> ttk.Frame:
+        """
+        Build the tab if it has not been built yet.
+
+        @return: The tab
+        """
+        if self.content is None:
+            self.content = self.tab_class(self)
+            if self._on_build is not None:
+                self._on_build(self.content)
+        return self.content
+
+    def update_texts(self) -> None:
+        """Update localized texts; an unbuilt tab picks up the language when built."""
+        if self.content is not None:
+            self.content.update_texts()
+
+    def get_data(self) -> Dict[str, Any]:
+        """Collect tab data, falling back to the defaults while the tab is not built."""
+        if self.content is None:
+            return dict(self.tab_class.DEFAULTS)
+        return self.content.get_data()
@@ -6,6 +6,7 @@ import tkinter as tk
 from tkinter import ttk
 from typing import Any, Dict
 
+from ..defaults import NETWORK_DEFAULTS
 from ..i18n import _
 
 
@@ -14,6 +15,9 @@ class NetworkTab(ttk.Frame):
     Tab for network and proxy settings.
     """
 
+    # Values of the tab's variables before any edit
+    DEFAULTS = NETWORK_DEFAULTS
+
     def __init__(self, master: ttk.Notebook, **kwargs: Any) -> None:
         """
         Initialize the Network tab.
@@ -28,7 +32,7 @@ class NetworkTab(ttk.Frame):
         # Browser Cookies
         self.browser_cookies_label = ttk.Label(frame, text=_('Browser Cookies:'))
         self.browser_cookies_label.grid(row=0, column=0, sticky=tk.W, pady=5)
-        self.browser_var = tk.StringVar(value='none')
+        self.browser_var = tk.StringVar(value=NETWORK_DEFAULTS['browser'])
         browsers = ['none', 'chrome', 'firefox', 'edge', 'opera', 'brave', 'vivaldi', 'safari']
         ttk.Combobox(
             frame, textvariable=self.browser_var, values=browsers, state='readonly',
@@ -37,7 +41,7 @@ class NetworkTab(ttk.Frame):
         # User Agent
         self.user_agent_label = ttk.Label(frame, text=_('User Agent:'))
         self.user_agent_label.grid(row=1, column=0, sticky=tk.W, pady=5)
-        self.user_agent_var = tk.StringVar()
+        self.user_agent_var = tk.StringVar(value=NETWORK_DEFAULTS['user_agent'])
         tk.Entry(
             frame, textvariable=self.user_agent_var, bg='#3e3e3e', fg='white', insertbackground='white', relief=tk.FLAT,
         ).grid(row=1, column=1, sticky=tk.EW, padx=10, pady=5, ipady=3)
@@ -45,41 +49,50 @@ class NetworkTab(ttk.Frame):
         # Rate Limit
         self.limit_rate_label = ttk.Label(frame, text=_('Rate Limit (e.g. 5M):'))
         self.limit_rate_label.grid(row=2, column=0, sticky=tk.W, pady=5)
-        self.rate_limit_var = tk.StringVar()
+        self.rate_limit_var = tk.StringVar(value=NETWORK_DEFAULTS['rate_limit'])
         tk.Entry(
             frame, textvariable=self.rate_limit_var, bg='#3e3e3e', fg='white', insertbackground='white', relief=tk.FLAT,
         ).grid(row=2, column=1, sticky=tk.EW, padx=10, pady=5, ipady=3)
 
+        # Bandwidth Priority (share of the global bandwidth limit)
+        self.priority_label = ttk.Label(frame, text=_('Bandwidth Priority:'))
+        self.priority_label.grid(row=3, column=0, sticky=tk.W, pady=5)
+        self.priority_var = tk.StringVar(value=NETWORK_DEFAULTS['bandwidth_priority'])
+        ttk.Combobox(
+            frame, textvariable=self.priority_var, values=['Low', 'Normal', 'High'], state='readonly',
+        ).grid(row=3, column=1, sticky=tk.EW, padx=10, pady=5)
+
         # Socket Timeout
         self.timeout_label = ttk.Label(frame, text=_('Socket Timeout (s):'))
-        self.timeout_label.grid(row=3, column=0, sticky=tk.W, pady=5)
-        self.timeout_var = tk.StringVar()
+        self.timeout_label.grid(row=4, column=0, sticky=tk.W, pady=5)
+        self.timeout_var = tk.StringVar(value=NETWORK_DEFAULTS['timeout'])
         tk.Entry(
             frame, textvariable=self.timeout_var, bg='#3e3e3e', fg='white', insertbackground='white', relief=tk.FLAT,
-        ).grid(row=3, column=1, sticky=tk.EW, padx=10, pady=5, ipady=3)
+        ).grid(row=4, column=1, sticky=tk.EW, padx=10, pady=5, ipady=3)
 
         # Source IP
         self.source_address_label = ttk.Label(frame, text=_('Source IP:'))
-        self.source_address_label.grid(row=4, column=0, sticky=tk.W, pady=5)
-        self.source_ip_var = tk.StringVar()
+        self.source_address_label.grid(row=5, column=0, sticky=tk.W, pady=5)
+        self.source_ip_var = tk.StringVar(value=NETWORK_DEFAULTS['source_ip'])
         tk.Entry(
             frame, textvariable=self.source_ip_var, bg='#3e3e3e', fg='white', insertbackground='white', relief=tk.FLAT,
-        ).grid(row=4, column=1, sticky=tk.EW, padx=10, pady=5, ipady=3)
+        ).grid(row=5, column=1, sticky=tk.EW, padx=10, pady=5, ipady=3)
 
         # Proxy
         self.proxy_label = ttk.Label(frame, text=_('Proxy URL:'))
-        self.proxy_label.grid(row=5, column=0, sticky=tk.W, pady=5)
-        self.proxy_override_var = tk.StringVar()
+        self.proxy_label.grid(row=6, column=0, sticky=tk.W, pady=5)
+        self.proxy_override_var = tk.StringVar(value=NETWORK_DEFAULTS['proxy_override'])
         tk.Entry(
             frame, textvariable=self.proxy_override_var, bg='#3e3e3e', fg='white',
             insertbackground='white', relief=tk.FLAT,
-        ).grid(row=5, column=1, sticky=tk.EW, padx=10, pady=5, ipady=3)
+        ).grid(row=6, column=1, sticky=tk.EW, padx=10, pady=5, ipady=3)
 
     def update_texts(self) -> None:
         """Update localized texts."""
         self.browser_cookies_label.config(text=_('Browser Cookies:'))
         self.user_agent_label.config(text=_('User Agent:'))
         self.limit_rate_label.config(text=_('Rate Limit (e.g. 5M):'))
+        self.priority_label.config(text=_('Bandwidth Priority:'))
         self.timeout_label.config(text=_('Socket Timeout (s):'))
         self.source_address_label.config(text=_('Source IP:'))
         self.proxy_label.config(text=_('Proxy URL:'))
@@ -90,6 +103,7 @@ class NetworkTab(ttk.Frame):
             'browser': self.browser_var.get(),
             'user_agent': self.user_agent_var.get(),
             'rate_limit': self.rate_limit_var.get(),
+            'bandwidth_priority': self.priority_var.get(),
             'timeout': self.timeout_var.get(),
             'source_ip': self.source_ip_var.get(),
             'proxy_override': self.proxy_override_var.get(),
@@ -0,0 +1,215 @@
+"""
+Tool detection cache for yt-dlp GUI.
+Detecting the JS runtime and FFmpeg spawns several processes. Results are saved
+next to the config file, keyed on PATH, the configured FFmpeg location and the
+modification time and size of every candidate executable, so they are only
+probed again when one of those changes.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import sysconfig
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+from .config import get_config_path
+from .logic import detect_js_runtime, get_ffmpeg_info
+
+TOOLCACHE_NAME = 'yt-dlp-gui-tools.json'
+
+# Executables probed by detect_js_runtime, in priority order
+JS_EXECUTABLES = ('deno', 'bun', 'node', 'qjs')
+FFMPEG_EXECUTABLES = ('ffmpeg', 'ffprobe')
+
+# FFmpeg locations remembered at once (the Settings entry is probed as it is typed)
+MAX_FFMPEG_ENTRIES = 8
+
+
+def get_toolcache_path() -> str:
+    """
+    Get the absolute path to the tool detection cache.
+
+    @return: Path in the same directory as the config file
+    """
+    return os.path.join(os.path.dirname(get_config_path()), TOOLCACHE_NAME)
+
+
+def _search_path() -> str:
+    # yt-dlp looks in Python's scripts directory before PATH
+    return os.pathsep.join(filter(None, [sysconfig.get_path('scripts'), os.environ.get('PATH', '')]))
+
+
+def _stat(path: Optional[str]) -> Optional[List[Any]]:
+    """Identify an executable by path, mtime and size; None if it does not exist."""
+    if not path:
+        return None
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return [os.path.abspath(path), st.st_mtime_ns, st.st_size]
+
+
+def js_fingerprint() -> Dict[str, Any]:
+    """
+    Describe everything the JS runtime detection depends on, without spawning a process.
+
+    @return: JSON-serializable key
+    """
+    search = _search_path()
+    return {'path': search, 'files': [_stat(shutil.which(name, path=search)) for name in JS_EXECUTABLES]}
+
+
+def ffmpeg_fingerprint(ffmpeg_path: str = '') -> Dict[str, Any]:
+    """
+    Describe everything the FFmpeg detection depends on, without spawning a process.
+
+    @param ffmpeg_path: Configured FFmpeg folder or executable ('' to search PATH)
+    @return: JSON-serializable key
+    """
+    ffmpeg_path = ffmpeg_path.strip()
+    if not ffmpeg_path:
+        search = os.environ.get('PATH', '')
+    elif os.path.isdir(ffmpeg_path):
+        search = ffmpeg_path
+    else:
+        search = os.path.dirname(ffmpeg_path)
+    files = [_stat(shutil.which(name, path=search)) for name in FFMPEG_EXECUTABLES]
+    if ffmpeg_path and not os.path.isdir(ffmpeg_path):
+        files.append(_stat(ffmpeg_path))
+    return {'path': search, 'ffmpeg_path': ffmpeg_path, 'files': files}
+
+
+class ToolCache:
+    """
+    Persistent cache of JS runtime and FFmpeg detection results.
+    Lookups compare the stored key with a fresh fingerprint (a few stat calls);
+    stale entries are probed again, the probes of one refresh running in parallel.
+    """
+
+    def __init__(self, path: Optional[str] = None) -> None:
+        """
+        Initialize the cache; the file is read on first use.
+
+        @param path: Cache file, defaults to get_toolcache_path()
+        """
+        self.path = path or get_toolcache_path()
+        self._lock = threading.Lock()
+        self._data: Optional[Dict[str, Any]] = None
+
+    def _entries(self) -> Dict[str, Any]:
+        """Return the cached data, reading the file the first time. Call with the lock held."""
+        if self._data is None:
+            self._data = {'js_runtime': None, 'ffmpeg': {}}
+            if os.path.exists(self.path):
+                try:
+                    with open(self.path, 'r', encoding='utf-8') as f:
+                        loaded = json.load(f)
+                    if isinstance(loaded, dict) and isinstance(loaded.get('ffmpeg'), dict):
+                        self._data.update(loaded)
+                except Exception as e:
+                    print(f'Error loading tool cache: {e}')
+        return self._data
+
+    def save(self) -> None:
+        """Write the cache to disk, replacing the file in one step."""
+        # Both probes of detect() save from their own threads; the lock keeps the writes apart
+        with self._lock:
+            data = json.dumps(self._entries(), indent=4, ensure_ascii=False)
+            temp = f'{self.path}.{os.getpid()}.tmp'
+            try:
+                os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+                with open(temp, 'w', encoding='utf-8') as f:
+                    f.write(data)
+                os.replace(temp, self.path)
+            except Exception as e:
+                print(f'Error saving tool cache: {e}')
+                if os.path.exists(temp):
+                    os.remove(temp)
+
+    def peek_js_runtime(self) -> Tuple[bool, Optional[str]]:
+        """
+        Get the last stored JS runtime without checking it is still valid.
+
+        @return: (whether a result is stored, runtime name or None)
+        """
+        with self._lock:
+            entry = self._entries()['js_runtime']
+        return (True, entry['value']) if entry else (False, None)
+
+    def peek_ffmpeg(self, ffmpeg_path: str = '') -> Optional[Dict[str, Any]]:
+        """
+        Get the last stored FFmpeg info for a location without checking it is still valid.
+
+        @param ffmpeg_path: Configured FFmpeg folder or executable
+        @return: Result of get_ffmpeg_info, or None if never detected
+        """
+        with self._lock:
+            entry = self._entries()['ffmpeg'].get(ffmpeg_path.strip())
+        return entry['value'] if entry else None
+
+    def js_runtime(self, refresh: bool = False) -> Optional[str]:
+        """
+        Get the JS runtime, probing again if an executable or PATH changed.
+
+        @param refresh: Probe even if the stored result is still valid
+        @return: Name of the detected runtime or None
+        """
+        key = js_fingerprint()
+        with self._lock:
+            entry = self._entries()['js_runtime']
+        if entry and entry['key'] == key and not refresh:
+            return entry['value']
+
+        runtime = detect_js_runtime()
+        with self._lock:
+            self._entries()['js_runtime'] = {'key': key, 'value': runtime}
+        self.save()
+        return runtime
+
+    def ffmpeg_info(self, ffmpeg_path: str = '', refresh: bool = False) -> Dict[str, Any]:
+        """
+        Get FFmpeg/FFprobe info, probing again if the location or an executable changed.
+
+        @param ffmpeg_path: Configured FFmpeg folder or executable ('' to search PATH)
+        @param refresh: Probe even if the stored result is still valid
+        @return: Result of get_ffmpeg_info
+        """
+        ffmpeg_path = ffmpeg_path.strip()
+        key = ffmpeg_fingerprint(ffmpeg_path)
+        with self._lock:
+            entry = self._entries()['ffmpeg'].get(ffmpeg_path)
+        if entry and entry['key'] == key and not refresh:
+            return entry['value']
+
+        info = get_ffmpeg_info(ffmpeg_path or None)
+        with self._lock:
+            entries = self._entries()['ffmpeg']
+            entries.pop(ffmpeg_path, None)
+            entries[ffmpeg_path] = {'key': key, 'value': info}
+            # Oldest locations first; keep only the most recent ones
+            for stale in list(entries)[:-MAX_FFMPEG_ENTRIES]:
+                del entries[stale]
+        self.save()
+        return info
+
+    def detect(self, ffmpeg_path: str = '', refresh: bool = False) -> Tuple[Optional[str], Dict[str, Any]]:
+        """
+        Revalidate the JS runtime and FFmpeg info together, probing both in parallel.
+
+        @param ffmpeg_path: Configured FFmpeg folder or executable
+        @param refresh: Probe even if the stored results are still valid
+        @return: (JS runtime name or None, FFmpeg info)
+        """
+        with ThreadPoolExecutor(max_workers=2, thread_name_prefix='tool-detect') as executor:
+            js_future = executor.submit(self.js_runtime, refresh)
+            ffmpeg_future = executor.submit(self.ffmpeg_info, ffmpeg_path, refresh)
+            return js_future.result(), ffmpeg_future.result()
+
+
+# Shared cache used by the main window and the Settings window
+tool_cache = ToolCache()
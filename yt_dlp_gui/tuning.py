@@ -0,0 +1,205 @@
+"""
+Adaptive download tuning for yt-dlp GUI.
+yt-dlp reads 'concurrent_fragment_downloads' and 'http_chunk_size' from its
+params when it starts each file. A tuner measures the throughput of every file
+from the progress hook and hill-climbs both values per host, between files of
+a job and across the jobs of a batch.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+from .logic import parse_rate
+
+DEFAULT_MAX_FRAGMENTS = 8
+DEFAULT_MAX_CHUNK_SIZE = 10 * 1024 * 1024
+MIN_CHUNK_SIZE = 1024 * 1024
+
+# Hard limits for the configurable bounds
+FRAGMENTS_LIMIT = 32
+
+# Relative throughput change treated as noise
+TOLERANCE = 0.1
+
+# Weight of a new speed report in a file's average
+SPEED_SMOOTHING = 0.3
+
+
+def level_ladder(low: int, high: int) -> List[int]:
+    """
+    Build the values a climber moves between: powers of two from low, capped by high.
+
+    @param low: Smallest value
+    @param high: Largest value
+    @return: Ascending list ending with high
+    """
+    levels = [low]
+    while levels[-1] * 2 < high:
+        levels.append(levels[-1] * 2)
+    if levels[-1] != high:
+        levels.append(high)
+    return levels
+
+
+class HillClimber:
+    """
+    Picks a value from a ladder by comparing the throughput measured at each step.
+    Moves up while that improves throughput, and back down when it makes it worse.
+    """
+
+    def __init__(self, levels: List[int]) -> None:
+        """
+        Initialize the climber at the lowest level.
+
+        @param levels: Ascending candidate values
+        """
+        self.levels = levels
+        self.index = 0
+        self.rates: Dict[int, float] = {}
+
+    @property
+    def value(self) -> int:
+        """Value to use for the next file."""
+        return self.levels[self.index]
+
+    def record(self, rate: float) -> None:
+        """
+        Record the throughput of a file downloaded with the current value and move.
+
+        @param rate: Bytes per second
+        """
+        previous = self.rates.get(self.index)
+        self.rates[self.index] = rate if previous is None else (previous + rate) / 2
+        current = self.rates[self.index]
+        lower = self.rates.get(self.index - 1)
+        upper = self.rates.get(self.index + 1)
+        if lower is not None and current < lower * (1 - TOLERANCE):
+            self.index -= 1
+        elif self.index + 1 < len(self.levels) and (upper is None or upper > current * (1 + TOLERANCE)):
+            self.index += 1
+
+
+class _HostState:
+    """Climbers of one host."""
+
+    def __init__(self, max_fragments: int, max_chunk_size: int) -> None:
+        self.fragments = HillClimber(level_ladder(1, max_fragments))
+        self.chunk_size = HillClimber(level_ladder(min(MIN_CHUNK_SIZE, max_chunk_size), max_chunk_size))
+
+
+class JobTuning:
+    """
+    Tuning of one job: starts its YoutubeDL with the host's current values,
+    measures every file it downloads and retunes the params for the next one.
+    """
+
+    def __init__(self, tuner: 'FragmentTuner', url: str, max_fragments: int, max_chunk_size: int) -> None:
+        """
+        Initialize the job's tuning.
+
+        @param tuner: Tuner holding the per-host state
+        @param url: Job URL
+        @param max_fragments: Upper bound for concurrent fragments
+        @param max_chunk_size: Upper bound for the HTTP chunk size in bytes
+        """
+        self.tuner = tuner
+        self.key = (urlparse(url).netloc, max_fragments, max_chunk_size)
+        self.params: Optional[Dict[str, Any]] = None
+        self._speeds: Dict[str, float] = {}
+        self._fragmented: Dict[str, bool] = {}
+
+    def apply(self, params: Dict[str, Any]) -> None:
+        """
+        Set the host's current values on the job's YoutubeDL params and keep them updated.
+
+        @param params: The params dict of the YoutubeDL running the job
+        """
+        self.params = params
+        with self.tuner._lock:
+            self._write(self.tuner._state(self.key))
+
+    def _write(self, state: _HostState) -> None:
+        """Copy the climbers' values to the params. Call with the tuner's lock held."""
+        if self.params is not None:
+            self.params['concurrent_fragment_downloads'] = state.fragments.value
+            self.params['http_chunk_size'] = state.chunk_size.value
+
+    def progress_hook(self, d: Dict[str, Any]) -> None:
+        """Hook called by yt-dlp to report progress."""
+        name = d.get('tmpfilename') or d.get('filename') or ''
+        if d.get('status') == 'downloading':
+            speed = d.get('speed')
+            if speed:
+                previous = self._speeds.get(name)
+                self._speeds[name] = speed if previous is None else previous + SPEED_SMOOTHING * (speed - previous)
+            if d.get('fragment_count') or d.get('fragment_index'):
+                self._fragmented[name] = True
+        elif d.get('status') == 'finished':
+            rate = self._speeds.pop(name, None) or _average_rate(d)
+            fragmented = self._fragmented.pop(name, False)
+            if not rate:
+                return
+            with self.tuner._lock:
+                state = self.tuner._state(self.key)
+                (state.fragments if fragmented else state.chunk_size).record(rate)
+                self._write(state)
+
+
+class FragmentTuner:
+    """
+    Per-host fragment concurrency and HTTP chunk size, learned from progress reports.
+    Thread-safe; jobs of several workers may feed the same host.
+    """
+
+    def __init__(self) -> None:
+        """Initialize a tuner with nothing learned."""
+        self._lock = threading.Lock()
+        self._hosts: Dict[Tuple[str, int, int], _HostState] = {}
+
+    def _state(self, key: Tuple[str, int, int]) -> _HostState:
+        """Get the state of a (host, max fragments, max chunk size) key. Call with the lock held."""
+        state = self._hosts.get(key)
+        if state is None:
+            state = self._hosts[key] = _HostState(key[1], key[2])
+        return state
+
+    def for_job(self, url: str, ui_data: Dict[str, Any]) -> JobTuning:
+        """
+        Create the tuning of a job, with the bounds from its settings.
+
+        @param url: Job URL
+        @param ui_data: UI data snapshot with 'max_fragments' and 'max_chunk_size'
+        @return: Tuning to apply to the job's YoutubeDL
+        """
+        return JobTuning(self, url, *tuning_bounds(ui_data))
+
+
+def tuning_bounds(ui_data: Dict[str, Any]) -> Tuple[int, int]:
+    """
+    Read the tuning bounds from the settings, clamped to sane values.
+
+    @param ui_data: UI data snapshot
+    @return: (max concurrent fragments, max HTTP chunk size in bytes)
+    """
+    try:
+        max_fragments = int(ui_data.get('max_fragments') or DEFAULT_MAX_FRAGMENTS)
+    except (TypeError, ValueError):
+        max_fragments = DEFAULT_MAX_FRAGMENTS
+    max_chunk_size = parse_rate(ui_data.get('max_chunk_size')) or DEFAULT_MAX_CHUNK_SIZE
+    return min(max(1, max_fragments), FRAGMENTS_LIMIT), max(1, max_chunk_size)
+
+
+def _average_rate(d: Dict[str, Any]) -> Optional[float]:
+    """Throughput of a finished file from its size and elapsed time."""
+    size = d.get('downloaded_bytes') or d.get('total_bytes')
+    elapsed = d.get('elapsed')
+    if size and elapsed:
+        return size / elapsed
+    return None
+
+
+# Tuner shared by the download workers of this process
+tuner = FragmentTuner()
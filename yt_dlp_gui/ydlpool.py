@@ -0,0 +1,257 @@
+"""
+Warm YoutubeDL instances for yt-dlp GUI.
+Creating a YoutubeDL loads extractor classes, reads the cookie jar and starts a
+new request director; on batches of short clips that setup dominates. Jobs
+borrow an instance built for the same options and hand it back afterwards, so
+the next job reuses its open HTTP connections and TLS sessions.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import os
+import threading
+from typing import TYPE_CHECKING, Any, Callable, Dict, Hashable, Iterator, List, Optional
+
+from .lazy import load_yt_dlp
+from .logic import JOB_FIELDS, bind_format_selector, build_ydl_opts, cookies_file, freeze_ui_data
+
+if TYPE_CHECKING:
+    import yt_dlp
+
+# Jobs an instance runs before it is closed and replaced
+MAX_JOBS_PER_INSTANCE = 50
+
+# Process memory above which returned instances are closed instead of kept
+MAX_RSS_BYTES = 1024 * 1024 * 1024
+
+# Idle instances kept at once (one per worker is the common case)
+MAX_IDLE = 8
+
+# Options that change from job to job and are read by yt-dlp at extraction time
+STAMPED_PARAMS = ('extractor_args', 'paths')
+
+# Instance attributes yt-dlp counts per run; reset so that %(autonumber)s and --max-downloads start over per job
+JOB_COUNTERS = ('_num_downloads', '_download_retcode')
+
+# The resume flags go into the key: they change how existing files are treated
+POOL_IGNORED_FIELDS = JOB_FIELDS - {'resume'}
+
+
+def current_rss() -> Optional[int]:
+    """
+    Get the resident memory of this process.
+
+    @return: Bytes, or None where /proc is not available
+    """
+    try:
+        with open('/proc/self/statm', 'r') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+
+
+class JobRelay:
+    """
+    Logger sink and progress hook of a pooled YoutubeDL.
+    The instance is built once with the relay; each job binds its own hooks to it.
+    """
+
+    def __init__(self) -> None:
+        """Initialize a relay with no job bound."""
+        self.hooks: Any = None
+        self.progress_hooks: List[Callable[[Dict[str, Any]], None]] = []
+
+    def bind(self, hooks: Any, progress_hooks: List[Callable[[Dict[str, Any]], None]]) -> None:
+        """
+        Forward output to a job.
+
+        @param hooks: Object with log() receiving the job's log lines
+        @param progress_hooks: Hooks receiving the job's progress reports
+        """
+        self.hooks = hooks
+        self.progress_hooks = list(progress_hooks)
+
+    def unbind(self) -> None:
+        """Drop the job's hooks; output until the next bind() is discarded."""
+        self.hooks = None
+        self.progress_hooks = []
+
+    def log(self, message: str) -> None:
+        """Forward a log line from MyLogger."""
+        if self.hooks is not None:
+            self.hooks.log(message)
+
+    def progress_hook(self, d: Dict[str, Any]) -> None:
+        """Forward a progress report from yt-dlp."""
+        for hook in self.progress_hooks:
+            hook(d)
+
+
+class PooledYdl:
+    """A YoutubeDL instance with its relay, pool key and job count."""
+
+    def __init__(self, ydl: 'yt_dlp.YoutubeDL', relay: JobRelay, key: Optional[Hashable], generation: int) -> None:
+        self.ydl = ydl
+        self.relay = relay
+        self.key = key
+        self.generation = generation
+        self.jobs = 0
+
+    def close(self) -> None:
+        """Save cookies and close the request director."""
+        try:
+            self.ydl.close()
+        except Exception as e:
+            print(f'Error closing YoutubeDL instance: {e}')
+
+
+class YdlPool:
+    """
+    Idle YoutubeDL instances keyed by their compiled options.
+    An instance is used by one job at a time. It is closed instead of returned
+    when its job failed, after max_jobs jobs, or when the process uses more
+    than max_rss bytes.
+    """
+
+    def __init__(
+        self,
+        max_jobs: int = MAX_JOBS_PER_INSTANCE,
+        max_rss: Optional[int] = MAX_RSS_BYTES,
+        max_idle: int = MAX_IDLE,
+    ) -> None:
+        """
+        Initialize an empty pool.
+
+        @param max_jobs: Jobs per instance before it is recycled
+        @param max_rss: Memory threshold in bytes, None to disable
+        @param max_idle: Idle instances kept at once
+        """
+        self.max_jobs = max(1, max_jobs)
+        self.max_rss = max_rss
+        self.max_idle = max(0, max_idle)
+        self.created = 0
+        self.reused = 0
+        self._lock = threading.Lock()
+        self._idle: List[PooledYdl] = []
+        self._generation = 0
+
+    @staticmethod
+    def pool_key(ui_data: Dict[str, Any]) -> Optional[Hashable]:
+        """
+        Get the key of the instances a job can use.
+
+        @param ui_data: UI data snapshot of the job
+        @return: Hashable key, or None if the options cannot be keyed (no pooling)
+        """
+        # Instances load the cookies file once, so whether it exists is part of the key
+        key = (
+            freeze_ui_data({k: v for k, v in ui_data.items() if k not in POOL_IGNORED_FIELDS}),
+            cookies_file(ui_data) is not None,
+        )
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    @contextlib.contextmanager
+    def borrow(
+        self,
+        ui_data: Dict[str, Any],
+        hooks: Any,
+        progress_hooks: List[Callable[[Dict[str, Any]], None]],
+    ) -> Iterator['yt_dlp.YoutubeDL']:
+        """
+        Lend a YoutubeDL configured for a job, creating one if none is idle.
+
+        @param ui_data: UI data snapshot of the job
+        @param hooks: Object with log() receiving the job's log lines
+        @param progress_hooks: Hooks receiving the job's progress reports
+        @return: Context manager yielding the instance
+        """
+        key = self.pool_key(ui_data)
+        entry = self._take(key)
+        if entry is None:
+            entry = self._create(ui_data, key)
+        else:
+            fresh = build_ydl_opts(ui_data, entry.relay)
+            for name in STAMPED_PARAMS:
+                if name in fresh:
+                    entry.ydl.params[name] = fresh[name]
+                else:
+                    entry.ydl.params.pop(name, None)
+            for name in JOB_COUNTERS:
+                setattr(entry.ydl, name, 0)
+
+        entry.relay.bind(hooks, progress_hooks)
+        healthy = False
+        try:
+            yield entry.ydl
+            healthy = True
+        finally:
+            entry.relay.unbind()
+            entry.jobs += 1
+            self._give_back(entry, healthy)
+
+    def _take(self, key: Optional[Hashable]) -> Optional[PooledYdl]:
+        """Remove and return the most recently used idle instance with the key."""
+        if key is None:
+            return None
+        with self._lock:
+            for i in range(len(self._idle) - 1, -1, -1):
+                if self._idle[i].key == key:
+                    self.reused += 1
+                    return self._idle.pop(i)
+        return None
+
+    def _create(self, ui_data: Dict[str, Any], key: Optional[Hashable]) -> PooledYdl:
+        """Build a new instance whose logger and hooks go through a relay."""
+        yt_dlp = load_yt_dlp()
+        relay = JobRelay()
+        ydl = yt_dlp.YoutubeDL(build_ydl_opts(ui_data, relay))
+        bind_format_selector(ydl)
+        with self._lock:
+            self.created += 1
+            generation = self._generation
+        return PooledYdl(ydl, relay, key, generation)
+
+    def _give_back(self, entry: PooledYdl, healthy: bool) -> None:
+        """Keep an instance for the next job, or close it if it should be recycled."""
+        to_close: List[PooledYdl] = []
+        rss = current_rss() if self.max_rss else None
+        over_memory = rss is not None and rss > self.max_rss
+        with self._lock:
+            keep = (
+                healthy and entry.key is not None and entry.jobs < self.max_jobs
+                and entry.generation == self._generation and not over_memory
+            )
+            if keep:
+                self._idle.append(entry)
+            else:
+                to_close.append(entry)
+            if over_memory:
+                # Let go of every idle instance, not only the one returned
+                to_close.extend(self._idle)
+                self._idle.clear()
+            while len(self._idle) > self.max_idle:
+                to_close.append(self._idle.pop(0))
+        for stale in to_close:
+            stale.close()
+
+    def idle_count(self) -> int:
+        """Number of instances waiting for a job."""
+        with self._lock:
+            return len(self._idle)
+
+    def close_all(self) -> None:
+        """Close idle instances; borrowed ones are closed when they are handed back."""
+        with self._lock:
+            idle, self._idle = self._idle, []
+            self._generation += 1
+        for entry in idle:
+            entry.close()
+
+
+# Pool shared by the download workers of this process
+ydl_pool = YdlPool()